@@ -0,0 +1,187 @@
+"""
+Pooled upstream clients and per-route metrics shared by the reverse proxies.
+
+Each backend gets one long-lived, pooled httpx client (keep-alive, optional
+HTTP/2) created by the app's lifespan, and response bodies are streamed back
+instead of being buffered.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+import httpx
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+logger = logging.getLogger(__name__)
+
+# Connection pool settings, per backend
+MAX_CONNECTIONS = int(os.getenv("PROXY_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("PROXY_MAX_KEEPALIVE_CONNECTIONS", "20"))
+KEEPALIVE_EXPIRY = float(os.getenv("PROXY_KEEPALIVE_EXPIRY", "30"))
+# HTTP/2 needs the h2 package (pip install 'httpx[http2]') and a TLS backend
+HTTP2 = os.getenv("PROXY_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# Number of recent requests per route used for latency percentiles
+LATENCY_WINDOW = 1024
+
+# Hop-by-hop headers that must not be forwarded
+HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+}
+
+
+class RouteMetrics:
+    """Request counters and a sliding window of upstream latencies for one route"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+
+    def snapshot(self):
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            if not latencies:
+                return None
+            return round(latencies[int(q * (len(latencies) - 1))] * 1000, 2)
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+        }
+
+
+def create_client(base_url):
+    """Create the pooled client for one backend"""
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+    try:
+        return httpx.AsyncClient(
+            base_url=base_url, timeout=30.0, limits=limits, http2=HTTP2
+        )
+    except ImportError:
+        logger.warning("HTTP/2 requested but h2 is not installed, using HTTP/1.1")
+        return httpx.AsyncClient(base_url=base_url, timeout=30.0, limits=limits)
+
+
+class ProxyPool:
+    """Pooled clients and metrics for a fixed set of route prefixes.
+
+    Pass ``lifespan`` to the FastAPI app so the clients are opened at startup
+    and closed at shutdown.
+    """
+
+    def __init__(self, routes):
+        self.routes = dict(routes)
+        self.clients = {}
+        self.metrics = {prefix: RouteMetrics() for prefix in self.routes}
+
+    @asynccontextmanager
+    async def lifespan(self, app):
+        for prefix, base_url in self.routes.items():
+            self.clients[prefix] = create_client(base_url)
+        try:
+            yield
+        finally:
+            for client in self.clients.values():
+                await client.aclose()
+            self.clients.clear()
+
+    def stats(self):
+        """Per-route p50/p99 upstream latency, request counts and pool limits.
+
+        Only the configured limits are reported: httpx does not expose the
+        number of open or idle connections in its public API.
+        """
+        pool = {
+            "max_connections": MAX_CONNECTIONS,
+            "max_keepalive_connections": MAX_KEEPALIVE_CONNECTIONS,
+        }
+        return {
+            "routes": {
+                prefix: {**self.metrics[prefix].snapshot(), **pool}
+                for prefix in self.routes
+                if prefix in self.clients
+            }
+        }
+
+    async def forward(self, route_key, request: Request, target_url):
+        """Send the request upstream and stream the response back.
+
+        Raises:
+            httpx.RequestError: If the backend could not be reached; the
+                error is counted for the route
+        """
+        client = self.clients[route_key]
+        metrics = self.metrics[route_key]
+        metrics.requests += 1
+        started = time.perf_counter()
+
+        try:
+            upstream_request = client.build_request(
+                method=request.method,
+                url=target_url,
+                headers={
+                    k: v
+                    for k, v in request.headers.items()
+                    if k.lower() not in HOP_BY_HOP_HEADERS | {"host", "content-length"}
+                },
+                content=await request.body(),
+            )
+            response = await client.send(upstream_request, stream=True)
+        except Exception:
+            metrics.errors += 1
+            raise
+
+        # Latency to response headers; the body is streamed afterwards
+        metrics.latencies.append(time.perf_counter() - started)
+        metrics.in_flight += 1
+
+        released = False
+
+        async def _release():
+            nonlocal released
+            if not released:
+                released = True
+                metrics.in_flight -= 1
+                await response.aclose()
+
+        async def _body():
+            try:
+                async for chunk in response.aiter_raw():
+                    yield chunk
+            finally:
+                await _release()
+
+        # Stream the body back as received; the connection goes back to the pool
+        # when the body is done or the client disconnects
+        return StreamingResponse(
+            _body(),
+            status_code=response.status_code,
+            headers={
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in HOP_BY_HOP_HEADERS
+            },
+            background=BackgroundTask(_release),
+        )
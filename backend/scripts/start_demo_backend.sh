@@ -11,6 +11,7 @@ PROJECT_ROOT="$(cd "$BACKEND_DIR/.." && pwd)"
 SSL_KEYFILE="${SSL_KEYFILE:-}"
 SSL_CERTFILE="${SSL_CERTFILE:-}"
 HOST="${HOST:-localhost}"
+COMBINED="${COMBINED:-false}"
 
 # Parse command line arguments
 while [[ $# -gt 0 ]]; do
@@ -27,14 +28,20 @@ while [[ $# -gt 0 ]]; do
             HOST="$2"
             shift 2
             ;;
+        --combined)
+            COMBINED="true"
+            shift
+            ;;
         --help|-h)
-            echo "Usage: $0 [--host HOSTNAME] [--ssl-keyfile PATH] [--ssl-certfile PATH]"
+            echo "Usage: $0 [--host HOSTNAME] [--ssl-keyfile PATH] [--ssl-certfile PATH] [--combined]"
             echo "  --host HOSTNAME       Hostname to bind to (default: localhost)"
             echo "  --ssl-keyfile PATH    Path to SSL private key file"
             echo "  --ssl-certfile PATH   Path to SSL certificate file"
+            echo "  --combined            Serve all APIs from a single process"
             echo ""
             echo "Environment variables:"
             echo "  HOST                  Hostname to bind to"
+            echo "  COMBINED              Set to 'true' to serve all APIs from a single process"
             echo "  SSL_KEYFILE           SSL private key file path"
             echo "  SSL_CERTFILE          SSL certificate file path"
             echo ""
@@ -80,24 +87,36 @@ echo "📊 Starting FastAPI servers..."
 # Change to servers directory
 cd "$BACKEND_DIR/servers"
 
-# K8s API Server (Port 8011)
-echo "🏗️  Starting Kubernetes API server on port 8011..."
-nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 k8s_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/k8s_server.log" 2>&1 &
+if [ "$COMBINED" = "true" ]; then
+    # All four APIs in one process, on the same ports; returns once they accept connections
+    echo "🧩 Starting all API servers in a single process..."
+    nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 run_all_servers.py --combined $SERVER_ARGS" > "$PROJECT_ROOT/logs/backend_servers.log" 2>&1 &
+    for PORT in 8011 8012 8013 8014; do
+        for _ in $(seq 1 100); do
+            (echo > "/dev/tcp/$HOST/$PORT") 2>/dev/null && break
+            sleep 0.1
+        done
+    done
+else
+    # K8s API Server (Port 8011)
+    echo "🏗️  Starting Kubernetes API server on port 8011..."
+    nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 k8s_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/k8s_server.log" 2>&1 &
 
-# Logs API Server (Port 8012)
-echo "📋 Starting Logs API server on port 8012..."
-nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 logs_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/logs_server.log" 2>&1 &
+    # Logs API Server (Port 8012)
+    echo "📋 Starting Logs API server on port 8012..."
+    nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 logs_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/logs_server.log" 2>&1 &
 
-# Metrics API Server (Port 8013)
-echo "📈 Starting Metrics API server on port 8013..."
-nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 metrics_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/metrics_server.log" 2>&1 &
+    # Metrics API Server (Port 8013)
+    echo "📈 Starting Metrics API server on port 8013..."
+    nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 metrics_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/metrics_server.log" 2>&1 &
 
-# Runbooks API Server (Port 8014)
-echo "📚 Starting Runbooks API server on port 8014..."
-nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 runbooks_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/runbooks_server.log" 2>&1 &
+    # Runbooks API Server (Port 8014)
+    echo "📚 Starting Runbooks API server on port 8014..."
+    nohup bash -c "export BACKEND_API_KEY='$BACKEND_API_KEY'; python3 runbooks_server.py $SERVER_ARGS" > "$PROJECT_ROOT/logs/runbooks_server.log" 2>&1 &
 
-# Wait a moment for servers to start
-sleep 2
+    # Wait a moment for servers to start
+    sleep 2
+fi
 
 # Determine protocol for display
 if [ -n "$SSL_KEYFILE" ] && [ -n "$SSL_CERTFILE" ]; then
@@ -5,8 +5,9 @@ set -e
 
 echo "🛑 Stopping SRE Agent Demo Backend..."
 
-# Find and kill all demo server processes (k8s, logs, metrics, runbooks servers)
-DEMO_PIDS=$(pgrep -f "_server\.py" || echo "")
+# Find and kill all demo server processes (k8s, logs, metrics, runbooks servers,
+# or the combined single-process host)
+DEMO_PIDS=$(pgrep -f "_server\.py|run_all_servers\.py" || echo "")
 
 if [ -z "$DEMO_PIDS" ]; then
     echo "ℹ️  No demo backend processes found"
@@ -32,7 +33,7 @@ done
 sleep 2
 
 # Force kill if still running
-REMAINING_PIDS=$(pgrep -f "_server\.py" || echo "")
+REMAINING_PIDS=$(pgrep -f "_server\.py|run_all_servers\.py" || echo "")
 if [ -n "$REMAINING_PIDS" ]; then
     echo "💀 Force killing remaining processes: $REMAINING_PIDS"
     for PID in $REMAINING_PIDS; do
@@ -0,0 +1,165 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+# Fraction of requests that get an audit record (0.0 - 1.0)
+DEFAULT_SAMPLE_RATE = float(os.getenv("BACKEND_AUDIT_SAMPLE_RATE", "0.1"))
+
+# Number of characters of the serialized payload kept in an audit record
+DEFAULT_DIGEST_CHARS = int(os.getenv("BACKEND_AUDIT_DIGEST_CHARS", "256"))
+
+# Log every request with its full, pretty-printed payload
+AUDIT_DEBUG = os.getenv("BACKEND_AUDIT_DEBUG", "false").lower() in ("1", "true", "yes")
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread.
+
+    The stock handler formats every record before enqueueing it, which would
+    serialize payloads on the request path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _AuditEvent:
+    """Audit record rendered as one JSON line when the listener formats it"""
+
+    def __init__(self, event: Dict[str, Any], payload: Any, max_chars: int):
+        self.event = event
+        self.payload = payload
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        if isinstance(self.payload, bytes):
+            # Already-serialized JSON body, e.g. a cached response
+            serialized = self.payload.decode("utf-8", errors="replace")
+        else:
+            serialized = json.dumps(self.payload, separators=(",", ":"), default=str)
+        digest = {
+            "sha256": hashlib.sha256(serialized.encode()).hexdigest()[:12],
+            "bytes": len(serialized),
+            "preview": serialized[: self.max_chars],
+        }
+        if len(serialized) > self.max_chars:
+            digest["truncated"] = True
+
+        event = dict(self.event)
+        event["params"] = {k: v for k, v in event["params"].items() if v is not None}
+        event["payload"] = digest
+        return json.dumps(event, default=str)
+
+
+class _FullPayload:
+    """Lazily pretty-printed response payload, only rendered in debug mode"""
+
+    def __init__(self, payload: Any):
+        self.payload = payload
+
+    def __str__(self) -> str:
+        payload = self.payload
+        if isinstance(payload, bytes):
+            payload = json.loads(payload)
+        return json.dumps(payload, indent=2, default=str)
+
+
+class AuditLogger:
+    """Sampled, structured request audit log written off the request path.
+
+    Records are pushed onto an in-memory queue and formatted and written by a
+    background ``QueueListener`` thread using the root logger's handlers, so a
+    request only pays for the sampling decision and one enqueue. Each record is
+    a single line with the endpoint, its non-empty parameters, the result count
+    and a truncated digest of the payload. Full pretty-printed payloads are only
+    logged when debug is enabled, in which case every request is recorded.
+
+    Payloads are formatted after the handler has returned, so they must not be
+    mutated once passed to ``record``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        digest_chars: int = DEFAULT_DIGEST_CHARS,
+        debug: bool = AUDIT_DEBUG,
+    ):
+        self.name = name
+        self.sample_rate = sample_rate
+        self.digest_chars = digest_chars
+        self.debug = debug
+
+        self.logger = logging.getLogger(f"{name}.audit")
+        self.logger.setLevel(logging.DEBUG if debug else logging.INFO)
+        self.logger.propagate = False
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.logger.addHandler(_DeferredQueueHandler(self._queue))
+        self._listener = QueueListener(
+            self._queue, *logging.getLogger().handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        self._running = True
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Flush queued records and stop the background writer"""
+        if self._running:
+            self._running = False
+            self._listener.stop()
+
+    def _sampled(self) -> bool:
+        return self.debug or random.random() < self.sample_rate
+
+    def record(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        payload: Any,
+        results: Optional[int] = None,
+        cache: Optional[str] = None,
+    ) -> None:
+        """Audit one request, subject to sampling.
+
+        Args:
+            endpoint: Name of the handler that served the request
+            params: Request parameters; None values are omitted
+            payload: Response payload, treated as read-only; bytes are taken
+                as an already-serialized JSON body
+            results: Number of items returned, if applicable
+            cache: How a response cache answered the request ("hit" or
+                "not_modified"), if it did
+        """
+        if not self._sampled():
+            return
+
+        event = {
+            "event": "request",
+            "service": self.name,
+            "endpoint": endpoint,
+            "params": params,
+        }
+        if results is not None:
+            event["results"] = results
+        if cache is not None:
+            event["cache"] = cache
+
+        self.logger.info(
+            "audit %s",
+            _AuditEvent(event, payload, self.digest_chars),
+            stacklevel=2,
+        )
+        if self.debug:
+            self.logger.debug(
+                "audit %s full payload: %s",
+                endpoint,
+                _FullPayload(payload),
+                stacklevel=2,
+            )
@@ -0,0 +1,201 @@
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import HTTPException
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+# Minimum number of seconds between two stat() calls for the same file
+DEFAULT_POLL_INTERVAL = float(os.getenv("BACKEND_DATA_POLL_INTERVAL", "1.0"))
+
+
+def _load_json(file_path: Path) -> Any:
+    """Default loader: parse a JSON file"""
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+@dataclass
+class _DatasetEntry:
+    """In-memory state for one data file"""
+
+    loader: Callable[[Path], Any]
+    value: Any = None
+    signature: Optional[Tuple] = None
+    last_checked: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class DatasetCache:
+    """Parsed, in-memory copies of the files under a server's DATA_PATH.
+
+    Each file is parsed once and kept in memory. A cheap stat poll (at most one
+    ``os.stat`` per file every ``poll_interval`` seconds) detects mtime, inode or
+    size changes and triggers a reload, so edited or atomically replaced data
+    files are picked up without restarting the server. A registered directory is
+    passed to its loader as a whole and reloaded when any file inside it changes.
+
+    Values returned by ``get`` are shared between requests and must be treated
+    as read-only by handlers.
+    """
+
+    def __init__(self, base_path: Path, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        self.base_path = Path(base_path)
+        self.poll_interval = poll_interval
+        self._entries: Dict[str, _DatasetEntry] = {}
+        self._registry_lock = threading.Lock()
+
+    def register(
+        self, name: str, loader: Callable[[Path], Any] = _load_json
+    ) -> "DatasetCache":
+        """Register a data file or directory with an optional custom loader"""
+        with self._registry_lock:
+            if name not in self._entries:
+                self._entries[name] = _DatasetEntry(loader=loader)
+            else:
+                self._entries[name].loader = loader
+        return self
+
+    def preload(self, names: Optional[Iterable[str]] = None) -> None:
+        """Load registered files eagerly at startup, logging missing ones"""
+        for name in list(names) if names is not None else list(self._entries):
+            try:
+                self.get(name)
+            except FileNotFoundError:
+                logging.warning(f"Dataset {self.base_path / name} not found at startup")
+            except Exception as e:
+                logging.error(f"Error preloading dataset {name}: {str(e)}")
+
+    def _entry(self, name: str) -> _DatasetEntry:
+        entry = self._entries.get(name)
+        if entry is None:
+            self.register(name)
+            entry = self._entries[name]
+        return entry
+
+    @staticmethod
+    def _signature(file_path: Path) -> Tuple:
+        st = os.stat(file_path)
+        if not file_path.is_dir():
+            return (st.st_mtime_ns, st.st_ino, st.st_size)
+
+        # Directories change whenever any file directly inside them does
+        signature = []
+        for child in sorted(file_path.iterdir()):
+            child_st = os.stat(child)
+            signature.append(
+                (child.name, child_st.st_mtime_ns, child_st.st_ino, child_st.st_size)
+            )
+        return tuple(signature)
+
+    def exists(self, name: str) -> bool:
+        """Check whether a data file is present on disk"""
+        return (self.base_path / name).exists()
+
+    def get(self, name: str) -> Any:
+        """Return the parsed contents of a data file, reloading it if it changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        entry = self._entry(name)
+        file_path = self.base_path / name
+        now = time.monotonic()
+
+        # Fast path: loaded recently enough that no stat is needed
+        if (
+            entry.signature is not None
+            and now - entry.last_checked < self.poll_interval
+        ):
+            entry.hits += 1
+            return entry.value
+
+        with entry.lock:
+            if (
+                entry.signature is not None
+                and now - entry.last_checked < self.poll_interval
+            ):
+                entry.hits += 1
+                return entry.value
+
+            signature = self._signature(file_path)
+            entry.last_checked = now
+
+            if signature == entry.signature:
+                entry.hits += 1
+                return entry.value
+
+            value = entry.loader(file_path)
+            if entry.signature is None:
+                entry.misses += 1
+                logging.info(f"Loaded dataset {file_path}")
+            else:
+                entry.reloads += 1
+                logging.info(f"Reloaded dataset {file_path} after file change")
+            entry.value = value
+            entry.signature = signature
+            return value
+
+    def version(self, name: str) -> Optional[Tuple]:
+        """Return the change-detection signature of the loaded copy"""
+        entry = self._entries.get(name)
+        return entry.signature if entry else None
+
+    def provide(self, name: str, optional: bool = False) -> Callable[[], Any]:
+        """Build a FastAPI dependency that injects the parsed contents of a file.
+
+        Args:
+            name: File name relative to the cache's base path
+            optional: Inject None instead of failing when the file is missing
+
+        Returns:
+            Callable suitable for ``Depends(...)``
+        """
+
+        def _dependency() -> Any:
+            try:
+                return self.get(name)
+            except FileNotFoundError:
+                if optional:
+                    return None
+                logging.error(f"Dataset {name} not found")
+                raise HTTPException(status_code=500, detail=f"Dataset {name} not found")
+            except Exception as e:
+                logging.error(f"Error loading dataset {name}: {str(e)}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        _dependency.__name__ = f"dataset_{name.replace('.', '_')}"
+        return _dependency
+
+    def __call__(self) -> "DatasetCache":
+        """Allow the cache itself to be injected with ``Depends(cache)``.
+
+        Useful for handlers that pick the data file at request time.
+        """
+        return self
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-file hit/miss/reload counters"""
+        return {
+            name: {
+                "loaded": entry.signature is not None,
+                "hits": entry.hits,
+                "misses": entry.misses,
+                "reloads": entry.reloads,
+            }
+            for name, entry in self._entries.items()
+        }
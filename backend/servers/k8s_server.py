@@ -1,10 +1,10 @@
-import json
 import logging
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional
 
+from dataset_cache import DatasetCache
 from fastapi import (
     Depends,
     FastAPI,
@@ -12,7 +12,9 @@ from fastapi import (
     HTTPException,
     Query,
 )
+from pagination import Page, paginate
 from pydantic import BaseModel, Field
+from response_cache import ResponseCache, ResponseCacheMiddleware
 from retrieve_api_key import retrieve_api_key
 
 # Configure logging with basicConfig
@@ -27,6 +29,32 @@ app = FastAPI(title="Kubernetes Analysis API", version="1.0.0")
 # Base path for fake data
 DATA_PATH = Path(__file__).parent.parent / "data" / "k8s_data"
 
+# Parsed data files, loaded once and reloaded only when they change on disk
+DATASETS = DatasetCache(DATA_PATH)
+for _name in (
+    "pods.json",
+    "deployments.json",
+    "events.json",
+    "resource_usage.json",
+    "nodes.json",
+):
+    DATASETS.register(_name)
+DATASETS.preload()
+
+# Serialized responses of the data-backed routes with ETags, invalidated when
+# any of the files a route reads changes
+RESPONSES = ResponseCache(
+    DATASETS,
+    {
+        "/pods/status": ("pods.json",),
+        "/deployments/status": ("deployments.json",),
+        "/events": ("events.json",),
+        "/resource_usage": ("resource_usage.json",),
+        "/nodes/status": ("nodes.json",),
+    },
+)
+app.add_middleware(ResponseCacheMiddleware, cache=RESPONSES)
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -145,6 +173,9 @@ class PodStatusResponse(BaseModel):
     """Response model for pod status endpoint"""
 
     pods: List[Pod] = Field(..., description="List of pods")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
 
 
 class DeploymentStatus(str, Enum):
@@ -176,6 +207,9 @@ class DeploymentStatusResponse(BaseModel):
     """Response model for deployment status endpoint"""
 
     deployments: List[Deployment] = Field(..., description="List of deployments")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
 
 
 class EventType(str, Enum):
@@ -212,6 +246,9 @@ class EventsResponse(BaseModel):
     """Response model for events endpoint"""
 
     events: List[Event] = Field(..., description="List of events")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page, null on the last page"
+    )
 
 
 class ErrorResponse(BaseModel):
@@ -228,6 +265,8 @@ async def get_pod_status(
     ),
     pod_name: Optional[str] = Query(None, description="Specific pod name to retrieve"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    data: dict = Depends(DATASETS.provide("pods.json")),
 ):
     """
     Retrieve pod information from the Kubernetes cluster.
@@ -240,6 +279,8 @@ async def get_pod_status(
         namespace: Optional Kubernetes namespace to filter pods
         pod_name: Optional specific pod name to retrieve
         api_key: Required API key for authentication
+        page: Pagination and field projection (limit, cursor, fields)
+        data: Parsed pods.json contents injected from the dataset cache
 
     Returns:
         PodStatusResponse: List of pods with detailed status information
@@ -249,9 +290,6 @@ async def get_pod_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "pods.json", "r") as f:
-            data = json.load(f)
-
         pods = data.get("pods", [])
 
         # Filter by namespace if provided
@@ -262,7 +300,8 @@ async def get_pod_status(
         if pod_name:
             pods = [p for p in pods if p.get("name") == pod_name]
 
-        return PodStatusResponse(pods=pods)
+        pods, next_cursor = page.slice(pods)
+        return page.respond("pods", pods, next_cursor, model=PodStatusResponse)
     except Exception as e:
         logging.error(f"Error retrieving pod status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -275,6 +314,8 @@ async def get_deployment_status(
         None, description="Specific deployment name"
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    data: dict = Depends(DATASETS.provide("deployments.json")),
 ):
     """
     Check deployment health and replica status.
@@ -287,6 +328,8 @@ async def get_deployment_status(
         namespace: Optional Kubernetes namespace to filter deployments
         deployment_name: Optional specific deployment name to retrieve
         api_key: Required API key for authentication
+        page: Pagination and field projection (limit, cursor, fields)
+        data: Parsed deployments.json contents injected from the dataset cache
 
     Returns:
         DeploymentStatusResponse: List of deployments with health status
@@ -296,9 +339,6 @@ async def get_deployment_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "deployments.json", "r") as f:
-            data = json.load(f)
-
         deployments = data.get("deployments", [])
 
         if namespace:
@@ -307,7 +347,10 @@ async def get_deployment_status(
         if deployment_name:
             deployments = [d for d in deployments if d.get("name") == deployment_name]
 
-        return DeploymentStatusResponse(deployments=deployments)
+        deployments, next_cursor = page.slice(deployments)
+        return page.respond(
+            "deployments", deployments, next_cursor, model=DeploymentStatusResponse
+        )
     except Exception as e:
         logging.error(f"Error retrieving deployment status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -324,6 +367,8 @@ async def get_cluster_events(
         description="Filter by event severity",
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    data: dict = Depends(DATASETS.provide("events.json")),
 ):
     """
     Fetch recent Kubernetes cluster events.
@@ -336,6 +381,8 @@ async def get_cluster_events(
         since: Optional ISO 8601 timestamp to filter events from
         severity: Optional severity filter (Warning, Error, Normal)
         api_key: Required API key for authentication
+        page: Pagination and field projection (limit, cursor, fields)
+        data: Parsed events.json contents injected from the dataset cache
 
     Returns:
         EventsResponse: List of cluster events with timestamps and details
@@ -345,9 +392,6 @@ async def get_cluster_events(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "events.json", "r") as f:
-            data = json.load(f)
-
         events = data.get("events", [])
 
         if severity:
@@ -356,7 +400,8 @@ async def get_cluster_events(
         # Filter by since timestamp
         events = _filter_events_by_time(events, since)
 
-        return EventsResponse(events=events)
+        events, next_cursor = page.slice(events)
+        return page.respond("events", events, next_cursor, model=EventsResponse)
     except Exception as e:
         logging.error(f"Error retrieving cluster events: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -369,6 +414,7 @@ async def get_resource_usage(
         None, enum=["cpu", "memory", "pods"], description="Type of resource to monitor"
     ),
     api_key: str = Depends(_validate_api_key),
+    data: dict = Depends(DATASETS.provide("resource_usage.json")),
 ):
     """
     Monitor cluster resource consumption and utilization.
@@ -381,6 +427,7 @@ async def get_resource_usage(
         namespace: Optional namespace to filter resource usage data
         resource_type: Optional resource type filter (cpu, memory, pods)
         api_key: Required API key for authentication
+        data: Parsed resource_usage.json contents injected from the dataset cache
 
     Returns:
         Dict: Resource usage metrics with cluster and namespace breakdowns
@@ -390,9 +437,6 @@ async def get_resource_usage(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
         resource_usage = data.get("resource_usage", {})
 
         # Filter by namespace if provided
@@ -414,6 +458,8 @@ async def get_resource_usage(
 async def get_node_status(
     node_name: Optional[str] = Query(None, description="Specific node name"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    data: dict = Depends(DATASETS.provide("nodes.json")),
 ):
     """
     Check cluster node health and status.
@@ -425,6 +471,8 @@ async def get_node_status(
     Args:
         node_name: Optional specific node name to retrieve
         api_key: Required API key for authentication
+        page: Pagination and field projection (limit, cursor, fields)
+        data: Parsed nodes.json contents injected from the dataset cache
 
     Returns:
         Dict: Node status information with health and resource metrics
@@ -434,20 +482,37 @@ async def get_node_status(
         HTTPException: 500 if data retrieval fails
     """
     try:
-        with open(DATA_PATH / "nodes.json", "r") as f:
-            data = json.load(f)
-
         nodes = data.get("nodes", [])
 
         if node_name:
             nodes = [n for n in nodes if n.get("name") == node_name]
 
-        return {"nodes": nodes}
+        nodes, next_cursor = page.slice(nodes)
+        return page.respond("nodes", nodes, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving node status: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/cache/stats")
+async def get_cache_stats(api_key: str = Depends(_validate_api_key)):
+    """
+    Report dataset and response cache statistics for this server.
+
+    Args:
+        api_key: Required API key for authentication
+
+    Returns:
+        Dict: Per-file hit, miss and reload counters, and per-route response
+            cache hits, misses, 304s and hit ratios
+    """
+    return {
+        "service": "k8s-api",
+        "datasets": DATASETS.stats(),
+        "responses": RESPONSES.stats(),
+    }
+
+
 @app.get("/")
 async def health_check(api_key: str = Depends(_validate_api_key)):
     """
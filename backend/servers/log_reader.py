@@ -0,0 +1,336 @@
+import asyncio
+import mmap
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from metrics_index import to_epoch
+
+# Distance in bytes between two entries of the sparse timestamp index
+INDEX_STRIDE_BYTES = 64 * 1024
+
+# Size of the blocks read backwards from EOF when tailing
+TAIL_BLOCK_BYTES = 64 * 1024
+
+
+def parse_log_line(line: str) -> Dict[str, str]:
+    """Parse a ``<timestamp> [LEVEL] <service> <message>`` log line"""
+    parts = line.strip().split(" ", 3)
+    if len(parts) < 4:
+        return {"message": line.strip()}
+
+    timestamp, level_part, service, message = parts
+
+    # Extract log level from [LEVEL] format
+    level = "INFO"
+    if "[" in level_part and "]" in level_part:
+        level = level_part.strip("[]")
+
+    return {
+        "timestamp": timestamp,
+        "level": level,
+        "service": service,
+        "message": message,
+    }
+
+
+def _line_epoch(raw_line: bytes) -> Optional[float]:
+    """Return the epoch of a raw log line's leading timestamp, if any"""
+    token = raw_line.split(b" ", 1)[0]
+    try:
+        return to_epoch(token.decode("ascii"))
+    except UnicodeDecodeError:
+        return None
+
+
+class _SparseTimeIndex:
+    """Timestamp to byte-offset checkpoints, one roughly every stride bytes"""
+
+    def __init__(self, inode: int):
+        self.inode = inode
+        self.epochs = array("d")
+        self.offsets = array("q")
+        # File size covered by the index and where to continue scanning from
+        self.size = 0
+        self.resume = 0
+        self.at_line_start = True
+
+
+class LogFile:
+    """Streaming reader for a plain-text, append-only application log.
+
+    The file is memory-mapped rather than read into memory. Pattern searches
+    run a case-insensitive byte-level scan over the mapping and only decode the
+    lines that match, stopping as soon as ``limit`` results are found. Time
+    range filters are pushed down to a sparse timestamp to byte-offset index so
+    only the relevant region of the file is scanned. The index is built lazily
+    and extended incrementally as the file grows; it assumes lines are appended
+    in chronological order.
+
+    Recent entries are read backwards from EOF in fixed-size blocks, and newly
+    appended lines can be followed as they are written.
+    """
+
+    def __init__(self, path: Path, stride: int = INDEX_STRIDE_BYTES):
+        self.path = Path(path)
+        self.stride = stride
+        self._index: Optional[_SparseTimeIndex] = None
+        self._index_lock = threading.Lock()
+
+    def _update_index(self, mm: mmap.mmap, size: int, inode: int) -> _SparseTimeIndex:
+        """Build or extend the sparse index up to the current end of file"""
+        with self._index_lock:
+            index = self._index
+            # Rotated or truncated files are indexed from scratch
+            if index is None or index.inode != inode or size < index.size:
+                index = _SparseTimeIndex(inode)
+
+            pos = index.resume
+            at_line_start = index.at_line_start
+            while pos < size:
+                if not at_line_start:
+                    newline = mm.find(b"\n", pos)
+                    if newline == -1:
+                        break
+                    pos = newline + 1
+                    at_line_start = True
+                    continue
+
+                line_end = mm.find(b"\n", pos)
+                if line_end == -1:
+                    break  # Partially written last line, index it on a later call
+
+                epoch = _line_epoch(mm[pos:line_end])
+                if epoch is not None:
+                    # Keep the checkpoints monotonic so bisect stays valid
+                    if index.epochs and epoch < index.epochs[-1]:
+                        epoch = index.epochs[-1]
+                    index.epochs.append(epoch)
+                    index.offsets.append(pos)
+
+                # Skip ahead one stride, then resume at the next line start
+                pos = line_end + self.stride
+                at_line_start = False
+
+            index.resume = pos
+            index.at_line_start = at_line_start
+            index.size = size
+            self._index = index
+            return index
+
+    def _time_bounds(
+        self,
+        mm: mmap.mmap,
+        size: int,
+        inode: int,
+        start: Optional[float],
+        end: Optional[float],
+    ) -> Tuple[int, int]:
+        """Narrow [start, end] to a byte range that starts and ends on line boundaries"""
+        if start is None and end is None:
+            return 0, size
+
+        index = self._update_index(mm, size, inode)
+        lo, hi = 0, size
+        if start is not None:
+            i = bisect_left(index.epochs, start) - 1
+            if i >= 0:
+                lo = index.offsets[i]
+        if end is not None:
+            i = bisect_right(index.epochs, end)
+            if i < len(index.offsets):
+                hi = index.offsets[i]
+        return lo, hi
+
+    @staticmethod
+    def _matching_lines(
+        mm: mmap.mmap, lo: int, hi: int, pattern: Optional[str]
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield (start, end) byte offsets of lines in [lo, hi) containing pattern"""
+        if pattern and pattern.isascii():
+            # Byte-level prefilter: only lines with a hit are ever decoded
+            regex = re.compile(re.escape(pattern.encode("ascii")), re.IGNORECASE)
+            pos = lo
+            while pos < hi:
+                match = regex.search(mm, pos, hi)
+                if not match:
+                    return
+                line_start = mm.rfind(b"\n", 0, match.start()) + 1
+                line_end = mm.find(b"\n", match.end())
+                if line_end == -1:
+                    line_end = len(mm)
+                yield line_start, line_end
+                pos = line_end + 1
+            return
+
+        needle = pattern.lower() if pattern else None
+        pos = lo
+        while pos < hi:
+            line_end = mm.find(b"\n", pos, hi)
+            if line_end == -1:
+                line_end = hi
+            if (
+                needle is None
+                or needle in mm[pos:line_end].decode("utf-8", errors="replace").lower()
+            ):
+                yield pos, line_end
+            pos = line_end + 1
+
+    def search(
+        self,
+        pattern: Optional[str] = None,
+        log_level: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, str]]:
+        """Return up to ``limit`` parsed log lines matching all filters, oldest first.
+
+        Args:
+            pattern: Case-insensitive substring to search for
+            log_level: Only return lines with this level
+            start: Inclusive lower time bound in epoch seconds
+            end: Inclusive upper time bound in epoch seconds
+            limit: Maximum number of results
+
+        When ``start`` or ``end`` is given, lines whose timestamp cannot be
+        parsed are skipped: the time index narrows the scan to a byte range, so
+        such lines could only be returned when they happen to sit inside it.
+
+        Raises:
+            FileNotFoundError: If the log file does not exist
+        """
+        results: List[Dict[str, str]] = []
+
+        with open(self.path, "rb") as f:
+            st = os.fstat(f.fileno())
+            if st.st_size == 0:
+                return results
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                lo, hi = self._time_bounds(mm, size, st.st_ino, start, end)
+
+                for line_start, line_end in self._matching_lines(mm, lo, hi, pattern):
+                    raw_line = mm[line_start:line_end]
+                    entry = parse_log_line(raw_line.decode("utf-8", errors="replace"))
+                    if log_level and entry.get("level") != log_level:
+                        continue
+
+                    if start is not None or end is not None:
+                        epoch = to_epoch(entry.get("timestamp", ""))
+                        if epoch is None:
+                            continue  # Can't be placed in the time range
+                        if start is not None and epoch < start:
+                            continue
+                        if end is not None and epoch > end:
+                            continue
+
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+
+        return results
+
+    @staticmethod
+    def _parse_for_service(raw_line: bytes, service: Optional[str]) -> Optional[dict]:
+        """Parse a raw line, returning None if it is blank or filtered out"""
+        if not raw_line.strip():
+            return None
+        # Cheap byte check before decoding; the parsed field is checked below
+        if service and service.encode() not in raw_line:
+            return None
+        entry = parse_log_line(raw_line.decode("utf-8", errors="replace"))
+        if service and service not in entry.get("service", ""):
+            return None
+        return entry
+
+    def tail(
+        self,
+        limit: int = 100,
+        service: Optional[str] = None,
+        block_size: int = TAIL_BLOCK_BYTES,
+    ) -> List[Dict[str, str]]:
+        """Return the last ``limit`` entries, most recent first.
+
+        Reads fixed-size blocks backwards from EOF and stops as soon as enough
+        entries are collected, so the cost depends on ``limit`` rather than on
+        the size of the file.
+
+        Args:
+            limit: Maximum number of entries to return
+            service: Only return entries whose service contains this value
+            block_size: Number of bytes read per backwards step
+
+        Raises:
+            FileNotFoundError: If the log file does not exist
+        """
+        results: List[Dict[str, str]] = []
+
+        with open(self.path, "rb") as f:
+            pos = os.fstat(f.fileno()).st_size
+            remainder = b""
+
+            while pos > 0 and len(results) < limit:
+                read_size = min(block_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                lines = (f.read(read_size) + remainder).split(b"\n")
+
+                # The first piece may be the tail of a line that starts earlier
+                remainder = lines.pop(0) if pos > 0 else b""
+
+                for raw_line in reversed(lines):
+                    entry = self._parse_for_service(raw_line, service)
+                    if entry is None:
+                        continue
+                    results.append(entry)
+                    if len(results) >= limit:
+                        break
+
+        return results
+
+    async def follow(
+        self, service: Optional[str] = None, poll_interval: float = 1.0
+    ) -> AsyncIterator[Dict[str, str]]:
+        """Yield entries appended to the file from now on.
+
+        Polls the file size every ``poll_interval`` seconds and starts over from
+        the beginning of the file if it is rotated or truncated.
+        """
+        try:
+            st = os.stat(self.path)
+            inode, offset = st.st_ino, st.st_size
+        except FileNotFoundError:
+            inode, offset = None, 0
+        pending = b""
+
+        while True:
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                await asyncio.sleep(poll_interval)
+                continue
+
+            if st.st_ino != inode or st.st_size < offset:
+                inode, offset, pending = st.st_ino, 0, b""
+
+            if st.st_size > offset:
+                with open(self.path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(st.st_size - offset)
+                offset += len(data)
+
+                lines = (pending + data).split(b"\n")
+                # Keep a partially written last line for the next poll
+                pending = lines.pop()
+                for raw_line in lines:
+                    entry = self._parse_for_service(raw_line, service)
+                    if entry is not None:
+                        yield entry
+
+            await asyncio.sleep(poll_interval)
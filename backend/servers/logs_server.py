@@ -1,9 +1,11 @@
+import asyncio
 import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from dataset_cache import DatasetCache
 from fastapi import (
     Depends,
     FastAPI,
@@ -11,7 +13,11 @@ from fastapi import (
     HTTPException,
     Query,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from log_reader import LogFile
+from metrics_index import query_bound
+from pagination import Page, paginate
+from response_cache import ResponseCache, ResponseCacheMiddleware
 from retrieve_api_key import retrieve_api_key
 
 # Configure logging with basicConfig
@@ -25,6 +31,27 @@ app = FastAPI(title="Application Logs API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "logs_data"
 
+# Parsed data files, loaded once and reloaded only when they change on disk
+DATASETS = DatasetCache(DATA_PATH)
+for _name in ("error.log", "log_patterns.json", "log_counts.json"):
+    DATASETS.register(_name)
+DATASETS.preload()
+
+# Serialized responses of the data-backed routes with ETags, invalidated when
+# any of the files a route reads changes
+RESPONSES = ResponseCache(
+    DATASETS,
+    {
+        "/logs/errors": ("error.log",),
+        "/logs/patterns": ("log_patterns.json",),
+        "/logs/count": ("log_counts.json",),
+    },
+)
+app.add_middleware(ResponseCacheMiddleware, cache=RESPONSES)
+
+# Plain-text application log, searched and tailed without loading it into memory
+APPLICATION_LOG = LogFile(DATA_PATH / "application.log")
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -95,55 +122,6 @@ def _filter_by_time(
     return filtered_logs
 
 
-def _parse_log_file(file_path: Path, pattern: Optional[str] = None):
-    """Parse log file and filter by pattern"""
-    logs = []
-
-    if file_path.suffix == ".json":
-        with open(file_path, "r") as f:
-            data = json.load(f)
-            # Handle both array and object with array
-            if isinstance(data, list):
-                logs = data
-            elif isinstance(data, dict):
-                # Get the first array value in the dict
-                for key, value in data.items():
-                    if isinstance(value, list):
-                        logs = value
-                        break
-    else:
-        # Parse text log files
-        with open(file_path, "r") as f:
-            for line in f:
-                if pattern and pattern.lower() not in line.lower():
-                    continue
-                # Parse log line to extract timestamp, level, and message
-                parts = line.strip().split(" ", 3)
-                if len(parts) >= 4:
-                    timestamp = parts[0]
-                    level_part = parts[1]
-                    service = parts[2]
-                    message = parts[3] if len(parts) > 3 else ""
-
-                    # Extract log level from [LEVEL] format
-                    level = "INFO"
-                    if "[" in level_part and "]" in level_part:
-                        level = level_part.strip("[]")
-
-                    logs.append(
-                        {
-                            "timestamp": timestamp,
-                            "level": level,
-                            "service": service,
-                            "message": message,
-                        }
-                    )
-                else:
-                    logs.append({"message": line.strip()})
-
-    return logs
-
-
 @app.get("/logs/search")
 async def search_logs(
     pattern: str = Query(..., description="Search pattern or keyword"),
@@ -153,21 +131,25 @@ async def search_logs(
         None, enum=["ERROR", "WARN", "INFO", "DEBUG"], description="Filter by log level"
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(default_limit=100)),
 ):
     """Search logs by pattern/timeframe"""
     try:
-        application_logs = _parse_log_file(DATA_PATH / "application.log", pattern)
-
-        # Filter by log level if provided
-        if log_level:
-            application_logs = [
-                log for log in application_logs if log.get("level") == log_level
-            ]
-
-        # Filter by time range
-        application_logs = _filter_by_time(application_logs, start_time, end_time)
+        start = query_bound(start_time)
+        end = query_bound(end_time)
+
+        # Streams over the file and stops once this page (plus one) is matched
+        application_logs = await asyncio.to_thread(
+            APPLICATION_LOG.search,
+            pattern=pattern,
+            log_level=log_level,
+            start=start,
+            end=end,
+            limit=page.window,
+        )
 
-        return {"logs": application_logs[:100]}  # Limit results
+        application_logs, next_cursor = page.slice(application_logs)
+        return page.respond("logs", application_logs, next_cursor)
     except Exception as e:
         logging.error(f"Error searching logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -178,12 +160,11 @@ async def get_error_logs(
     since: Optional[str] = Query(None, description="Get errors since this timestamp"),
     service: Optional[str] = Query(None, description="Filter by service name"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    error_logs: list = Depends(DATASETS.provide("error.log")),
 ):
     """Retrieve error-specific entries"""
     try:
-        with open(DATA_PATH / "error.log", "r") as f:
-            error_logs = json.load(f)
-
         if service:
             error_logs = [log for log in error_logs if log.get("service") == service]
 
@@ -191,7 +172,8 @@ async def get_error_logs(
         if since:
             error_logs = _filter_by_time(error_logs, start_time=since)
 
-        return {"errors": error_logs}
+        error_logs, next_cursor = page.slice(error_logs)
+        return page.respond("errors", error_logs, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving error logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -208,23 +190,23 @@ async def analyze_log_patterns(
         5, ge=1, description="Minimum occurrences to be considered a pattern"
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    data: Optional[dict] = Depends(
+        DATASETS.provide("log_patterns.json", optional=True)
+    ),
 ):
     """Identify recurring issues"""
     try:
-        # Read patterns from actual data file
-        patterns_file = DATA_PATH / "log_patterns.json"
-        if not patterns_file.exists():
-            return {"patterns": []}
-
-        with open(patterns_file, "r") as f:
-            data = json.load(f)
+        if data is None:
+            return page.respond("patterns", [], None)
 
         patterns = data.get("patterns", [])
 
         # Filter by min_occurrences
         patterns = [p for p in patterns if p["count"] >= min_occurrences]
 
-        return {"patterns": patterns}
+        patterns, next_cursor = page.slice(patterns)
+        return page.respond("patterns", patterns, next_cursor)
     except Exception as e:
         logging.error(f"Error analyzing log patterns: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -232,29 +214,42 @@ async def analyze_log_patterns(
 
 @app.get("/logs/recent")
 async def get_recent_logs(
-    limit: int = Query(
-        100, ge=1, le=1000, description="Number of recent logs to return"
-    ),
     service: Optional[str] = Query(None, description="Filter by service name"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(default_limit=100)),
 ):
     """Fetch latest log entries"""
     try:
-        all_logs = _parse_log_file(DATA_PATH / "application.log")
-
-        if service:
-            all_logs = [log for log in all_logs if service in log.get("service", "")]
-
-        # Return the most recent logs (last N entries)
-        recent_logs = all_logs[-limit:] if len(all_logs) > limit else all_logs
-        recent_logs.reverse()  # Most recent first
+        # Reads backwards from EOF, most recent first
+        recent_logs = await asyncio.to_thread(
+            APPLICATION_LOG.tail, limit=page.window, service=service
+        )
 
-        return {"logs": recent_logs}
+        recent_logs, next_cursor = page.slice(recent_logs)
+        return page.respond("logs", recent_logs, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving recent logs: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/logs/recent/stream")
+async def stream_recent_logs(
+    service: Optional[str] = Query(None, description="Filter by service name"),
+    api_key: str = Depends(_validate_api_key),
+):
+    """Follow newly appended log entries as Server-Sent Events"""
+
+    async def _events():
+        async for entry in APPLICATION_LOG.follow(service=service):
+            yield f"data: {json.dumps(entry)}\n\n"
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/logs/count")
 async def count_log_events(
     event_type: str = Query(..., description="Type of event to count"),
@@ -267,17 +262,13 @@ async def count_log_events(
         description="Group results by this field",
     ),
     api_key: str = Depends(_validate_api_key),
+    data: Optional[dict] = Depends(DATASETS.provide("log_counts.json", optional=True)),
 ):
     """Count occurrences of specific events"""
     try:
-        # Read counts from actual data file
-        counts_file = DATA_PATH / "log_counts.json"
-        if not counts_file.exists():
+        if data is None:
             return {"total_count": 0, "counts": []}
 
-        with open(counts_file, "r") as f:
-            data = json.load(f)
-
         if event_type.lower() == "error":
             error_data = data.get("error_counts", {})
             total_count = error_data.get("total_count", 0)
@@ -299,6 +290,16 @@ async def count_log_events(
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/cache/stats")
+async def get_cache_stats(api_key: str = Depends(_validate_api_key)):
+    """Report dataset cache and response cache counters"""
+    return {
+        "service": "logs-api",
+        "datasets": DATASETS.stats(),
+        "responses": RESPONSES.stats(),
+    }
+
+
 @app.get("/")
 async def health_check(api_key: str = Depends(_validate_api_key)):
     """Health check endpoint"""
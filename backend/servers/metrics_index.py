@@ -0,0 +1,151 @@
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+
+def to_epoch(timestamp_str: str) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to epoch seconds, assuming UTC when naive"""
+    try:
+        if timestamp_str.endswith("Z"):
+            timestamp_str = timestamp_str[:-1] + "+00:00"
+        dt = datetime.fromisoformat(timestamp_str)
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def query_bound(timestamp_str: Optional[str]) -> Optional[float]:
+    """Convert an optional query bound to epoch seconds, like ``to_epoch`` does records.
+
+    Unparseable bounds fall back to the current time.
+    """
+    if not timestamp_str:
+        return None
+    epoch = to_epoch(timestamp_str)
+    if epoch is None:
+        return datetime.now(timezone.utc).timestamp()
+    return epoch
+
+
+class _TimeColumn:
+    """Time-sorted epoch column over a subset of records"""
+
+    def __init__(
+        self, positions: List[int], epochs: Dict[int, float], unparsed: Set[int]
+    ):
+        # File-order record positions, used when no time range is requested
+        self.file_order = array("l", positions)
+        # Records with unparseable timestamps, treated as the current time
+        self.unparsed = array("l", (p for p in positions if p in unparsed))
+
+        timed = [p for p in positions if p in epochs]
+        timed.sort(key=epochs.__getitem__)  # stable: ties keep file order
+        self.positions = array("l", timed)
+        self.epochs = array("d", (epochs[p] for p in timed))
+
+    def range(self, start: Optional[float], end: Optional[float]) -> List[int]:
+        """Return record positions with start <= epoch <= end, in file order"""
+        lo = bisect_left(self.epochs, start) if start is not None else 0
+        hi = bisect_right(self.epochs, end) if end is not None else len(self.epochs)
+        matched = self.positions[lo:hi]
+        if self.unparsed:
+            now = datetime.now(timezone.utc).timestamp()
+            if (start is None or start <= now) and (end is None or now <= end):
+                matched += self.unparsed
+        return sorted(matched)
+
+
+class MetricsIndex:
+    """Columnar, time-sorted index over a list of metric records.
+
+    Timestamps are parsed once when the index is built and stored as epoch
+    seconds in ``array('d')`` columns, with one sub-index per service. Time
+    range and service filters are then answered with ``bisect`` slices instead
+    of parsing and scanning every record per request. Results are returned in
+    the original file order.
+
+    Records with an unparseable timestamp count as the current time, so they
+    only match ranges that include the moment of the query. Records without a
+    timestamp only match queries with no time range.
+    """
+
+    def __init__(
+        self,
+        records: List[dict],
+        timestamp_field: str = "timestamp",
+        service_field: str = "service",
+    ):
+        self.records = records
+
+        epochs: Dict[int, float] = {}
+        unparsed: Set[int] = set()
+        by_service: Dict[str, List[int]] = {}
+
+        for position, record in enumerate(records):
+            timestamp = record.get(timestamp_field)
+            if timestamp:
+                epoch = to_epoch(timestamp)
+                if epoch is None:
+                    unparsed.add(position)
+                else:
+                    epochs[position] = epoch
+            by_service.setdefault(record.get(service_field), []).append(position)
+
+        self._all = _TimeColumn(list(range(len(records))), epochs, unparsed)
+        self._by_service = {
+            service: _TimeColumn(positions, epochs, unparsed)
+            for service, positions in by_service.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def services(self) -> List[str]:
+        """Return the service names present in the index"""
+        return [s for s in self._by_service if s is not None]
+
+    def query(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        service: Optional[str] = None,
+    ) -> List[dict]:
+        """Return records matching an optional epoch range and service.
+
+        Args:
+            start: Inclusive lower bound in epoch seconds
+            end: Inclusive upper bound in epoch seconds
+            service: Only return records for this service
+
+        Returns:
+            Matching records in file order
+        """
+        if service:
+            column = self._by_service.get(service)
+            if column is None:
+                return []
+        else:
+            column = self._all
+
+        if start is None and end is None:
+            if not service:
+                return self.records
+            return [self.records[p] for p in column.file_order]
+
+        return [self.records[p] for p in column.range(start, end)]
+
+
+def index_loader(records_key: str) -> Callable[[Path], MetricsIndex]:
+    """Build a DatasetCache loader that indexes the list stored under records_key"""
+
+    def _load(file_path: Path) -> MetricsIndex:
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return MetricsIndex(data.get(records_key, []))
+
+    return _load
@@ -1,9 +1,8 @@
-import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from dataset_cache import DatasetCache
 from fastapi import (
     Depends,
     FastAPI,
@@ -12,6 +11,9 @@ from fastapi import (
     Query,
 )
 from fastapi.responses import JSONResponse
+from metrics_index import MetricsIndex, index_loader, query_bound
+from pagination import Page, paginate
+from response_cache import ResponseCache, ResponseCacheMiddleware
 from retrieve_api_key import retrieve_api_key
 
 # Configure logging with basicConfig
@@ -25,6 +27,38 @@ app = FastAPI(title="Application Metrics API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "metrics_data"
 
+# Parsed data files, loaded once and reloaded only when they change on disk.
+# Time series files are held as time-sorted columnar indexes.
+DATASETS = DatasetCache(DATA_PATH)
+for _name, _records_key in (
+    ("response_times.json", "metrics"),
+    ("throughput.json", "metrics"),
+    ("resource_usage.json", "metrics"),
+    ("error_rates.json", "error_rates"),
+    ("availability.json", "availability_metrics"),
+):
+    DATASETS.register(_name, loader=index_loader(_records_key))
+DATASETS.register("trends.json")
+DATASETS.preload()
+
+# Serialized responses of the data-backed routes with ETags, invalidated when
+# any of the files a route reads changes
+RESPONSES = ResponseCache(
+    DATASETS,
+    {
+        "/metrics/performance": (
+            "response_times.json",
+            "throughput.json",
+            "resource_usage.json",
+        ),
+        "/metrics/errors": ("error_rates.json",),
+        "/metrics/resources": ("resource_usage.json",),
+        "/metrics/availability": ("availability.json",),
+        "/metrics/trends": ("trends.json",),
+    },
+)
+app.add_middleware(ResponseCacheMiddleware, cache=RESPONSES)
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -48,53 +82,6 @@ def _validate_api_key(x_api_key: str = Header(None, alias="X-API-Key")):
     return x_api_key
 
 
-def _parse_timestamp(timestamp_str: str) -> datetime:
-    """Parse ISO timestamp string to datetime object"""
-    try:
-        # Handle both with and without timezone
-        if timestamp_str.endswith("Z"):
-            return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        elif "+" in timestamp_str or timestamp_str.endswith("0"):
-            return datetime.fromisoformat(timestamp_str)
-        else:
-            return datetime.fromisoformat(timestamp_str + "+00:00")
-    except:
-        # Fallback: assume current time if parsing fails
-        return datetime.now(timezone.utc)
-
-
-def _filter_metrics_by_time(
-    metrics: list, start_time: Optional[str] = None, end_time: Optional[str] = None
-) -> list:
-    """Filter metrics by time range"""
-    if not start_time and not end_time:
-        return metrics
-
-    filtered_metrics = []
-    start_dt = _parse_timestamp(start_time) if start_time else None
-    end_dt = _parse_timestamp(end_time) if end_time else None
-
-    for metric in metrics:
-        metric_timestamp = metric.get("timestamp")
-        if not metric_timestamp:
-            continue
-
-        try:
-            metric_dt = _parse_timestamp(metric_timestamp)
-
-            if start_dt and metric_dt < start_dt:
-                continue
-            if end_dt and metric_dt > end_dt:
-                continue
-
-            filtered_metrics.append(metric)
-        except:
-            # Include metrics with unparseable timestamps
-            filtered_metrics.append(metric)
-
-    return filtered_metrics
-
-
 @app.get("/metrics/performance")
 async def get_performance_metrics(
     metric_type: Optional[str] = Query(
@@ -106,57 +93,44 @@ async def get_performance_metrics(
     end_time: Optional[str] = Query(None, description="End time for metrics"),
     service: Optional[str] = Query(None, description="Filter by service name"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    datasets: DatasetCache = Depends(DATASETS),
 ):
     """Retrieve performance data"""
     try:
-        metrics = []
-
         if metric_type == "response_time":
-            with open(DATA_PATH / "response_times.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
+            index = datasets.get("response_times.json")
         elif metric_type == "throughput":
-            with open(DATA_PATH / "throughput.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-        elif metric_type in ["cpu_usage", "memory_usage"]:
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                raw_metrics = data.get("metrics", [])
-                # Transform resource metrics to match expected format
-                metrics = []
-                for m in raw_metrics:
-                    if metric_type == "cpu_usage":
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["cpu_usage_percent"],
-                                "unit": "percent",
-                            }
-                        )
-                    else:  # memory_usage
-                        metrics.append(
-                            {
-                                "timestamp": m["timestamp"],
-                                "service": m["service"],
-                                "value": m["memory_usage_mb"],
-                                "unit": "MB",
-                            }
-                        )
+            index = datasets.get("throughput.json")
         else:
-            # Return combined metrics for demo
-            with open(DATA_PATH / "resource_usage.json", "r") as f:
-                data = json.load(f)
-                metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
-
-        # Filter by time range
-        metrics = _filter_metrics_by_time(metrics, start_time, end_time)
+            # cpu_usage, memory_usage and the combined demo view
+            index = datasets.get("resource_usage.json")
+
+        # Service and time range filters are answered from the sorted index
+        metrics = index.query(
+            start=query_bound(start_time),
+            end=query_bound(end_time),
+            service=service,
+        )
+        metrics, next_cursor = page.slice(metrics)
+
+        if metric_type in ["cpu_usage", "memory_usage"]:
+            # Transform resource metrics to match expected format
+            if metric_type == "cpu_usage":
+                value_field, unit = "cpu_usage_percent", "percent"
+            else:
+                value_field, unit = "memory_usage_mb", "MB"
+            metrics = [
+                {
+                    "timestamp": m["timestamp"],
+                    "service": m["service"],
+                    "value": m[value_field],
+                    "unit": unit,
+                }
+                for m in metrics
+            ]
 
-        return {"metrics": metrics}
+        return page.respond("metrics", metrics, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving performance metrics: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -169,20 +143,16 @@ async def get_error_rates(
     ),
     service: Optional[str] = Query(None, description="Filter by service name"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    index: MetricsIndex = Depends(DATASETS.provide("error_rates.json")),
 ):
     """Fetch error rate statistics"""
     try:
-        with open(DATA_PATH / "error_rates.json", "r") as f:
-            data = json.load(f)
-
-        error_rates = data.get("error_rates", [])
-
-        if service:
-            error_rates = [e for e in error_rates if e.get("service") == service]
+        error_rates, next_cursor = page.slice(index.query(service=service))
 
         # TODO: In real implementation, would filter by time window
 
-        return {"error_rates": error_rates}
+        return page.respond("error_rates", error_rates, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving error rates: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -200,16 +170,12 @@ async def get_resource_metrics(
         "24h", enum=["1h", "6h", "24h", "7d"], description="Time window for metrics"
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    index: MetricsIndex = Depends(DATASETS.provide("resource_usage.json")),
 ):
     """Monitor resource utilization"""
     try:
-        with open(DATA_PATH / "resource_usage.json", "r") as f:
-            data = json.load(f)
-
-        metrics = data.get("metrics", [])
-
-        if service:
-            metrics = [m for m in metrics if m.get("service") == service]
+        metrics, next_cursor = page.slice(index.query(service=service))
 
         # Filter by resource type if specified
         if resource_type:
@@ -230,7 +196,7 @@ async def get_resource_metrics(
                 filtered_metrics.append(filtered)
             metrics = filtered_metrics
 
-        return {"metrics": metrics}
+        return page.respond("metrics", metrics, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving resource metrics: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -245,22 +211,16 @@ async def get_availability_metrics(
         description="Time window for availability calculation",
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate()),
+    index: MetricsIndex = Depends(DATASETS.provide("availability.json")),
 ):
     """Check service availability"""
     try:
-        with open(DATA_PATH / "availability.json", "r") as f:
-            data = json.load(f)
-
-        availability_metrics = data.get("availability_metrics", [])
-
-        if service:
-            availability_metrics = [
-                a for a in availability_metrics if a.get("service") == service
-            ]
+        availability_metrics, next_cursor = page.slice(index.query(service=service))
 
         # TODO: In real implementation, would calculate based on time window
 
-        return {"availability_metrics": availability_metrics}
+        return page.respond("availability_metrics", availability_metrics, next_cursor)
     except Exception as e:
         logging.error(f"Error retrieving availability metrics: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -279,12 +239,11 @@ async def analyze_trends(
         95, ge=0, le=100, description="Percentile threshold for anomaly detection"
     ),
     api_key: str = Depends(_validate_api_key),
+    data: Optional[dict] = Depends(DATASETS.provide("trends.json", optional=True)),
 ):
     """Identify metric trends and anomalies"""
     try:
-        # Read trends from actual data file
-        trends_file = DATA_PATH / "trends.json"
-        if not trends_file.exists():
+        if data is None:
             return {
                 "trend": "no_data",
                 "average_value": 0,
@@ -292,9 +251,6 @@ async def analyze_trends(
                 "anomalies": [],
             }
 
-        with open(trends_file, "r") as f:
-            data = json.load(f)
-
         # Determine which trend data to use based on metric name
         if "response" in metric_name.lower():
             trend_data = data.get("response_time_trends", {})
@@ -324,6 +280,16 @@ async def analyze_trends(
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/cache/stats")
+async def get_cache_stats(api_key: str = Depends(_validate_api_key)):
+    """Report dataset cache and response cache counters"""
+    return {
+        "service": "metrics-api",
+        "datasets": DATASETS.stats(),
+        "responses": RESPONSES.stats(),
+    }
+
+
 @app.get("/")
 async def health_check(api_key: str = Depends(_validate_api_key)):
     """Health check endpoint"""
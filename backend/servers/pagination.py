@@ -0,0 +1,169 @@
+import base64
+import binascii
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Query parameters that may change between pages of the same listing
+_PAGE_PARAMS = ("limit", "cursor", "fields")
+
+
+def _query_fingerprint(request: Request) -> str:
+    """Hash the filter parameters of a request, ignoring their order"""
+    items = sorted(
+        (k, v) for k, v in request.query_params.multi_items() if k not in _PAGE_PARAMS
+    )
+    return hashlib.sha256(json.dumps(items).encode()).hexdigest()[:12]
+
+
+def _encode_cursor(offset: int, fingerprint: str) -> str:
+    raw = json.dumps({"o": offset, "q": fingerprint}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, fingerprint: str) -> int:
+    """Return the offset stored in a cursor issued for the same query
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or belongs to another query
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        offset = int(state["o"])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if offset < 0 or state.get("q") != fingerprint:
+        raise HTTPException(
+            status_code=400, detail="Cursor does not match the query parameters"
+        )
+    return offset
+
+
+def _project(record: Any, fields: List[List[str]]) -> Any:
+    """Keep only the requested (possibly dotted) fields of a record"""
+    if not isinstance(record, dict):
+        return record
+    projected: Dict[str, Any] = {}
+    for path in fields:
+        source, target = record, projected
+        for i, part in enumerate(path):
+            if not isinstance(source, dict) or part not in source:
+                break
+            if i == len(path) - 1:
+                target[part] = source[part]
+            else:
+                source = source[part]
+                target = target.setdefault(part, {})
+    return projected
+
+
+class Page:
+    """Pagination and field projection requested for a list endpoint.
+
+    ``limit`` caps the number of items returned, ``cursor`` is the opaque
+    ``next_cursor`` from the previous page, and ``fields`` is a comma-separated
+    list of (optionally dotted) item fields to return. Cursors are bound to the
+    endpoint's filter parameters and rejected if those change between pages.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[int],
+        offset: int,
+        fields: Optional[List[List[str]]],
+        fingerprint: str,
+    ):
+        self.limit = limit
+        self.offset = offset
+        self.fields = fields
+        self.fingerprint = fingerprint
+
+    @property
+    def window(self) -> Optional[int]:
+        """Number of leading results needed to fill this page and detect a next one"""
+        if self.limit is None:
+            return None
+        return self.offset + self.limit + 1
+
+    def slice(self, records: Sequence) -> Tuple[List, Optional[str]]:
+        """Return this page of records and the cursor of the next page, if any"""
+        end = len(records) if self.limit is None else self.offset + self.limit
+        items = list(records[self.offset : end])
+        next_cursor = None
+        if end < len(records):
+            next_cursor = _encode_cursor(end, self.fingerprint)
+        return items, next_cursor
+
+    def respond(
+        self,
+        key: str,
+        items: List,
+        next_cursor: Optional[str],
+        model: Optional[Type[BaseModel]] = None,
+        **extra: Any,
+    ) -> Any:
+        """Build the response envelope, projecting items to the requested fields.
+
+        Args:
+            key: Response key holding the list of items
+            items: Items of this page
+            next_cursor: Cursor returned by ``slice``
+            model: Response model to validate the page with, if the route has one
+            extra: Additional top-level response fields
+
+        Returns:
+            The model instance or a dict, or a JSONResponse when a projected page
+            would no longer satisfy the route's response model
+        """
+        if model is not None:
+            response = model(**{key: items}, next_cursor=next_cursor, **extra)
+            if not self.fields:
+                return response
+            body = response.model_dump(mode="json")
+            body[key] = [_project(item, self.fields) for item in body[key]]
+            return JSONResponse(content=body)
+
+        if self.fields:
+            items = [_project(item, self.fields) for item in items]
+        return {key: items, **extra, "next_cursor": next_cursor}
+
+
+def paginate(
+    default_limit: Optional[int] = None, max_limit: int = 1000
+) -> Callable[..., Page]:
+    """Build a FastAPI dependency parsing ``limit``, ``cursor`` and ``fields``
+
+    Args:
+        default_limit: Page size when no limit is given, None for all results
+        max_limit: Largest accepted page size
+    """
+
+    def _dependency(
+        request: Request,
+        limit: Optional[int] = Query(
+            default_limit,
+            ge=1,
+            le=max_limit,
+            description="Maximum number of items to return",
+        ),
+        cursor: Optional[str] = Query(
+            None, description="Opaque next_cursor value from the previous page"
+        ),
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated item fields to return, e.g. name,status,resource_usage.cpu",
+        ),
+    ) -> Page:
+        fingerprint = _query_fingerprint(request)
+        offset = _decode_cursor(cursor, fingerprint) if cursor else 0
+        field_paths = None
+        if fields:
+            field_paths = [f.strip().split(".") for f in fields.split(",") if f.strip()]
+        return Page(limit, offset, field_paths or None, fingerprint)
+
+    return _dependency
@@ -0,0 +1,277 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from audit_log import AuditLogger
+from dataset_cache import DatasetCache
+from starlette.routing import Match
+
+# Maximum number of cached responses per server
+DEFAULT_MAX_ENTRIES = int(os.getenv("BACKEND_RESPONSE_CACHE_SIZE", "1024"))
+
+# Cache-Control max-age for cached routes; 0 makes clients revalidate every time
+DEFAULT_MAX_AGE = int(os.getenv("BACKEND_RESPONSE_CACHE_MAX_AGE", "0"))
+
+
+@dataclass
+class _CachedResponse:
+    """A serialized 200 response and the dataset versions it was built from"""
+
+    version: Tuple
+    etag: bytes
+    body: bytes
+    headers: List[Tuple[bytes, bytes]]
+
+
+@dataclass
+class _RouteStats:
+    hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+
+
+def _etag_matches(if_none_match: bytes, etag: bytes) -> bool:
+    """Check an If-None-Match header value against a strong ETag"""
+    for candidate in if_none_match.split(b","):
+        candidate = candidate.strip()
+        if candidate == b"*" or candidate.removeprefix(b"W/") == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Serialized GET responses keyed on route, normalized query and API key.
+
+    Each cached route declares the data files it is built from. An entry is
+    only reused while every one of those files has the same DatasetCache
+    signature as when it was stored, so edited data files invalidate it
+    immediately. Entries carry a strong ETag (hash of the body), and requests
+    whose ``If-None-Match`` matches get a 304 straight from the cache.
+
+    The caller's API key is part of the cache key, so a request is only served
+    from the cache if the same key already received that response.
+
+    Routes are matched on the exact path, or on a prefix for keys ending in
+    ``/`` (for path parameters).
+    """
+
+    def __init__(
+        self,
+        datasets: DatasetCache,
+        routes: Mapping[str, Sequence[str]],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: int = DEFAULT_MAX_AGE,
+    ):
+        self.datasets = datasets
+        self.routes = {path: tuple(names) for path, names in routes.items()}
+        self._prefixes = [path for path in self.routes if path.endswith("/")]
+        self.max_entries = max_entries
+        self.cache_control = f"private, max-age={max_age}, must-revalidate".encode()
+
+        self._entries: "OrderedDict[Tuple, _CachedResponse]" = OrderedDict()
+        self._stats: Dict[str, _RouteStats] = {
+            path: _RouteStats() for path in self.routes
+        }
+        self._lock = threading.Lock()
+
+    def route_for(self, path: str) -> Optional[str]:
+        """Return the cached route a request path belongs to, if any"""
+        if path in self.routes:
+            return path
+        for prefix in self._prefixes:
+            if path.startswith(prefix):
+                return prefix
+        return None
+
+    def version(self, route: str) -> Tuple:
+        """Return the current signatures of the files a route is built from"""
+        signatures = []
+        for name in self.routes[route]:
+            try:
+                # get() re-checks the file at most once per poll interval
+                self.datasets.get(name)
+            except FileNotFoundError:
+                pass
+            signatures.append(self.datasets.version(name))
+        return tuple(signatures)
+
+    @staticmethod
+    def key(path: str, query_string: bytes, api_key: bytes) -> Tuple:
+        """Build a cache key that ignores query parameter order"""
+        query = urlencode(
+            sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+        )
+        return (path, query, hashlib.sha256(api_key).hexdigest())
+
+    def lookup(
+        self, route: str, key: Tuple, version: Tuple
+    ) -> Optional[_CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.version != version:
+                self._stats[route].misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats[route].hits += 1
+            return entry
+
+    def store(
+        self,
+        key: Tuple,
+        version: Tuple,
+        body: bytes,
+        headers: List[Tuple[bytes, bytes]],
+    ) -> _CachedResponse:
+        etag = b'"' + hashlib.sha256(body).hexdigest()[:32].encode() + b'"'
+        headers = [
+            (name, value)
+            for name, value in headers
+            if name.lower() not in (b"etag", b"cache-control", b"vary")
+        ]
+        headers += [
+            (b"etag", etag),
+            (b"cache-control", self.cache_control),
+            (b"vary", b"X-API-Key"),
+        ]
+        entry = _CachedResponse(version, etag, body, headers)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def record_not_modified(self, route: str) -> None:
+        with self._lock:
+            self._stats[route].not_modified += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-route hit/miss counters and hit ratios"""
+        with self._lock:
+            routes = {}
+            for path, s in self._stats.items():
+                total = s.hits + s.misses
+                routes[path] = {
+                    "hits": s.hits,
+                    "misses": s.misses,
+                    "not_modified": s.not_modified,
+                    "hit_ratio": round(s.hits / total, 4) if total else None,
+                }
+            return {"entries": len(self._entries), "routes": routes}
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving cacheable GET routes from a ResponseCache.
+
+    Requests answered from the cache (200 or 304) never reach the route
+    handlers, so when an ``audit`` logger is given the middleware records them
+    itself, under the name of the route that would have served them.
+    """
+
+    def __init__(self, app, cache: ResponseCache, audit: Optional[AuditLogger] = None):
+        self.app = app
+        self.cache = cache
+        self.audit = audit
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        route = self.cache.route_for(scope["path"])
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        key = self.cache.key(
+            scope["path"],
+            scope.get("query_string", b""),
+            headers.get(b"x-api-key", b""),
+        )
+        try:
+            version = self.cache.version(route)
+        except Exception:
+            # Let the handler report data errors as usual
+            await self.app(scope, receive, send)
+            return
+
+        entry = self.cache.lookup(route, key, version)
+        hit = entry is not None
+        if entry is None:
+            entry = await self._fill(scope, receive, send, key, version)
+            if entry is None:
+                return
+
+        if_none_match = headers.get(b"if-none-match")
+        if if_none_match and _etag_matches(if_none_match, entry.etag):
+            self.cache.record_not_modified(route)
+            if hit:
+                self._audit_hit(scope, entry, "not_modified")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 304,
+                    "headers": [
+                        (name, value)
+                        for name, value in entry.headers
+                        if name in (b"etag", b"cache-control", b"vary")
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        if hit:
+            self._audit_hit(scope, entry, "hit")
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": entry.headers}
+        )
+        await send({"type": "http.response.body", "body": entry.body})
+
+    def _audit_hit(self, scope, entry: _CachedResponse, cache: str) -> None:
+        """Audit a request answered from the cache as its handler would have"""
+        if self.audit is None:
+            return
+
+        endpoint, params = scope["path"], {}
+        app = scope.get("app")
+        for app_route in getattr(getattr(app, "router", None), "routes", ()):
+            match, child_scope = app_route.matches(scope)
+            if match == Match.FULL:
+                endpoint = app_route.name
+                params = dict(child_scope.get("path_params", {}))
+                break
+        params.update(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+
+        self.audit.record(endpoint, params, entry.body, cache=cache)
+
+    async def _fill(
+        self, scope, receive, send, key, version
+    ) -> Optional[_CachedResponse]:
+        """Run the handler, caching its response if it is a 200.
+
+        Returns the new entry, or None if the response was sent uncached.
+        """
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def _capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, _capture)
+
+        body = b"".join(chunks)
+        if start.get("status") != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return None
+
+        return self.cache.store(key, version, body, list(start.get("headers", [])))
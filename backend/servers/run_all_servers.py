@@ -1,11 +1,22 @@
+import argparse
+import asyncio
+import contextlib
+import importlib
 import logging
+import signal
+import socket
 import subprocess
 import sys
 import threading
 import time
 from pathlib import Path
+from typing import List, Optional, Tuple
 
-from config_utils import get_server_ports
+import uvicorn
+
+# Add parent directory to path to import config_utils
+sys.path.append(str(Path(__file__).parent.parent))
+from config_utils import get_server_ports  # noqa: E402
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -28,8 +39,41 @@ def _stream_output(process, name):
             print(f"[{name} ERROR] {line.decode().rstrip()}", file=sys.stderr)
 
 
-def _run_servers():
-    """Run all stub servers concurrently"""
+def _wait_until_ready(
+    host: str,
+    port: int,
+    timeout: float,
+    process: Optional[subprocess.Popen] = None,
+) -> bool:
+    """Poll a TCP port until it accepts connections.
+
+    Returns False if the timeout expires or the process exits first.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection((host, port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def _log_server_urls(servers: List[Tuple[str, str, int]], protocol: str, host: str):
+    """Log the base and docs URL of every server"""
+    logging.info("Test URLs:")
+    for name, _, port in servers:
+        logging.info(f"  {name:<15}: {protocol}://{host}:{port}/")
+
+    logging.info("\nAPI Documentation (add /docs to any URL):")
+    for name, _, port in servers:
+        logging.info(f"  {name} Docs: {protocol}://{host}:{port}/docs")
+
+
+def _get_servers() -> List[Tuple[str, str, int]]:
+    """Return (name, script, port) for every server with a known port"""
     # Get ports from OpenAPI specifications
     ports = get_server_ports()
 
@@ -48,17 +92,32 @@ def _run_servers():
         else:
             logging.error(f"Could not determine port for {name}, skipping")
 
-    servers = valid_servers
+    return valid_servers
+
+
+def _run_servers(args: argparse.Namespace):
+    """Run all stub servers concurrently, one subprocess per server"""
+    started_at = time.perf_counter()
+    servers = _get_servers()
 
     processes = []
 
     # Change to the project directory
     project_dir = Path(__file__).parent
 
+    server_args = ["--host", args.host]
+    if args.ssl_keyfile and args.ssl_certfile:
+        server_args += [
+            "--ssl-keyfile",
+            args.ssl_keyfile,
+            "--ssl-certfile",
+            args.ssl_certfile,
+        ]
+
     for name, script, port in servers:
         logging.info(f"Starting {name} on port {port}...")
         process = subprocess.Popen(
-            [sys.executable, script],
+            [sys.executable, script, *server_args, "--port", str(port)],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             cwd=project_dir,
@@ -73,20 +132,24 @@ def _run_servers():
         )
         output_thread.start()
 
-        time.sleep(2)  # Give each server time to start
+    # Servers start in parallel; wait until each one accepts connections
+    failed = []
+    for (name, _, port), (_, process) in zip(servers, processes):
+        if not _wait_until_ready(args.host, port, args.startup_timeout, process):
+            logging.error(f"{name} did not become ready on port {port}")
+            failed.append(name)
+
+    if failed:
+        _stop_processes(processes)
+        raise RuntimeError(f"Servers failed to start: {', '.join(failed)}")
 
     logging.info("\n" + "=" * 80)
-    logging.info("All servers running. Press Ctrl+C to stop all servers.")
+    logging.info(
+        f"All servers running ({len(servers)} processes, started in "
+        f"{time.perf_counter() - started_at:.2f}s). Press Ctrl+C to stop all servers."
+    )
     logging.info("=" * 80 + "\n")
-    logging.info("Test URLs:")
-    for name, _, port in servers:
-        service_name = name.split()[0].lower()
-        logging.info(f"  {name:<15}: https://localhost:{port}/")
-
-    logging.info("\nAPI Documentation (add /docs to any URL):")
-    for name, _, port in servers:
-        service_name = name.split()[0].lower()
-        logging.info(f"  {name} Docs: https://localhost:{port}/docs")
+    _log_server_urls(servers, _protocol(args), args.host)
 
     try:
         # Keep the script running
@@ -103,22 +166,127 @@ def _run_servers():
         logging.info("\n" + "=" * 80)
         logging.info("Stopping all servers...")
         logging.info("=" * 80)
-        for name, process in processes:
-            process.terminate()
-            logging.info(f"Stopped {name}")
-            # Wait a bit for graceful shutdown
-            try:
-                process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                # Force kill if it doesn't stop gracefully
-                process.kill()
-                logging.warning(f"Force killed {name}")
+        _stop_processes(processes)
+
+
+def _stop_processes(processes: List[Tuple[str, subprocess.Popen]]):
+    """Terminate every server process, killing any that do not exit"""
+    for name, process in processes:
+        process.terminate()
+        logging.info(f"Stopped {name}")
+        # Wait a bit for graceful shutdown
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            # Force kill if it doesn't stop gracefully
+            process.kill()
+            logging.warning(f"Force killed {name}")
+
+
+def _protocol(args: argparse.Namespace) -> str:
+    return "https" if args.ssl_keyfile and args.ssl_certfile else "http"
+
+
+class _EmbeddedServer(uvicorn.Server):
+    """uvicorn server that leaves signal handling to the combined host"""
+
+    def install_signal_handlers(self) -> None:  # uvicorn < 0.29
+        pass
+
+    @contextlib.contextmanager
+    def capture_signals(self):  # uvicorn >= 0.29
+        yield
+
+
+async def _serve_combined(args: argparse.Namespace, started_at: float):
+    """Serve every app from one event loop, each on its own port"""
+    servers = _get_servers()
+
+    ssl_config = {}
+    if args.ssl_keyfile and args.ssl_certfile:
+        ssl_config = {
+            "ssl_keyfile": args.ssl_keyfile,
+            "ssl_certfile": args.ssl_certfile,
+        }
+
+    embedded = []
+    for name, script, port in servers:
+        # Importing the module builds the app and preloads its datasets
+        app = importlib.import_module(Path(script).stem).app
+        config = uvicorn.Config(app, host=args.host, port=port, **ssl_config)
+        embedded.append((name, _EmbeddedServer(config)))
+
+    def _stop_all(*_):
+        for _, server in embedded:
+            server.should_exit = True
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, _stop_all)
+
+    tasks = [asyncio.create_task(server.serve()) for _, server in embedded]
+
+    # Ready once every server has bound its socket, or failed to
+    deadline = time.monotonic() + args.startup_timeout
+    while not all(server.started for _, server in embedded):
+        if any(task.done() for task in tasks) or time.monotonic() > deadline:
+            for name, server in embedded:
+                if not server.started:
+                    logging.error(f"{name} did not become ready")
+            _stop_all()
+            break
+        await asyncio.sleep(0.05)
+    else:
+        logging.info("\n" + "=" * 80)
+        logging.info(
+            f"All servers running (1 process, started in "
+            f"{time.perf_counter() - started_at:.2f}s). Press Ctrl+C to stop all servers."
+        )
+        logging.info("=" * 80 + "\n")
+        _log_server_urls(servers, _protocol(args), args.host)
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    logging.info("Stopped all servers")
+
+
+def _run_combined(args: argparse.Namespace):
+    """Run all servers as separate ASGI apps inside this process"""
+    started_at = time.perf_counter()
+    asyncio.run(_serve_combined(args, started_at))
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run all backend API servers")
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Host to bind to (must match SSL certificate hostname if using SSL)",
+    )
+    parser.add_argument("--ssl-keyfile", type=str, help="Path to SSL private key file")
+    parser.add_argument("--ssl-certfile", type=str, help="Path to SSL certificate file")
+    parser.add_argument(
+        "--combined",
+        action="store_true",
+        help="Serve all APIs from a single process instead of one process per server",
+    )
+    parser.add_argument(
+        "--startup-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for each server to accept connections",
+    )
+    return parser.parse_args()
 
 
 def main():
     """Main entry point"""
+    args = _parse_args()
     try:
-        _run_servers()
+        if args.combined:
+            _run_combined(args)
+        else:
+            _run_servers(args)
     except Exception as e:
         logging.error(f"Error running servers: {str(e)}")
         sys.exit(1)
@@ -0,0 +1,237 @@
+import heapq
+import json
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_CAMEL_CASE_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from if in into is it of on or the to with".split()
+)
+
+# Query terms shorter than this are never expanded to longer vocabulary terms
+_MIN_PREFIX_LENGTH = 3
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lower-case alphanumeric, non-stopword tokens.
+
+    CamelCase words are split too, so "OutOfMemoryError" matches "memory".
+    """
+    text = _CAMEL_CASE_RE.sub(r"\1 \2", text).lower()
+    return [t for t in _TOKEN_RE.findall(text) if t not in _STOPWORDS]
+
+
+def _flatten_text(value: Any) -> Iterable[str]:
+    """Yield every string contained in a JSON value"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _flatten_text(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _flatten_text(item)
+
+
+class BM25Index:
+    """Inverted index with Okapi BM25 ranking over pre-tokenized documents"""
+
+    def __init__(
+        self, documents: Sequence[List[str]], k1: float = 1.5, b: float = 0.75
+    ):
+        self.k1 = k1
+        self.b = b
+        self.doc_lengths = [len(tokens) for tokens in documents]
+        self.avg_length = (
+            sum(self.doc_lengths) / len(self.doc_lengths) if documents else 0.0
+        )
+
+        # term -> {document position: term frequency}
+        self.postings: Dict[str, Dict[int, int]] = {}
+        for position, tokens in enumerate(documents):
+            for term, tf in Counter(tokens).items():
+                self.postings.setdefault(term, {})[position] = tf
+
+        total = len(documents)
+        self.idf = {
+            term: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self.postings.items()
+        }
+        self._vocabulary = sorted(self.postings)
+
+        # Per-document length normalisation, precomputed for scoring
+        self._norms = [
+            k1 * (1 - b + b * length / self.avg_length) if self.avg_length else k1
+            for length in self.doc_lengths
+        ]
+
+    def _expand(self, term: str) -> List[str]:
+        """Map a query term to index terms, using prefix matches for unknown terms"""
+        if term in self.postings:
+            return [term]
+        if len(term) < _MIN_PREFIX_LENGTH:
+            return []
+        matches = []
+        i = bisect_left(self._vocabulary, term)
+        while i < len(self._vocabulary) and self._vocabulary[i].startswith(term):
+            matches.append(self._vocabulary[i])
+            i += 1
+        return matches
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        candidates: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[int, float]]:
+        """Return (document position, score) pairs for documents matching query.
+
+        Args:
+            query: Free text query
+            limit: Maximum number of results, all matches if None
+            candidates: Restrict results to these document positions
+
+        Returns:
+            Matches ordered by descending score, ties in document order
+        """
+        allowed = set(candidates) if candidates is not None else None
+        scores: Dict[int, float] = {}
+
+        terms = set()
+        for token in tokenize(query):
+            terms.update(self._expand(token))
+
+        for term in terms:
+            idf = self.idf[term]
+            for position, tf in self.postings[term].items():
+                if allowed is not None and position not in allowed:
+                    continue
+                scores[position] = scores.get(position, 0.0) + idf * tf * (
+                    self.k1 + 1
+                ) / (tf + self._norms[position])
+
+        def _rank_key(item: Tuple[int, float]) -> Tuple[float, int]:
+            return (item[1], -item[0])
+
+        if limit is None:
+            return sorted(scores.items(), key=_rank_key, reverse=True)
+        return heapq.nlargest(limit, scores.items(), key=_rank_key)
+
+
+class RunbookCollection:
+    """Runbook records with a BM25 index over their searchable fields"""
+
+    def __init__(
+        self,
+        records: List[dict],
+        fields: Sequence[str],
+        boosted_fields: Sequence[str] = (),
+    ):
+        self.records = records
+        self.by_id = {r["id"]: r for r in records if "id" in r}
+
+        documents = []
+        for record in records:
+            tokens: List[str] = []
+            for name in fields:
+                for text in _flatten_text(record.get(name)):
+                    tokens.extend(tokenize(text))
+            # Boosted fields (e.g. titles) are counted twice
+            for name in boosted_fields:
+                for text in _flatten_text(record.get(name)):
+                    tokens.extend(tokenize(text))
+            documents.append(tokens)
+        self.index = BM25Index(documents)
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        limit: Optional[int] = None,
+        predicate: Optional[Callable[[dict], bool]] = None,
+    ) -> List[dict]:
+        """Return records matching an optional predicate, ranked by query if given"""
+        candidates = None
+        if predicate is not None:
+            candidates = [
+                position
+                for position, record in enumerate(self.records)
+                if predicate(record)
+            ]
+
+        if not query:
+            if candidates is None:
+                return self.records[:limit]
+            return [self.records[p] for p in candidates[:limit]]
+
+        return [
+            self.records[position]
+            for position, _ in self.index.search(query, limit, candidates)
+        ]
+
+    def ranked(
+        self, query: str, limit: Optional[int] = None
+    ) -> List[Tuple[dict, float]]:
+        """Return (record, score) pairs ranked by query"""
+        return [
+            (self.records[position], score)
+            for position, score in self.index.search(query, limit)
+        ]
+
+
+def collection_loader(
+    records_key: str, fields: Sequence[str], boosted_fields: Sequence[str] = ()
+) -> Callable[[Path], RunbookCollection]:
+    """Build a DatasetCache loader that indexes the list stored under records_key"""
+
+    def _load(file_path: Path) -> RunbookCollection:
+        with open(file_path, "r") as f:
+            data = json.load(f)
+        return RunbookCollection(data.get(records_key, []), fields, boosted_fields)
+
+    return _load
+
+
+def _slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def _markdown_sections(file_path: Path) -> List[dict]:
+    """Split a markdown runbook into its level-2 sections"""
+    sections: List[dict] = []
+    title: Optional[str] = None
+    lines: List[str] = []
+
+    def _flush():
+        if title is not None:
+            sections.append(
+                {
+                    "id": f"{file_path.stem}/{_slugify(title)}",
+                    "source": file_path.name,
+                    "title": title,
+                    "content": "\n".join(lines).strip(),
+                }
+            )
+
+    with open(file_path, "r") as f:
+        for line in f:
+            if line.startswith("## "):
+                _flush()
+                title, lines = line[3:].strip(), []
+            elif title is not None:
+                lines.append(line.rstrip("\n"))
+    _flush()
+    return sections
+
+
+def load_markdown_collection(directory: Path) -> RunbookCollection:
+    """DatasetCache loader indexing every section of every markdown runbook"""
+    sections: List[dict] = []
+    for file_path in sorted(Path(directory).glob("*.md")):
+        sections.extend(_markdown_sections(file_path))
+    return RunbookCollection(sections, ("title", "content"), boosted_fields=("title",))
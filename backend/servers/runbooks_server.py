@@ -1,8 +1,9 @@
-import json
 import logging
 from pathlib import Path
 from typing import Optional
 
+from audit_log import AuditLogger
+from dataset_cache import DatasetCache
 from fastapi import (
     Depends,
     FastAPI,
@@ -14,7 +15,14 @@ from fastapi import (
     Path as PathParam,
 )
 from fastapi.responses import JSONResponse
+from pagination import Page, paginate
+from response_cache import ResponseCache, ResponseCacheMiddleware
 from retrieve_api_key import retrieve_api_key
+from runbook_index import (
+    RunbookCollection,
+    collection_loader,
+    load_markdown_collection,
+)
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -27,6 +35,64 @@ app = FastAPI(title="DevOps Runbooks API", version="1.0.0")
 
 DATA_PATH = Path(__file__).parent.parent / "data" / "runbooks_data"
 
+# Runbook collections with BM25 search indexes, built once per file load and
+# rebuilt only when the underlying file changes on disk
+DATASETS = DatasetCache(DATA_PATH)
+DATASETS.register(
+    "incident_playbooks.json",
+    loader=collection_loader(
+        "playbooks",
+        fields=("title", "description", "incident_type", "triggers", "steps"),
+        boosted_fields=("title",),
+    ),
+)
+DATASETS.register(
+    "troubleshooting_guides.json",
+    loader=collection_loader(
+        "guides",
+        fields=("id", "title", "category", "common_causes", "steps"),
+        boosted_fields=("title",),
+    ),
+)
+DATASETS.register(
+    "escalation_procedures.json",
+    loader=collection_loader(
+        "escalation_procedures",
+        fields=("title", "severity", "trigger_conditions"),
+        boosted_fields=("title",),
+    ),
+)
+DATASETS.register(
+    "common_resolutions.json",
+    loader=collection_loader(
+        "resolutions",
+        fields=("id", "issue", "symptoms", "quick_fixes", "permanent_solutions"),
+        boosted_fields=("issue", "symptoms"),
+    ),
+)
+DATASETS.register("markdown", loader=load_markdown_collection)
+DATASETS.preload()
+
+# Serialized responses of the data-backed routes with ETags, invalidated when
+# any of the files a route reads changes
+RESPONSES = ResponseCache(
+    DATASETS,
+    {
+        "/runbooks/search": ("incident_playbooks.json",),
+        "/runbooks/playbook/": ("incident_playbooks.json",),
+        "/runbooks/troubleshooting": ("troubleshooting_guides.json",),
+        "/runbooks/escalation": ("escalation_procedures.json",),
+        "/runbooks/resolutions": ("common_resolutions.json",),
+        "/runbooks/documents/search": ("markdown",),
+    },
+)
+
+# Sampled request audit log, see BACKEND_AUDIT_* environment variables
+AUDIT = AuditLogger("runbooks-api")
+
+# Cache hits never reach the handlers, so the middleware audits them
+app.add_middleware(ResponseCacheMiddleware, cache=RESPONSES, audit=AUDIT)
+
 # API Key for authentication
 CREDENTIAL_PROVIDER_NAME = "sre-agent-api-key-credential-provider"
 
@@ -66,62 +132,33 @@ async def search_runbooks(
         description="Incident severity level",
     ),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(max_limit=100)),
+    playbooks: RunbookCollection = Depends(DATASETS.provide("incident_playbooks.json")),
 ):
     """Search runbooks by incident type/keyword"""
     try:
-        logging.info(
-            f"🔍 RUNBOOKS API: search_runbooks called - incident_type={incident_type}, keyword={keyword}, severity={severity}"
+        # Exact filters narrow the candidates, the keyword ranks them by BM25
+        runbooks = playbooks.search(
+            query=keyword,
+            limit=page.window,
+            predicate=lambda r: (
+                (not incident_type or r.get("incident_type") == incident_type)
+                and (not severity or r.get("severity") == severity)
+            ),
         )
 
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        runbooks = data.get("playbooks", [])
-        original_count = len(runbooks)
-
-        if incident_type:
-            runbooks = [r for r in runbooks if r.get("incident_type") == incident_type]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by incident_type '{incident_type}': {len(runbooks)} runbooks"
-            )
-
-        if severity:
-            runbooks = [r for r in runbooks if r.get("severity") == severity]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by severity '{severity}': {len(runbooks)} runbooks"
-            )
-
-        if keyword:
-            runbooks = [
-                r
-                for r in runbooks
-                if keyword.lower() in r.get("title", "").lower()
-                or keyword.lower() in r.get("description", "").lower()
-                or any(keyword.lower() in step.lower() for step in r.get("steps", []))
-            ]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by keyword '{keyword}': {len(runbooks)} runbooks"
-            )
-
-        response_data = {"runbooks": runbooks}
-
-        # Log detailed response
-        logging.info(
-            f"📤 RUNBOOKS API: Returning {len(runbooks)} runbooks out of {original_count} total"
-        )
-        for i, runbook in enumerate(runbooks):
-            logging.info(
-                f"  📖 Runbook {i + 1}: {runbook.get('title', 'No title')} (ID: {runbook.get('id', 'No ID')})"
-            )
-            steps = runbook.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
-
-        logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+        runbooks, next_cursor = page.slice(runbooks)
+        response_data = page.respond("runbooks", runbooks, next_cursor)
+        AUDIT.record(
+            "search_runbooks",
+            {
+                "incident_type": incident_type,
+                "keyword": keyword,
+                "severity": severity,
+                "limit": page.limit,
+            },
+            response_data,
+            results=len(runbooks),
         )
         return response_data
     except Exception as e:
@@ -133,34 +170,18 @@ async def search_runbooks(
 async def get_incident_playbook(
     playbook_id: str = PathParam(..., description="Playbook ID"),
     api_key: str = Depends(_validate_api_key),
+    playbooks: RunbookCollection = Depends(DATASETS.provide("incident_playbooks.json")),
 ):
     """Retrieve specific incident playbooks"""
     try:
-        logging.info(
-            f"🔍 RUNBOOKS API: get_incident_playbook called for playbook_id='{playbook_id}'"
-        )
-
-        with open(DATA_PATH / "incident_playbooks.json", "r") as f:
-            data = json.load(f)
-
-        playbooks = data.get("playbooks", [])
-
-        for playbook in playbooks:
-            if playbook.get("id") == playbook_id:
-                logging.info(
-                    f"📖 RUNBOOKS API: Found playbook '{playbook.get('title', 'No title')}'"
-                )
-                steps = playbook.get("steps", [])
-                logging.info(f"📝 RUNBOOKS API: Playbook has {len(steps)} steps:")
-                for i, step in enumerate(steps):
-                    logging.info(f"   Step {i + 1}: {step}")
-
-                logging.info(
-                    f"📤 RUNBOOKS API: Returning complete playbook data: {json.dumps(playbook, indent=2)}"
-                )
-                return playbook
+        playbook = playbooks.by_id.get(playbook_id)
+        if playbook is not None:
+            AUDIT.record(
+                "get_incident_playbook", {"playbook_id": playbook_id}, playbook
+            )
+            return playbook
 
-        logging.warning(f"❌ RUNBOOKS API: Playbook '{playbook_id}' not found")
+        logging.warning("❌ RUNBOOKS API: Playbook '%s' not found", playbook_id)
         return JSONResponse(status_code=404, content={"error": "Playbook not found"})
     except Exception as e:
         logging.error(f"❌ Error retrieving playbook: {str(e)}")
@@ -176,55 +197,26 @@ async def get_troubleshooting_guide(
     ),
     issue_type: Optional[str] = Query(None, description="Specific issue type"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(max_limit=100)),
+    troubleshooting: RunbookCollection = Depends(
+        DATASETS.provide("troubleshooting_guides.json")
+    ),
 ):
     """Fetch step-by-step troubleshooting guides"""
     try:
-        logging.info(
-            f"🔍 RUNBOOKS API: get_troubleshooting_guide called - category={category}, issue_type={issue_type}"
+        guides = troubleshooting.search(
+            query=issue_type,
+            limit=page.window,
+            predicate=lambda g: not category or g.get("category") == category,
         )
 
-        with open(DATA_PATH / "troubleshooting_guides.json", "r") as f:
-            data = json.load(f)
-
-        guides = data.get("guides", [])
-        original_count = len(guides)
-
-        if category:
-            guides = [g for g in guides if g.get("category") == category]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by category '{category}': {len(guides)} guides"
-            )
-
-        if issue_type:
-            guides = [
-                g
-                for g in guides
-                if issue_type.lower() in g.get("title", "").lower()
-                or issue_type.lower() in g.get("id", "").lower()
-            ]
-            logging.info(
-                f"📋 RUNBOOKS API: Filtered by issue_type '{issue_type}': {len(guides)} guides"
-            )
-
-        response_data = {"guides": guides}
-
-        # Log detailed response
-        logging.info(
-            f"📤 RUNBOOKS API: Returning {len(guides)} guides out of {original_count} total"
-        )
-        for i, guide in enumerate(guides):
-            logging.info(
-                f"  📖 Guide {i + 1}: {guide.get('title', 'No title')} (ID: {guide.get('id', 'No ID')})"
-            )
-            steps = guide.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
-
-        logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+        guides, next_cursor = page.slice(guides)
+        response_data = page.respond("guides", guides, next_cursor)
+        AUDIT.record(
+            "get_troubleshooting_guide",
+            {"category": category, "issue_type": issue_type, "limit": page.limit},
+            response_data,
+            results=len(guides),
         )
         return response_data
     except Exception as e:
@@ -241,29 +233,28 @@ async def get_escalation_procedures(
     ),
     incident_type: Optional[str] = Query(None, description="Type of incident"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(max_limit=100)),
+    escalations: RunbookCollection = Depends(
+        DATASETS.provide("escalation_procedures.json")
+    ),
 ):
     """Retrieve escalation procedures"""
     try:
-        with open(DATA_PATH / "escalation_procedures.json", "r") as f:
-            data = json.load(f)
-
-        procedures = data.get("escalation_procedures", [])
-
-        if severity:
-            procedures = [p for p in procedures if p.get("severity") == severity]
-
-        if incident_type:
-            procedures = [
-                p
-                for p in procedures
-                if incident_type.lower() in p.get("title", "").lower()
-                or any(
-                    incident_type.lower() in condition.lower()
-                    for condition in p.get("trigger_conditions", [])
-                )
-            ]
-
-        return {"escalation_procedures": procedures}
+        procedures = escalations.search(
+            query=incident_type,
+            limit=page.window,
+            predicate=lambda p: not severity or p.get("severity") == severity,
+        )
+
+        procedures, next_cursor = page.slice(procedures)
+        response_data = page.respond("escalation_procedures", procedures, next_cursor)
+        AUDIT.record(
+            "get_escalation_procedures",
+            {"severity": severity, "incident_type": incident_type, "limit": page.limit},
+            response_data,
+            results=len(procedures),
+        )
+        return response_data
     except Exception as e:
         logging.error(f"Error retrieving escalation procedures: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
@@ -274,69 +265,68 @@ async def get_common_resolutions(
     issue: str = Query(..., description="Issue or error type"),
     service: Optional[str] = Query(None, description="Affected service"),
     api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(max_limit=100)),
+    resolutions: RunbookCollection = Depends(
+        DATASETS.provide("common_resolutions.json")
+    ),
 ):
     """Fetch common resolution steps"""
     try:
-        logging.info(
-            f"🔍 RUNBOOKS API: get_common_resolutions called - issue='{issue}', service={service}"
+        # Rank resolutions by how well their issue, symptoms and fixes match.
+        # The service is recorded but not used for filtering yet.
+        matching_resolutions = resolutions.search(query=issue, limit=page.window)
+
+        matching_resolutions, next_cursor = page.slice(matching_resolutions)
+        response_data = page.respond("resolutions", matching_resolutions, next_cursor)
+        AUDIT.record(
+            "get_common_resolutions",
+            {"issue": issue, "service": service, "limit": page.limit},
+            response_data,
+            results=len(matching_resolutions),
         )
+        return response_data
+    except Exception as e:
+        logging.error(f"❌ Error retrieving common resolutions: {str(e)}")
+        return JSONResponse(status_code=500, content={"error": str(e)})
 
-        with open(DATA_PATH / "common_resolutions.json", "r") as f:
-            data = json.load(f)
-
-        resolutions = data.get("resolutions", [])
-        original_count = len(resolutions)
-
-        # Filter by issue
-        matching_resolutions = []
-        for resolution in resolutions:
-            if (
-                issue.lower() in resolution.get("issue", "").lower()
-                or issue.lower() in resolution.get("id", "").lower()
-                or any(
-                    issue.lower() in symptom.lower()
-                    for symptom in resolution.get("symptoms", [])
-                )
-            ):
-                matching_resolutions.append(resolution)
-
-        logging.info(
-            f"📋 RUNBOOKS API: Found {len(matching_resolutions)} matching resolutions for issue '{issue}'"
-        )
-
-        # If service specified, prioritize resolutions that mention the service
-        if service and matching_resolutions:
-            # This is a simple implementation - in real world might have service-specific resolutions
-            logging.info(
-                f"📋 RUNBOOKS API: Service filter '{service}' applied (basic implementation)"
-            )
-
-        response_data = {"resolutions": matching_resolutions}
 
-        # Log detailed response
-        logging.info(
-            f"📤 RUNBOOKS API: Returning {len(matching_resolutions)} resolutions out of {original_count} total"
+@app.get("/runbooks/documents/search")
+async def search_runbook_documents(
+    query: str = Query(..., description="Free text search query"),
+    api_key: str = Depends(_validate_api_key),
+    page: Page = Depends(paginate(default_limit=5, max_limit=50)),
+    documents: RunbookCollection = Depends(DATASETS.provide("markdown")),
+):
+    """Rank sections of the markdown runbooks against a free text query"""
+    try:
+        ranked, next_cursor = page.slice(documents.ranked(query, limit=page.window))
+        response_data = page.respond(
+            "documents",
+            [{**section, "score": round(score, 4)} for section, score in ranked],
+            next_cursor,
         )
-        for i, resolution in enumerate(matching_resolutions):
-            logging.info(
-                f"  📖 Resolution {i + 1}: {resolution.get('issue', 'No issue title')} (ID: {resolution.get('id', 'No ID')})"
-            )
-            steps = resolution.get("steps", [])
-            logging.info(f"     Steps count: {len(steps)}")
-            for j, step in enumerate(steps[:3]):  # Show first 3 steps for brevity
-                logging.info(f"     Step {j + 1}: {step}")
-            if len(steps) > 3:
-                logging.info(f"     ... and {len(steps) - 3} more steps")
-
-        logging.info(
-            f"📋 RUNBOOKS API: Full response data: {json.dumps(response_data, indent=2)}"
+        AUDIT.record(
+            "search_runbook_documents",
+            {"query": query, "limit": page.limit},
+            response_data,
+            results=len(ranked),
         )
         return response_data
     except Exception as e:
-        logging.error(f"❌ Error retrieving common resolutions: {str(e)}")
+        logging.error(f"Error searching runbook documents: {str(e)}")
         return JSONResponse(status_code=500, content={"error": str(e)})
 
 
+@app.get("/cache/stats")
+async def get_cache_stats(api_key: str = Depends(_validate_api_key)):
+    """Report dataset cache and response cache counters"""
+    return {
+        "service": "runbooks-api",
+        "datasets": DATASETS.stats(),
+        "responses": RESPONSES.stats(),
+    }
+
+
 @app.get("/")
 async def health_check(api_key: str = Depends(_validate_api_key)):
     """Health check endpoint"""
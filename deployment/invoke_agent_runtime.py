@@ -69,6 +69,48 @@ def _get_session_from_env(mode: str) -> str:
         return auto_session_id
 
 
+def _print_stream(response_stream) -> None:
+    """Print Server-Sent Events from a streaming invocation as they arrive.
+
+    Plans and agent completions are logged, tokens of the final aggregation
+    are printed as they are generated and the final message is printed at the
+    end if no tokens were streamed for it.
+    """
+    aggregate_streamed = False
+
+    for line in response_stream.iter_lines():
+        line = line.decode("utf-8") if isinstance(line, bytes) else line
+        if not line.startswith("data: "):
+            continue
+        event = json.loads(line[len("data: ") :])
+        event_type = event.get("type")
+
+        if event_type == "start":
+            logging.info("Agent runtime accepted the request, streaming response")
+        elif event_type == "plan":
+            print("\nInvestigation Plan:")
+            print(event.get("plan_text") or json.dumps(event.get("plan"), indent=2))
+        elif event_type == "routing":
+            logging.info(f"Supervisor: {event.get('reasoning')}")
+        elif event_type == "agent_complete":
+            logging.info(f"{event.get('agent')} completed")
+        elif event_type == "token" and event.get("node") == "aggregate":
+            if not aggregate_streamed:
+                print("\nMessage:")
+                aggregate_streamed = True
+            print(event.get("content", ""), end="", flush=True)
+        elif event_type == "final":
+            if aggregate_streamed:
+                print()
+            else:
+                print("\nMessage:")
+                print(event.get("message", ""))
+            if event.get("tool_cache"):
+                logging.info(f"Tool result cache: {event['tool_cache']}")
+        elif event_type == "error":
+            logging.error(f"Agent runtime error: {event.get('detail')}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Invoke SRE Agent Runtime via AgentCore"
@@ -79,13 +121,18 @@ def main():
         help="Agent Runtime ARN (reads from .sre_agent_uri if not provided)",
     )
     parser.add_argument(
-        "--region", 
-        default=os.environ.get("AWS_REGION", "us-east-1"), 
-        help="AWS region (default: AWS_REGION env var or us-east-1)"
+        "--region",
+        default=os.environ.get("AWS_REGION", "us-east-1"),
+        help="AWS region (default: AWS_REGION env var or us-east-1)",
     )
     parser.add_argument(
         "--session-id", help="Runtime session ID (generates one if not provided)"
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream the plan, agent progress and response tokens as they are produced",
+    )
 
     args = parser.parse_args()
 
@@ -154,15 +201,31 @@ def main():
         session_id = env_session_id
 
     # Prepare payload with user_id and session_id
-    payload = json.dumps(
-        {"input": {"prompt": args.prompt, "user_id": user_id, "session_id": session_id}}
-    )
+    payload_input = {
+        "prompt": args.prompt,
+        "user_id": user_id,
+        "session_id": session_id,
+    }
+    if args.stream:
+        payload_input["stream"] = True
+    payload = json.dumps({"input": payload_input})
 
     logging.info(f"Invoking agent runtime: {runtime_arn}")
     logging.info(f"Session ID: {session_id}")
     logging.info(f"Prompt: {args.prompt}")
 
     try:
+        if args.stream:
+            response = agent_core_client.invoke_agent_runtime(
+                agentRuntimeArn=runtime_arn,
+                runtimeSessionId=session_id,
+                payload=payload,
+                qualifier="DEFAULT",
+                accept="text/event-stream",
+            )
+            _print_stream(response["response"])
+            return
+
         response = agent_core_client.invoke_agent_runtime(
             agentRuntimeArn=runtime_arn,
             runtimeSessionId=session_id,
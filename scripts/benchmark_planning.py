@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Benchmark structured versus react investigation planning.
+
+Creates investigation plans for a set of on-call queries with the supervisor
+in each planning mode and reports, per mode:
+
+- LLM calls per plan
+- input and output tokens per plan
+- wall time per plan (memory retrieval included, it is the same in both modes)
+
+The plan cache is disabled so every query is planned. The benchmark talks to
+the configured LLM provider and memory resource, so it needs the same
+credentials as the agent. Without memory both modes make a single structured
+call; the react planning agent only exists when memory is enabled.
+
+Usage:
+    uv run python scripts/benchmark_planning.py [--provider bedrock] [--runs 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.tracers.context import register_configure_hook
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sre_agent.plan_cache import PlanCache  # noqa: E402
+from sre_agent.supervisor import PLANNING_MODES, SupervisorAgent  # noqa: E402
+
+QUERIES = [
+    "API response times degraded",
+    "pods crashlooping in production",
+    "why is the payment service failing?",
+    "database connection errors in the order service",
+    "memory usage keeps growing on the web tier",
+]
+
+
+class _PlanningUsage(UsageMetadataCallbackHandler):
+    """Token usage of every chat model call, plus the number of calls."""
+
+    def __init__(self):
+        super().__init__()
+        self.llm_calls = 0
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        self.llm_calls += 1
+        super().on_llm_end(response, **kwargs)
+
+
+_usage_var: ContextVar[Optional[_PlanningUsage]] = ContextVar(
+    "planning_benchmark_usage", default=None
+)
+register_configure_hook(_usage_var, inheritable=True)
+
+
+@contextmanager
+def _track_usage():
+    """Collect usage of all LLM calls made inside the block, including nested ones."""
+    usage = _PlanningUsage()
+    token = _usage_var.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage_var.reset(token)
+
+
+async def _benchmark_mode(
+    mode: str, provider: str, queries: List[str], runs: int, user_id: str, **llm_kwargs
+) -> List[Dict[str, float]]:
+    supervisor = SupervisorAgent(
+        llm_provider=provider,
+        planning_mode=mode,
+        plan_cache=PlanCache(max_entries=0),
+        **llm_kwargs,
+    )
+    rows = []
+    for run in range(runs):
+        for i, query in enumerate(queries):
+            state = {
+                "current_query": query,
+                "user_id": user_id,
+                "session_id": f"planning-benchmark-{mode}-{run}-{i}-{int(time.time())}",
+            }
+            with _track_usage() as usage:
+                started = time.perf_counter()
+                await supervisor.create_investigation_plan(state)
+                seconds = time.perf_counter() - started
+            rows.append(
+                {
+                    "llm_calls": usage.llm_calls,
+                    "input_tokens": sum(
+                        u.get("input_tokens", 0) for u in usage.usage_metadata.values()
+                    ),
+                    "output_tokens": sum(
+                        u.get("output_tokens", 0) for u in usage.usage_metadata.values()
+                    ),
+                    "seconds": seconds,
+                }
+            )
+            print(
+                f"{mode:<10} {query[:40]:<40} {usage.llm_calls:>3} calls {seconds:>6.2f}s"
+            )
+    return rows
+
+
+def _print(results: Dict[str, List[Dict[str, float]]]) -> None:
+    print(
+        f"\n{'mode':<10} {'plans':>5} {'LLM calls':>9} {'input tok':>10} "
+        f"{'output tok':>10} {'mean s':>7} {'p50 s':>7}"
+    )
+    for mode, rows in results.items():
+        seconds = [row["seconds"] for row in rows]
+        print(
+            f"{mode:<10} {len(rows):>5} "
+            f"{statistics.mean(r['llm_calls'] for r in rows):>9.1f} "
+            f"{statistics.mean(r['input_tokens'] for r in rows):>10.0f} "
+            f"{statistics.mean(r['output_tokens'] for r in rows):>10.0f} "
+            f"{statistics.mean(seconds):>7.2f} {statistics.median(seconds):>7.2f}"
+        )
+    print("(LLM calls, tokens and times are per plan)")
+
+
+async def _main(args) -> None:
+    llm_kwargs = {"region_name": args.region} if args.region else {}
+    results = {}
+    for mode in args.modes:
+        results[mode] = await _benchmark_mode(
+            mode, args.provider, QUERIES, args.runs, args.user_id, **llm_kwargs
+        )
+    _print(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--provider",
+        choices=["anthropic", "bedrock"],
+        default="bedrock",
+        help="LLM provider to plan with",
+    )
+    parser.add_argument("--region", help="AWS region for Bedrock")
+    parser.add_argument(
+        "--runs", type=int, default=3, help="Times each query is planned per mode"
+    )
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=PLANNING_MODES,
+        default=list(PLANNING_MODES),
+        help="Planning modes to compare",
+    )
+    parser.add_argument(
+        "--user-id",
+        default="planning-benchmark",
+        help="User the plans are created for (planning conversations are stored in its memory)",
+    )
+    asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Benchmark graph state growth for a 4-agent investigation plan.
+
+Replays the state updates of a sequential plan (supervisor, agent, supervisor,
+agent, ...) through the AgentState reducers, once with the update shapes the
+nodes used to return and once with the current ones, and reports per step:
+
+- messages in the conversation channel
+- serialized size of the state and of the node's update
+- time spent merging the update into the state
+
+No LLM or MCP server is needed; agent tool traffic is synthesized.
+
+Usage:
+    uv run python scripts/benchmark_state.py [--tool-calls 6] [--result-kb 4]
+"""
+
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sre_agent.agent_state import AgentState  # noqa: E402
+
+AGENTS = ["kubernetes_agent", "logs_agent", "metrics_agent", "runbooks_agent"]
+
+
+def _reducers() -> Dict[str, Callable]:
+    """Reducers of the AgentState channels that have one."""
+    return {
+        key: hint.__metadata__[0]
+        for key, hint in AgentState.__annotations__.items()
+        if hasattr(hint, "__metadata__")
+    }
+
+
+def _apply(state: Dict[str, Any], update: Dict[str, Any]) -> None:
+    """Merge a node update into the state the way LangGraph does."""
+    reducers = _reducers()
+    for key, value in update.items():
+        if key in reducers and key in state:
+            state[key] = reducers[key](state[key], value)
+        else:
+            state[key] = value
+
+
+def _agent_messages(agent: str, tool_calls: int, result_kb: int) -> List[Any]:
+    """Synthesize one agent run: tool call round trips and a final answer."""
+    messages: List[Any] = []
+    for i in range(tool_calls):
+        call_id = f"{agent}-{i}"
+        messages.append(
+            AIMessage(
+                content="",
+                tool_calls=[{"name": f"{agent}_tool", "args": {"i": i}, "id": call_id}],
+            )
+        )
+        messages.append(
+            ToolMessage(
+                content="x" * (result_kb * 1024),
+                tool_call_id=call_id,
+                name=f"{agent}_tool",
+            )
+        )
+    messages.append(AIMessage(content=f"{agent} findings " * 50))
+    return messages
+
+
+def _legacy_updates(state: Dict[str, Any], agent: str, step: int, run: List[Any]):
+    """Updates as nodes returned them before append-only reducers."""
+    supervisor = {
+        "next": agent,
+        "metadata": {
+            **state.get("metadata", {}),
+            "routing_reasoning": f"Executing plan step {step + 1}",
+            "plan_step": step,
+        },
+    }
+
+    def agent_update(current: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "agent_results": {agent: run[-1].content},
+            "agents_invoked": [agent],
+            "messages": current["messages"] + run,
+            "metadata": {f"{agent}_trace": run},
+        }
+
+    return supervisor, agent_update
+
+
+def _current_updates(state: Dict[str, Any], agent: str, step: int, run: List[Any]):
+    """Updates as nodes return them now."""
+    supervisor = {
+        "next": agent,
+        "metadata": {
+            "routing_reasoning": f"Executing plan step {step + 1}",
+            "plan_step": step,
+        },
+    }
+
+    def agent_update(current: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "agent_results": {agent: run[-1].content},
+            "agents_invoked": [agent],
+            "messages": run[-1:],
+            "traces": {agent: run},
+        }
+
+    return supervisor, agent_update
+
+
+def _run(make_updates: Callable, tool_calls: int, result_kb: int) -> List[Dict]:
+    state: Dict[str, Any] = {
+        "messages": [HumanMessage(content="why is the payment service failing?")],
+        "agent_results": {},
+        "agents_invoked": [],
+        "metadata": {"investigation_plan": {"agents_sequence": AGENTS}},
+        "traces": {},
+    }
+    rows = []
+    for step, agent in enumerate(AGENTS):
+        run = _agent_messages(agent, tool_calls, result_kb)
+        supervisor, agent_update = make_updates(state, agent, step, run)
+        for node, update in (
+            ("supervisor", supervisor),
+            (agent, agent_update(state)),
+        ):
+            started = time.perf_counter()
+            _apply(state, update)
+            merge_ms = (time.perf_counter() - started) * 1000
+            rows.append(
+                {
+                    "node": node,
+                    "messages": len(state["messages"]),
+                    "state_kb": len(pickle.dumps(state)) / 1024,
+                    "update_kb": len(pickle.dumps(update)) / 1024,
+                    "merge_ms": merge_ms,
+                }
+            )
+    return rows
+
+
+def _print(title: str, rows: List[Dict]) -> None:
+    print(f"\n{title}")
+    print(
+        f"{'node':<18} {'messages':>8} {'state KB':>10} {'update KB':>10} {'merge ms':>9}"
+    )
+    for row in rows:
+        print(
+            f"{row['node']:<18} {row['messages']:>8} {row['state_kb']:>10.1f} "
+            f"{row['update_kb']:>10.1f} {row['merge_ms']:>9.3f}"
+        )
+    print(
+        f"{'total':<18} {'':>8} {'':>10} {sum(r['update_kb'] for r in rows):>10.1f} "
+        f"{sum(r['merge_ms'] for r in rows):>9.3f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--tool-calls", type=int, default=6, help="Tool calls per agent run"
+    )
+    parser.add_argument(
+        "--result-kb", type=int, default=4, help="Size of each tool result in KB"
+    )
+    args = parser.parse_args()
+
+    # Warm up imports and caches so the first step is not skewed
+    _run(_current_updates, 1, 1)
+
+    _print(
+        "Previous update shapes (full history and traces in messages/metadata)",
+        _run(_legacy_updates, args.tool_calls, args.result_kb),
+    )
+    _print(
+        "Append-only updates (final answers in messages, traces by reference)",
+        _run(_current_updates, args.tool_calls, args.result_kb),
+    )
+
+
+if __name__ == "__main__":
+    main()
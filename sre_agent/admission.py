@@ -0,0 +1,217 @@
+import asyncio
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Number of recent wait and service times kept for percentiles
+_SAMPLE_SIZE = 1000
+
+
+class AdmissionRejectedError(Exception):
+    """Raised when a request cannot be admitted; retry after ``retry_after`` seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionTicket:
+    """A granted slot; release it exactly once when the request is done."""
+
+    def __init__(self, controller: "AdmissionController", user_id: str):
+        self._controller = controller
+        self.user_id = user_id
+        self.started = time.perf_counter()
+        self._released = False
+
+    def release(self) -> None:
+        """Give the slot back. Safe to call more than once."""
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(time.perf_counter() - self.started)
+
+
+class AdmissionController:
+    """Bounds the number of agent invocations running at once.
+
+    At most ``max_in_flight`` requests run concurrently. Further requests wait
+    in a bounded queue for up to ``queue_timeout_seconds``; when a slot frees
+    up it goes to the next waiting user in round-robin order, so one user's
+    burst cannot starve everyone else. Requests that find the queue (or their
+    own share of it) full, or that miss their deadline, are rejected with a
+    suggested retry delay instead of piling onto the LLM and MCP backends.
+
+    All methods must be called from the event loop serving the requests.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        max_queue: int = 16,
+        queue_timeout_seconds: float = 60.0,
+        max_queued_per_user: Optional[int] = None,
+    ):
+        """Create the controller.
+
+        Args:
+            max_in_flight: Requests allowed to run concurrently
+            max_queue: Requests allowed to wait for a slot
+            queue_timeout_seconds: How long a request may wait before it is rejected
+            max_queued_per_user: Waiting requests allowed per user (defaults to
+                a quarter of the queue, at least one)
+        """
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.max_queued_per_user = max_queued_per_user or max(1, max_queue // 4)
+
+        self._in_flight = 0
+        # Waiters per user, in the order users are served
+        self._waiters: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._queued = 0
+        self._wait_times: Deque[float] = deque(maxlen=_SAMPLE_SIZE)
+        self._service_times: Deque[float] = deque(maxlen=_SAMPLE_SIZE)
+        self._counters = {
+            "admitted": 0,
+            "queued": 0,
+            "rejected_queue_full": 0,
+            "rejected_timeout": 0,
+            "completed": 0,
+        }
+
+    async def acquire(self, user_id: str) -> AdmissionTicket:
+        """Wait for a slot for ``user_id``.
+
+        Raises:
+            AdmissionRejectedError: The queue is full or the deadline passed
+        """
+        started = time.perf_counter()
+
+        if self._in_flight < self.max_in_flight and not self._queued:
+            self._in_flight += 1
+            return self._admit(user_id, started)
+
+        user_waiters = self._waiters.get(user_id)
+        if self._queued >= self.max_queue:
+            self._counters["rejected_queue_full"] += 1
+            raise AdmissionRejectedError("Too many queued requests", self.retry_after())
+        if user_waiters is not None and len(user_waiters) >= self.max_queued_per_user:
+            self._counters["rejected_queue_full"] += 1
+            raise AdmissionRejectedError(
+                f"Too many queued requests for user {user_id}", self.retry_after()
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(user_id, deque()).append(waiter)
+        self._queued += 1
+        self._counters["queued"] += 1
+
+        try:
+            await asyncio.wait_for(waiter, timeout=self.queue_timeout_seconds)
+        except asyncio.TimeoutError:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over as the deadline passed; keep it
+                # rather than leaking it
+                return self._admit(user_id, started)
+            self._counters["rejected_timeout"] += 1
+            logger.warning(
+                f"Request for user {user_id} waited {self.queue_timeout_seconds}s without a slot"
+            )
+            raise AdmissionRejectedError(
+                "Timed out waiting for capacity", self.retry_after()
+            ) from None
+        except BaseException:
+            # Cancelled while a slot was being handed over; pass it on
+            if waiter.done() and not waiter.cancelled():
+                self._release(None)
+            raise
+        finally:
+            self._discard_waiter(user_id, waiter)
+
+        # The slot was handed over by _release, in_flight already counts it
+        return self._admit(user_id, started)
+
+    def _admit(self, user_id: str, started: float) -> AdmissionTicket:
+        self._counters["admitted"] += 1
+        self._wait_times.append(time.perf_counter() - started)
+        return AdmissionTicket(self, user_id)
+
+    def _discard_waiter(self, user_id: str, waiter: asyncio.Future) -> None:
+        """Remove a waiter that gave up or was granted from the queue."""
+        user_waiters = self._waiters.get(user_id)
+        if user_waiters is None or waiter not in user_waiters:
+            return
+        user_waiters.remove(waiter)
+        self._queued -= 1
+        if not user_waiters:
+            del self._waiters[user_id]
+
+    def _release(self, service_time: Optional[float]) -> None:
+        """Hand the slot to the next waiting user, or free it."""
+        if service_time is not None:
+            self._counters["completed"] += 1
+            self._service_times.append(service_time)
+
+        while self._waiters:
+            user_id, user_waiters = next(iter(self._waiters.items()))
+            waiter = user_waiters.popleft()
+            self._queued -= 1
+            if user_waiters:
+                # Round robin: this user goes to the back of the line
+                self._waiters.move_to_end(user_id)
+            else:
+                del self._waiters[user_id]
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._in_flight -= 1
+
+    def retry_after(self) -> int:
+        """Estimate in seconds until a new request could be served."""
+        service = _mean(self._service_times) or 1.0
+        rounds = (self._queued + 1) / max(1, self.max_in_flight)
+        return max(1, math.ceil(service * rounds))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return occupancy, counters and wait/service time summaries."""
+        return {
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": self._queued,
+            "max_queue": self.max_queue,
+            "queued_users": len(self._waiters),
+            **self._counters,
+            "wait_seconds": _summarize(self._wait_times),
+            "service_seconds": _summarize(self._service_times),
+        }
+
+
+def _mean(samples: Deque[float]) -> float:
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def _summarize(samples: Deque[float]) -> Dict[str, float]:
+    """Mean, median and 95th percentile of recent samples."""
+    if not samples:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0}
+    ordered = sorted(samples)
+    return {
+        "mean": round(_mean(samples), 3),
+        "p50": round(ordered[len(ordered) // 2], 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
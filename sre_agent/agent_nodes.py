@@ -4,17 +4,22 @@ import asyncio
 import logging
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import yaml
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.tools import BaseTool
 from langgraph.prebuilt import create_react_agent
 
 from .agent_state import AgentState
 from .constants import AgentMetadata
-from .llm_utils import create_llm_with_error_handling
-from .memory import SREMemoryClient, create_conversation_memory_manager
+from .context_window import ContextWindowManager, summarize_token_usage
+from .llm_utils import get_llm
+from .memory import (
+    SREMemoryClient,
+    create_conversation_memory_manager,
+    get_memory_client,
+)
 from .prompt_loader import prompt_loader
 
 # Logging will be configured by the main entry point
@@ -30,8 +35,8 @@ def _load_agent_config() -> Dict[str, Any]:
 
 
 def _create_llm(provider: str = "bedrock", **kwargs):
-    """Create LLM instance with improved error handling."""
-    return create_llm_with_error_handling(provider, **kwargs)
+    """Return the shared LLM instance for this configuration."""
+    return get_llm(provider, **kwargs)
 
 
 def _filter_tools_for_agent(
@@ -88,6 +93,7 @@ class BaseAgentNode:
         tools: List[BaseTool],
         llm_provider: str = "bedrock",
         agent_metadata: AgentMetadata = None,
+        memory_client: Optional[SREMemoryClient] = None,
         **llm_kwargs,
     ):
         # Use agent_metadata if provided, otherwise fall back to individual parameters
@@ -106,6 +112,7 @@ class BaseAgentNode:
         self.tools = tools
         self.llm_provider = llm_provider
         self.llm_kwargs = llm_kwargs  # Store for later use in memory client creation
+        self.memory_client = memory_client
 
         logger.info(
             f"Initializing {self.name} with LLM provider: {llm_provider}, actor_id: {self.actor_id}, tools: {[tool.name for tool in tools]}"
@@ -115,6 +122,21 @@ class BaseAgentNode:
         # Create the react agent
         self.agent = create_react_agent(self.llm, self.tools)
 
+        # Builds the agent's LLM input from a token budget instead of the full history
+        self.context_window = ContextWindowManager()
+
+    def _get_memory_client(self) -> SREMemoryClient:
+        """Return the injected memory client, or the shared one for this region."""
+        if self.memory_client is None:
+            # Get region from llm_kwargs if available
+            region = (
+                self.llm_kwargs.get("region_name", "us-east-1")
+                if self.llm_provider == "bedrock"
+                else "us-east-1"
+            )
+            self.memory_client = get_memory_client(region=region)
+        return self.memory_client
+
     def _get_system_prompt(self) -> str:
         """Get system prompt for this agent using prompt loader."""
         try:
@@ -177,11 +199,8 @@ class BaseAgentNode:
             user_id = state.get("user_id")
             if user_id:
                 try:
-                    # Get region from llm_kwargs if available
-                    region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
                     conversation_manager = create_conversation_memory_manager(
-                        memory_client
+                        self._get_memory_client()
                     )
                     logger.info(
                         f"{self.name} - Initialized conversation memory manager for user: {user_id}"
@@ -195,9 +214,16 @@ class BaseAgentNode:
                     f"{self.name} - No user_id found in state, skipping conversation memory"
                 )
 
-            # Add system prompt and user prompt
+            # Add system prompt, a bounded slice of the history and the user prompt
             system_message = SystemMessage(content=self._get_system_prompt())
-            user_message = HumanMessage(content=agent_prompt)
+            agent_input, input_tokens = self.context_window.build(
+                agent_name=self.name,
+                system_message=system_message,
+                task=agent_prompt,
+                history=messages,
+                agent_results=state.get("agent_results", {}),
+                own_trace=(state.get("traces") or {}).get(self.name, []),
+            )
 
             # Stream the agent execution to capture tool calls with timeout
             logger.info(f"{self.name} - Starting agent execution")
@@ -209,12 +235,8 @@ class BaseAgentNode:
                 async def execute_agent():
                     nonlocal agent_response  # Fix scope issue - allow access to outer variable
                     chunk_count = 0
-                    logger.info(
-                        f"{self.name} - Executing agent with {[system_message] + messages + [user_message]}"
-                    )
-                    async for chunk in self.agent.astream(
-                        {"messages": [system_message] + messages + [user_message]}
-                    ):
+                    logger.debug(f"{self.name} - Executing agent with {agent_input}")
+                    async for chunk in self.agent.astream({"messages": agent_input}):
                         chunk_count += 1
                         logger.info(
                             f"{self.name} - Processing chunk #{chunk_count}: {list(chunk.keys())}"
@@ -376,11 +398,7 @@ class BaseAgentNode:
                     # Check if memory hooks are available through the memory client
                     from .memory.hooks import MemoryHookProvider
 
-                    # Use the SREMemoryClient that's already imported at the top
-                    # Get region from llm_kwargs if available
-                    region = self.llm_kwargs.get("region_name", "us-east-1") if self.llm_provider == "bedrock" else "us-east-1"
-                    memory_client = SREMemoryClient(region=region)
-                    memory_hooks = MemoryHookProvider(memory_client)
+                    memory_hooks = MemoryHookProvider(self._get_memory_client())
 
                     # Create response object for hooks
                     response_obj = {
@@ -409,28 +427,37 @@ class BaseAgentNode:
                         f"{self.name} - Failed to process agent response for memory patterns: {e}"
                     )
 
-            # Update state with streaming info
+            token_usage = {
+                "estimated_input_tokens": input_tokens,
+                **summarize_token_usage(all_messages),
+            }
+            logger.info(f"{self.name} - Token usage: {token_usage}")
+
+            # Only the agent's final answer joins the conversation; its tool
+            # traffic goes to the traces channel
+            final_messages = [
+                msg
+                for msg in all_messages
+                if isinstance(msg, AIMessage) and not msg.tool_calls
+            ][-1:]
+
+            # Update state with streaming info. Only this agent's own entries are
+            # returned; the state reducers merge them, so agents can run in parallel
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: agent_response,
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
-                "messages": messages + all_messages,
+                "agent_results": {self.name: agent_response},
+                "agents_invoked": [self.name],
+                "messages": final_messages,
+                "traces": {self.name: all_messages},
                 "metadata": {
-                    **state.get("metadata", {}),
-                    f"{self.name.replace(' ', '_')}_trace": all_messages,
+                    f"{self.name.replace(' ', '_')}_token_usage": token_usage,
                 },
             }
 
         except Exception as e:
             logger.error(f"Error in {self.name}: {e}")
             return {
-                "agent_results": {
-                    **state.get("agent_results", {}),
-                    self.name: f"Error: {str(e)}",
-                },
-                "agents_invoked": state.get("agents_invoked", []) + [self.name],
+                "agent_results": {self.name: f"Error: {str(e)}"},
+                "agents_invoked": [self.name],
             }
 
 
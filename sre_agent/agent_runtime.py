@@ -1,22 +1,34 @@
 #!/usr/bin/env python3
 
 import asyncio
+import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import FastAPI, HTTPException
-from langchain_core.messages import HumanMessage
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from langchain_core.messages import AIMessageChunk, HumanMessage
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 
+from .admission import AdmissionController, AdmissionRejectedError, AdmissionTicket
 from .agent_state import AgentState
 from .constants import SREConstants
 
 # Import logging config
+from .llm_utils import llm_client_stats
 from .logging_config import configure_logging
+from .memory.registry import flush_memory_clients
 from .multi_agent_langgraph import create_multi_agent_system
+from .plan_cache import plan_cache_stats
+from .tool_cache import (
+    investigation_stats,
+    start_investigation_tracking,
+    tool_cache_stats,
+)
 
 # Configure logging based on DEBUG environment variable
 # This ensures debug mode works even when not run via __main__
@@ -60,6 +72,21 @@ class InvocationResponse(BaseModel):
 agent_graph = None
 tools: list[BaseTool] = []
 
+# Agent nodes whose completions are reported while streaming
+AGENT_NODES = ["kubernetes_agent", "logs_agent", "metrics_agent", "runbooks_agent"]
+
+SSE_MEDIA_TYPE = "text/event-stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Bounds concurrent invocations so bursts queue instead of fanning out
+# unbounded LLM and MCP traffic
+admission = AdmissionController(
+    max_in_flight=int(os.getenv("MAX_CONCURRENT_INVOCATIONS", "4")),
+    max_queue=int(os.getenv("MAX_QUEUED_INVOCATIONS", "16")),
+    queue_timeout_seconds=float(os.getenv("INVOCATION_QUEUE_TIMEOUT", "60")),
+    max_queued_per_user=int(os.getenv("MAX_QUEUED_INVOCATIONS_PER_USER", "0")) or None,
+)
+
 
 async def initialize_agent():
     """Initialize the SRE agent system using the same method as CLI."""
@@ -81,14 +108,25 @@ async def initialize_agent():
 
         logger.info(f"Environment LLM_PROVIDER: {os.getenv('LLM_PROVIDER', 'NOT_SET')}")
         logger.info(f"Using LLM provider: {provider}")
-        logger.info(f"Calling create_multi_agent_system with provider: {provider}")
+        # Run independent plan steps concurrently when PARALLEL_AGENTS is set
+        parallel_execution = os.getenv("PARALLEL_AGENTS", "false").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
+        logger.info(
+            f"Calling create_multi_agent_system with provider: {provider}, parallel execution: {parallel_execution}"
+        )
 
         # Create multi-agent system using the same function as CLI
-        agent_graph, tools = await create_multi_agent_system(provider)
+        agent_graph, tools = await create_multi_agent_system(
+            provider, parallel_execution=parallel_execution
+        )
 
         logger.info(
             f"SRE Agent system initialized successfully with {len(tools)} tools"
         )
+        logger.info(f"LLM clients: {llm_client_stats()}")
 
     except Exception as e:
         from .llm_utils import LLMAccessError, LLMAuthenticationError, LLMProviderError
@@ -111,13 +149,192 @@ async def startup_event():
     await initialize_agent()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Persist memory writes still queued in the background."""
+    await flush_memory_clients(timeout=30)
+
+
+def _create_initial_state(
+    user_prompt: str, session_id: str, user_id: str
+) -> AgentState:
+    """Create the initial graph state exactly like the CLI does."""
+    return {
+        "messages": [HumanMessage(content=user_prompt)],
+        "next": "supervisor",
+        "agent_results": {},
+        "current_query": user_prompt,
+        "metadata": {},
+        "requires_collaboration": False,
+        "agents_invoked": [],
+        "final_response": None,
+        "auto_approve_plan": True,  # Always auto-approve plans in runtime mode
+        "session_id": session_id,  # Required for memory retrieval
+        "user_id": user_id,  # Required for user personalization
+    }
+
+
+def _streaming_media_type(request: InvocationRequest, accept: str) -> Optional[str]:
+    """Return the streaming media type the caller asked for, if any.
+
+    Streaming is requested with an ``Accept: text/event-stream`` or
+    ``Accept: application/x-ndjson`` header, or with ``"stream": true`` in the
+    input (served as Server-Sent Events).
+    """
+    if NDJSON_MEDIA_TYPE in accept:
+        return NDJSON_MEDIA_TYPE
+    if SSE_MEDIA_TYPE in accept or request.input.get("stream"):
+        return SSE_MEDIA_TYPE
+    return None
+
+
+def _chunk_text(chunk: AIMessageChunk) -> str:
+    """Extract the text of a streamed message chunk."""
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(
+        block.get("text", "")
+        for block in chunk.content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+async def _stream_agent_events(
+    initial_state: AgentState,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run the agent graph, yielding progress events as they happen.
+
+    Event types, in order of appearance: ``plan`` (the supervisor's
+    investigation plan), ``routing`` (each supervisor decision), ``token``
+    (LLM output as it is generated, tagged with the node producing it),
+    ``agent_complete`` (an agent's result) and finally ``final`` carrying the
+    aggregated response along with the investigation's tool cache statistics.
+    """
+    final_response = ""
+    plan_sent = False
+    tool_cache_counters = start_investigation_tracking()
+
+    async for mode, chunk in agent_graph.astream(
+        initial_state, stream_mode=["updates", "messages"]
+    ):
+        if mode == "messages":
+            message, message_metadata = chunk
+            if isinstance(message, AIMessageChunk):
+                text = _chunk_text(message)
+                if text:
+                    yield {
+                        "type": "token",
+                        "node": message_metadata.get("langgraph_node", ""),
+                        "content": text,
+                    }
+            continue
+
+        for node_name, node_output in chunk.items():
+            node_output = node_output or {}
+            logger.info(f"Processing node: {node_name}")
+
+            if node_name == "supervisor":
+                metadata = node_output.get("metadata", {})
+                if metadata.get("investigation_plan") and not plan_sent:
+                    plan_sent = True
+                    yield {
+                        "type": "plan",
+                        "plan": metadata["investigation_plan"],
+                        "plan_text": metadata.get("plan_text", ""),
+                    }
+                yield {
+                    "type": "routing",
+                    "next": node_output.get("next_agents")
+                    or node_output.get("next", ""),
+                    "reasoning": metadata.get("routing_reasoning", ""),
+                }
+
+            elif node_name in AGENT_NODES:
+                logger.info(f"{node_name} completed with results")
+                yield {
+                    "type": "agent_complete",
+                    "agent": node_name,
+                    "results": node_output.get("agent_results", {}),
+                }
+
+            elif node_name == "aggregate":
+                final_response = node_output.get("final_response", "")
+                logger.info("Aggregate node completed, final response captured")
+
+    if not final_response:
+        logger.warning("No final response received from agent graph")
+        final_response = (
+            "I encountered an issue processing your request. Please try again."
+        )
+
+    tool_cache = investigation_stats(tool_cache_counters)
+    logger.info(f"Tool result cache for this investigation: {tool_cache}")
+
+    yield {
+        "type": "final",
+        "message": final_response,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "model": SREConstants.app.agent_model_name,
+        "tool_cache": tool_cache,
+    }
+
+
+async def _stream_invocation(
+    initial_state: AgentState, media_type: str, ticket: AdmissionTicket
+) -> AsyncIterator[str]:
+    """Serialize agent events as Server-Sent Events or NDJSON lines.
+
+    The admission slot is held until the stream ends.
+    """
+
+    def _encode(event: Dict[str, Any]) -> str:
+        data = json.dumps(event, default=str)
+        if media_type == SSE_MEDIA_TYPE:
+            return f"event: {event['type']}\ndata: {data}\n\n"
+        return f"{data}\n"
+
+    # Sent before planning starts so callers see the connection is live
+    yield _encode({"type": "start", "session_id": initial_state.get("session_id")})
+    try:
+        async for event in _stream_agent_events(initial_state):
+            yield _encode(event)
+        logger.info("Successfully streamed agent response")
+    except Exception as e:
+        # The status line has already been sent, so report the error in-band
+        logger.error(f"Agent processing failed: {e}")
+        logger.exception("Full exception details:")
+        yield _encode({"type": "error", "detail": f"Agent processing failed: {e}"})
+    finally:
+        ticket.release()
+
+
 @app.post("/invocations", response_model=InvocationResponse)
-async def invoke_agent(request: InvocationRequest):
-    """Main agent invocation endpoint."""
+async def invoke_agent(request: InvocationRequest, http_request: Request):
+    """Main agent invocation endpoint.
+
+    Returns a single JSON body by default. Callers asking for
+    ``text/event-stream`` or ``application/x-ndjson`` get the plan, agent
+    completions and LLM tokens streamed as they are produced instead.
+
+    Requests beyond the configured concurrency wait for a slot; when the wait
+    queue is full or the wait times out the response is 429 with Retry-After.
+    """
     global agent_graph, tools
 
     logger.info("Received invocation request")
 
+    user_id = request.input.get("user_id", "default_user")
+    try:
+        ticket = await admission.acquire(user_id)
+    except AdmissionRejectedError as e:
+        logger.warning(f"Rejecting invocation for user {user_id}: {e.reason}")
+        raise HTTPException(
+            status_code=429,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+    streaming = False
     try:
         # Ensure agent is initialized
         await initialize_agent()
@@ -132,31 +349,32 @@ async def invoke_agent(request: InvocationRequest):
 
         logger.info(f"Processing query: {user_prompt}")
 
-        # Extract session_id and user_id from request
+        # Extract session_id from request
         session_id = request.input.get("session_id", "")
-        user_id = request.input.get("user_id", "default_user")
 
         logger.info(f"Session ID: {session_id}, User ID: {user_id}")
 
-        # Create initial state exactly like the CLI does
-        initial_state: AgentState = {
-            "messages": [HumanMessage(content=user_prompt)],
-            "next": "supervisor",
-            "agent_results": {},
-            "current_query": user_prompt,
-            "metadata": {},
-            "requires_collaboration": False,
-            "agents_invoked": [],
-            "final_response": None,
-            "auto_approve_plan": True,  # Always auto-approve plans in runtime mode
-            "session_id": session_id,  # Required for memory retrieval
-            "user_id": user_id,  # Required for user personalization
-        }
+        initial_state = _create_initial_state(user_prompt, session_id, user_id)
+
+        media_type = _streaming_media_type(
+            request, http_request.headers.get("accept", "")
+        )
+        if media_type:
+            logger.info(f"Streaming agent graph execution as {media_type}")
+            streaming = True
+            return StreamingResponse(
+                _stream_invocation(initial_state, media_type, ticket),
+                media_type=media_type,
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+                # Releases the slot if the stream never started
+                background=BackgroundTask(ticket.release),
+            )
 
         # Process through the agent graph exactly like the CLI
         final_response = ""
 
         logger.info("Starting agent graph execution")
+        tool_cache_counters = start_investigation_tracking()
 
         async for event in agent_graph.astream(initial_state):
             for node_name, node_output in event.items():
@@ -172,12 +390,7 @@ async def invoke_agent(request: InvocationRequest):
                             f"Routing reasoning: {metadata['routing_reasoning']}"
                         )
 
-                elif node_name in [
-                    "kubernetes_agent",
-                    "logs_agent",
-                    "metrics_agent",
-                    "runbooks_agent",
-                ]:
+                elif node_name in AGENT_NODES:
                     agent_results = node_output.get("agent_results", {})
                     logger.info(f"{node_name} completed with results")
 
@@ -193,6 +406,9 @@ async def invoke_agent(request: InvocationRequest):
             )
         else:
             logger.info(f"Final response length: {len(final_response)} characters")
+        logger.info(
+            f"Tool result cache for this investigation: {investigation_stats(tool_cache_counters)}"
+        )
 
         # Simple response format
         response_data = {
@@ -213,6 +429,20 @@ async def invoke_agent(request: InvocationRequest):
         raise HTTPException(
             status_code=500, detail=f"Agent processing failed: {str(e)}"
         )
+    finally:
+        if not streaming:
+            ticket.release()
+
+
+@app.get("/metrics")
+async def metrics():
+    """Admission control, LLM client reuse, plan and tool result cache metrics."""
+    return {
+        "admission": admission.stats(),
+        "llm_clients": llm_client_stats(),
+        "plan_cache": plan_cache_stats(),
+        "tool_cache": tool_cache_stats(),
+    }
 
 
 @app.get("/ping")
@@ -261,6 +491,10 @@ async def invoke_sre_agent_async(prompt: str, provider: str = "anthropic") -> st
         logger.error(f"Agent invocation failed: {e}")
         raise
 
+    finally:
+        # The event loop may end with this call, so write queued memory events now
+        await flush_memory_clients(timeout=30)
+
 
 def invoke_sre_agent(prompt: str, provider: str = "anthropic") -> str:
     """
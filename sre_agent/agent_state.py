@@ -16,6 +16,29 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def merge_dicts(
+    left: Dict[str, Any], right: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Reducer merging dict updates, so agents running in parallel can all write.
+
+    An update of None clears the channel, e.g. at the start of a new turn.
+    """
+    if right is None:
+        return {}
+    if not left:
+        return right or {}
+    if not right:
+        return left
+    return {**left, **right}
+
+
+def append_lists(left: List[Any], right: Optional[List[Any]]) -> List[Any]:
+    """Reducer appending list updates; an update of None clears the channel."""
+    if right is None:
+        return []
+    return (left or []) + right
+
+
 class AgentState(TypedDict):
     """State shared across all agents in the multi-agent system.
 
@@ -23,26 +46,36 @@ class AgentState(TypedDict):
     intermediate results, and routing information.
     """
 
-    # Conversation messages using LangGraph's message annotation
+    # Conversation messages using LangGraph's message annotation; nodes return
+    # only the messages they add
     messages: Annotated[List[BaseMessage], add_messages]
 
     # Which agent should act next (set by supervisor)
     next: Literal["kubernetes", "logs", "metrics", "runbooks", "FINISH"]
 
-    # Intermediate results from each agent
-    agent_results: Dict[str, Any]
+    # Agents to run concurrently in the next step (parallel execution mode)
+    next_agents: Optional[List[str]]
+
+    # Intermediate results from each agent, merged across agent updates
+    agent_results: Annotated[Dict[str, Any], merge_dicts]
 
     # Current query being processed
     current_query: Optional[str]
 
-    # Metadata about the conversation
-    metadata: Dict[str, Any]
+    # Metadata about the conversation, merged across agent updates; nodes
+    # return only the keys they change
+    metadata: Annotated[Dict[str, Any], merge_dicts]
+
+    # Each agent's full message trace (tool calls and results) from its latest
+    # run, by agent name. Kept out of messages and metadata so it is stored by
+    # reference and never copied into later agents' context
+    traces: Annotated[Dict[str, List[BaseMessage]], merge_dicts]
 
     # Flag to indicate if we need multiple agents
     requires_collaboration: bool
 
-    # List of agents that have already responded
-    agents_invoked: List[str]
+    # List of agents that have already responded; agents append their own name
+    agents_invoked: Annotated[List[str], append_lists]
 
     # Final aggregated response (set by supervisor)
     final_response: Optional[str]
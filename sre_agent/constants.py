@@ -85,6 +85,13 @@ class TimeoutConfig(BaseModel):
         description="Maximum time to wait for MCP tools loading",
     )
 
+    executive_summary_timeout_seconds: int = Field(
+        default=60,
+        ge=1,
+        le=600,
+        description="Maximum time to wait for the LLM executive summary before using the fallback summary",
+    )
+
 
 class PromptConfig(BaseModel):
     """Prompt configuration constants."""
@@ -201,6 +208,12 @@ class MemoryConfig(BaseModel):
         description="Maximum number of past investigation memories to retrieve",
     )
 
+    retrieval_timeout_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Deadline for each memory retrieval when investigation context is gathered concurrently; retrievals that miss it are skipped",
+    )
+
     # Content length limits for memory storage
     max_content_length: int = Field(
         default=9000,
@@ -210,6 +223,69 @@ class MemoryConfig(BaseModel):
     )
 
 
+class ContextWindowConfig(BaseModel):
+    """Token budgets for the input each agent sends to its LLM."""
+
+    agent_input_token_budget: int = Field(
+        default=12000,
+        ge=1000,
+        description="Approximate token budget for an agent's input messages, including system and user prompts",
+    )
+
+    max_history_turns: int = Field(
+        default=3,
+        ge=0,
+        le=25,
+        description="Most recent conversation turns (a user message and the answers to it) given to an agent",
+    )
+
+    max_result_tokens: int = Field(
+        default=800,
+        ge=50,
+        description="Approximate token cap on each prior agent's result summarized for the next agent",
+    )
+
+    max_tool_result_tokens: int = Field(
+        default=400,
+        ge=50,
+        description="Approximate token cap on each of the agent's own earlier tool results",
+    )
+
+
+class PlanningConfig(BaseModel):
+    """Investigation planning and plan cache configuration."""
+
+    planning_mode: str = Field(
+        default="structured",
+        pattern="^(structured|react)$",
+        description="'structured' creates the plan in one structured-output LLM call over the pre-fetched memory context; 'react' uses a planning agent that can call the memory tools (overridden by the PLANNING_MODE environment variable)",
+    )
+
+    plan_cache_ttl_seconds: float = Field(
+        default=900.0,
+        ge=0,
+        description="Seconds a cached investigation plan is reused; 0 disables the plan cache",
+    )
+
+    plan_cache_max_entries: int = Field(
+        default=128,
+        ge=0,
+        description="Investigation plans kept before the least recently used is evicted",
+    )
+
+    plan_cache_near_duplicates: bool = Field(
+        default=False,
+        description="Also reuse plans of queries that are near-duplicates (MinHash similarity) of the new query",
+    )
+
+    plan_cache_similarity_threshold: float = Field(
+        default=0.85,
+        ge=0.5,
+        le=1.0,
+        description="Minimum estimated Jaccard similarity for a near-duplicate plan cache hit",
+    )
+
+
 class AgentsConstant(BaseModel):
     """Agent-specific constants for the SRE system."""
 
@@ -309,6 +385,8 @@ class SREConstants:
     app: ApplicationConfig = ApplicationConfig()
     agents: AgentsConstant = AgentsConstant()
     memory: MemoryConfig = MemoryConfig()
+    context: ContextWindowConfig = ContextWindowConfig()
+    planning: PlanningConfig = PlanningConfig()
 
     @classmethod
     def get_model_config(cls, provider: str, **kwargs) -> dict:
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+
+from .constants import SREConstants
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Rough characters per token, matching count_tokens_approximately
+_CHARS_PER_TOKEN = 4
+
+
+def count_tokens(messages: Sequence[BaseMessage]) -> int:
+    """Approximate the number of tokens the messages will use."""
+    return count_tokens_approximately(messages)
+
+
+def _truncate(text: str, max_tokens: int) -> str:
+    """Cut text down to roughly ``max_tokens`` tokens."""
+    max_chars = max(0, max_tokens * _CHARS_PER_TOKEN)
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "... [truncated]"
+
+
+def _text(message: BaseMessage) -> str:
+    """Text content of a message, joining content blocks."""
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in message.content
+    )
+
+
+class ContextWindowManager:
+    """Builds the input messages an agent sends to its LLM within a token budget.
+
+    Instead of replaying the full graph history, an agent gets:
+
+    - its system prompt,
+    - the last few conversation turns (user questions and final answers, no
+      tool traffic),
+    - a summary of what the other agents have found so far, and
+    - the results of its own earlier tool calls,
+
+    followed by its task. Sections are filled in that order until the budget
+    runs out; oversized entries are truncated.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        max_history_turns: Optional[int] = None,
+        max_result_tokens: Optional[int] = None,
+        max_tool_result_tokens: Optional[int] = None,
+    ):
+        config = SREConstants.context
+        self.token_budget = token_budget or config.agent_input_token_budget
+        self.max_history_turns = (
+            config.max_history_turns if max_history_turns is None else max_history_turns
+        )
+        self.max_result_tokens = max_result_tokens or config.max_result_tokens
+        self.max_tool_result_tokens = (
+            max_tool_result_tokens or config.max_tool_result_tokens
+        )
+
+    def build(
+        self,
+        agent_name: str,
+        system_message: SystemMessage,
+        task: str,
+        history: Sequence[BaseMessage],
+        agent_results: Dict[str, Any],
+        own_trace: Sequence[BaseMessage] = (),
+    ) -> Tuple[List[BaseMessage], Dict[str, int]]:
+        """Build the agent's input messages.
+
+        Args:
+            agent_name: Name of the agent the input is for
+            system_message: The agent's system prompt
+            task: The agent's instructions for this step
+            history: Conversation messages from the graph state
+            agent_results: Results of the agents that already ran, by agent name
+            own_trace: Messages from this agent's earlier runs
+
+        Returns:
+            The messages to send and the approximate tokens used per section
+        """
+        remaining = self.token_budget - count_tokens(
+            [system_message, HumanMessage(content=task)]
+        )
+
+        other_results = {
+            name: result
+            for name, result in agent_results.items()
+            if name != agent_name and result
+        }
+
+        turns, turn_tokens = self._recent_turns(
+            history, set(map(str, other_results.values())), remaining
+        )
+        remaining -= turn_tokens
+
+        findings, findings_tokens = self._sections(
+            "Findings from other agents so far",
+            [(name, str(result)) for name, result in other_results.items()],
+            self.max_result_tokens,
+            remaining,
+        )
+        remaining -= findings_tokens
+
+        tool_results, tool_tokens = self._sections(
+            "Results of your earlier tool calls",
+            [
+                (getattr(msg, "name", None) or "tool", _text(msg))
+                for msg in own_trace
+                if isinstance(msg, ToolMessage)
+            ],
+            self.max_tool_result_tokens,
+            remaining,
+        )
+
+        content = "\n\n".join(part for part in (findings, tool_results, task) if part)
+        messages = [system_message, *turns, HumanMessage(content=content)]
+
+        token_counts = {
+            "history": turn_tokens,
+            "findings": findings_tokens,
+            "own_tool_results": tool_tokens,
+            "total": count_tokens(messages),
+        }
+        logger.info(
+            f"{agent_name} - Context window: {len(turns)} history messages, {len(other_results)} prior agent results, ~{token_counts['total']} tokens (budget {self.token_budget})"
+        )
+        return messages, token_counts
+
+    def _recent_turns(
+        self, history: Sequence[BaseMessage], skip_contents: set, budget: int
+    ) -> Tuple[List[BaseMessage], int]:
+        """Pick the messages of the newest turns that fit the budget.
+
+        A turn is a user message and the assistant answers that follow it.
+        """
+        turns: List[BaseMessage] = []
+        used = 0
+        turn_count = 0
+        for message in reversed(history):
+            if turn_count >= self.max_history_turns:
+                break
+            if isinstance(message, HumanMessage):
+                turn_count += 1
+            elif isinstance(message, AIMessage) and not message.tool_calls:
+                # Agent results are summarized separately
+                if _text(message) in skip_contents or not _text(message):
+                    continue
+            else:
+                continue
+
+            tokens = count_tokens([message])
+            if used + tokens > budget:
+                break
+            turns.append(message)
+            used += tokens
+
+        turns.reverse()
+        # Providers expect the conversation to open with a user message
+        while turns and not isinstance(turns[0], HumanMessage):
+            used -= count_tokens([turns.pop(0)])
+        return turns, used
+
+    def _sections(
+        self,
+        heading: str,
+        entries: List[Tuple[str, str]],
+        max_entry_tokens: int,
+        budget: int,
+    ) -> Tuple[str, int]:
+        """Render titled entries under a heading, truncated to fit the budget."""
+        if not entries or budget <= 0:
+            return "", 0
+
+        lines = [f"{heading}:"]
+        used = count_tokens([HumanMessage(content=lines[0])])
+        for title, text in entries:
+            allowed = min(max_entry_tokens, budget - used)
+            if allowed <= 0:
+                break
+            section = f"### {title}\n{_truncate(text, allowed)}"
+            lines.append(section)
+            used += len(section) // _CHARS_PER_TOKEN + 1
+
+        if len(lines) == 1:
+            return "", 0
+        return "\n\n".join(lines), used
+
+
+def summarize_token_usage(messages: Sequence[BaseMessage]) -> Dict[str, int]:
+    """Sum the provider-reported token usage of the LLM calls in ``messages``."""
+    usage = {"llm_calls": 0, "input_tokens": 0, "output_tokens": 0}
+    for message in messages:
+        metadata = getattr(message, "usage_metadata", None)
+        if isinstance(message, AIMessage) and metadata:
+            usage["llm_calls"] += 1
+            usage["input_tokens"] += metadata.get("input_tokens", 0)
+            usage["output_tokens"] += metadata.get("output_tokens", 0)
+    return usage
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 import logging
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from langchain_core.messages import HumanMessage
 from langchain_core.tools import BaseTool
@@ -15,6 +15,7 @@ from .agent_nodes import (
 )
 from .agent_state import AgentState
 from .constants import SREConstants
+from .memory import SREMemoryClient
 from .supervisor import SupervisorAgent
 
 # Configure logging with basicConfig
@@ -43,27 +44,42 @@ def _should_continue(state: AgentState) -> Literal["supervisor", "FINISH"]:
     return "supervisor"
 
 
-def _route_supervisor(state: AgentState) -> str:
-    """Route from supervisor to the appropriate agent or finish."""
+# Map to actual node names - handle both old short names and new full names
+_AGENT_NODES = {
+    "kubernetes": "kubernetes_agent",
+    "logs": "logs_agent",
+    "metrics": "metrics_agent",
+    "runbooks": "runbooks_agent",
+    # Also handle the new full names directly
+    "kubernetes_agent": "kubernetes_agent",
+    "logs_agent": "logs_agent",
+    "metrics_agent": "metrics_agent",
+    "runbooks_agent": "runbooks_agent",
+}
+
+
+def _route_supervisor(state: AgentState) -> Union[str, List[str]]:
+    """Route from supervisor to the appropriate agent(s) or finish.
+
+    In parallel execution mode the supervisor lists every agent that can run now
+    in ``next_agents``; returning all of them fans out to those nodes within the
+    same graph step.
+    """
     next_agent = state.get("next", "FINISH")
 
     if next_agent == "FINISH":
         return "aggregate"
 
-    # Map to actual node names - handle both old short names and new full names
-    agent_map = {
-        "kubernetes": "kubernetes_agent",
-        "logs": "logs_agent",
-        "metrics": "metrics_agent",
-        "runbooks": "runbooks_agent",
-        # Also handle the new full names directly
-        "kubernetes_agent": "kubernetes_agent",
-        "logs_agent": "logs_agent",
-        "metrics_agent": "metrics_agent",
-        "runbooks_agent": "runbooks_agent",
-    }
+    next_agents = state.get("next_agents")
+    if next_agents:
+        nodes = list(
+            dict.fromkeys(
+                _AGENT_NODES[agent] for agent in next_agents if agent in _AGENT_NODES
+            )
+        )
+        return nodes or "aggregate"
 
-    return agent_map.get(next_agent, "aggregate")
+    return _AGENT_NODES.get(next_agent, "aggregate")
 
 
 async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
@@ -77,12 +93,15 @@ async def _prepare_initial_state(state: AgentState) -> Dict[str, Any]:
             current_query = msg.content
             break
 
+    # None clears the merged channels, so nothing carries over from a
+    # previous turn when the graph runs with a checkpointer
     return {
         "current_query": current_query,
-        "agent_results": {},
-        "agents_invoked": [],
+        "agent_results": None,
+        "agents_invoked": None,
         "requires_collaboration": False,
-        "metadata": {},
+        "metadata": None,
+        "traces": None,
     }
 
 
@@ -92,6 +111,8 @@ def build_multi_agent_graph(
     force_delete_memory: bool = False,
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
+    parallel_execution: bool = False,
+    memory_client: Optional[SREMemoryClient] = None,
     **llm_kwargs,
 ) -> StateGraph:
     """Build the multi-agent collaboration graph.
@@ -102,19 +123,27 @@ def build_multi_agent_graph(
         force_delete_memory: Whether to force delete existing memory
         export_graph: Whether to export the graph as a Mermaid diagram
         graph_output_path: Path to save the exported Mermaid diagram (default: ./docs/sre_agent_architecture.md)
+        parallel_execution: Run independent plan steps concurrently instead of one agent at a time
+        memory_client: Shared memory client for the supervisor and all agents
         **llm_kwargs: Additional arguments for LLM
 
     Returns:
         Compiled StateGraph for multi-agent collaboration
     """
-    logger.info("Building multi-agent collaboration graph")
+    logger.info(
+        f"Building multi-agent collaboration graph (parallel execution: {parallel_execution})"
+    )
 
     # Create the state graph
     workflow = StateGraph(AgentState)
 
     # Create supervisor
     supervisor = SupervisorAgent(
-        llm_provider=llm_provider, force_delete_memory=force_delete_memory, **llm_kwargs
+        llm_provider=llm_provider,
+        force_delete_memory=force_delete_memory,
+        parallel_execution=parallel_execution,
+        memory_client=memory_client,
+        **llm_kwargs,
     )
 
     # Create agent nodes with filtered tools and metadata from constants
@@ -122,24 +151,28 @@ def build_multi_agent_graph(
         tools,
         agent_metadata=SREConstants.agents.agents["kubernetes"],
         llm_provider=llm_provider,
+        memory_client=memory_client,
         **llm_kwargs,
     )
     logs_agent = create_logs_agent(
         tools,
         agent_metadata=SREConstants.agents.agents["logs"],
         llm_provider=llm_provider,
+        memory_client=memory_client,
         **llm_kwargs,
     )
     metrics_agent = create_metrics_agent(
         tools,
         agent_metadata=SREConstants.agents.agents["metrics"],
         llm_provider=llm_provider,
+        memory_client=memory_client,
         **llm_kwargs,
     )
     runbooks_agent = create_runbooks_agent(
         tools,
         agent_metadata=SREConstants.agents.agents["runbooks"],
         llm_provider=llm_provider,
+        memory_client=memory_client,
         **llm_kwargs,
     )
 
@@ -171,7 +204,9 @@ def build_multi_agent_graph(
         },
     )
 
-    # Add edges from agents back to supervisor
+    # Add edges from agents back to supervisor. When several agents run in the
+    # same step, the supervisor runs once after all of them finish, which joins
+    # their results before the next batch or aggregate
     workflow.add_edge("kubernetes_agent", "supervisor")
     workflow.add_edge("logs_agent", "supervisor")
     workflow.add_edge("metrics_agent", "supervisor")
@@ -188,21 +223,26 @@ def build_multi_agent_graph(
         try:
             # Create docs directory if it doesn't exist
             from pathlib import Path
+
             output_path = Path(graph_output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Get the Mermaid representation of the graph
             mermaid_diagram = compiled_graph.get_graph().draw_mermaid()
-            
+
             # Save to file
             with open(graph_output_path, "w") as f:
                 f.write("# SRE Agent Architecture\n\n")
                 f.write("```mermaid\n")
                 f.write(mermaid_diagram)
                 f.write("\n```\n")
-            
-            logger.info(f"Graph architecture (Mermaid) exported to: {graph_output_path}")
-            print(f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}")
+
+            logger.info(
+                f"Graph architecture (Mermaid) exported to: {graph_output_path}"
+            )
+            print(
+                f"✅ Graph architecture (Mermaid diagram) exported to: {graph_output_path}"
+            )
         except Exception as e:
             logger.error(f"Failed to export graph: {e}")
             print(f"❌ Failed to export graph: {e}")
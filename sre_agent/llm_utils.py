@@ -7,8 +7,12 @@ for authentication, access, and configuration issues.
 """
 
 import logging
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Tuple
 
+import boto3
+from botocore.config import Config
 from langchain_anthropic import ChatAnthropic
 from langchain_aws import ChatBedrock
 
@@ -17,6 +21,27 @@ from .constants import SREConstants
 logger = logging.getLogger(__name__)
 
 
+# Shared LLM instances keyed by (provider, model_id, region, temperature, max_tokens)
+_llm_clients: Dict[Tuple, Any] = {}
+
+# boto3 clients per (service, region), shared by every Bedrock LLM in the region
+_aws_clients: Dict[Tuple[str, str], Any] = {}
+
+_llm_lock = threading.Lock()
+_aws_lock = threading.Lock()
+_llm_stats = {
+    "created": 0,
+    "reused": 0,
+    "construction_seconds": 0.0,
+    "aws_clients_created": 0,
+    "aws_clients_reused": 0,
+}
+
+# Agents running in parallel share one runtime client, so allow more
+# concurrent connections than botocore's default of 10
+_BEDROCK_MAX_POOL_CONNECTIONS = 50
+
+
 class LLMProviderError(Exception):
     """Exception raised when LLM provider creation fails."""
 
@@ -83,6 +108,93 @@ def create_llm_with_error_handling(provider: str = "bedrock", **kwargs):
             raise LLMProviderError(error_msg) from e
 
 
+def get_llm(provider: str = "bedrock", **kwargs):
+    """Return a shared LLM instance for the provider and configuration.
+
+    LLMs are reused across the supervisor, agent nodes, output formatter and
+    requests whenever provider, model, region, temperature and max_tokens
+    match, so their clients and connection pools are created once. Accepts the
+    same arguments and raises the same errors as
+    ``create_llm_with_error_handling``.
+    """
+    if provider not in ["anthropic", "bedrock"]:
+        raise ValueError(
+            f"Unsupported provider: {provider}. Use 'anthropic' or 'bedrock'"
+        )
+
+    config = SREConstants.get_model_config(provider, **kwargs)
+    key = (
+        provider,
+        config["model_id"],
+        config.get("region_name"),
+        config["temperature"],
+        config["max_tokens"],
+    )
+
+    with _llm_lock:
+        llm = _llm_clients.get(key)
+        if llm is not None:
+            _llm_stats["reused"] += 1
+            logger.info(f"Reusing shared LLM client for {key}")
+            return llm
+
+        started = time.perf_counter()
+        llm = create_llm_with_error_handling(provider, **kwargs)
+        elapsed = time.perf_counter() - started
+
+        _llm_clients[key] = llm
+        _llm_stats["created"] += 1
+        _llm_stats["construction_seconds"] += elapsed
+        logger.info(f"Created shared LLM client for {key} in {elapsed:.3f}s")
+        return llm
+
+
+def llm_client_stats() -> Dict[str, Any]:
+    """Return LLM client creation and reuse counters.
+
+    ``estimated_seconds_saved`` is the average construction time multiplied by
+    the number of reuses.
+    """
+    with _llm_lock:
+        stats = dict(_llm_stats)
+        stats["clients"] = len(_llm_clients)
+        stats["aws_clients"] = len(_aws_clients)
+    average = (
+        stats["construction_seconds"] / stats["created"] if stats["created"] else 0.0
+    )
+    stats["estimated_seconds_saved"] = round(average * stats["reused"], 3)
+    stats["construction_seconds"] = round(stats["construction_seconds"], 3)
+    return stats
+
+
+def clear_llm_clients() -> None:
+    """Drop all shared LLM and AWS clients and reset their counters (used by tests)."""
+    with _llm_lock:
+        _llm_clients.clear()
+        _llm_stats.update(dict.fromkeys(_llm_stats, 0))
+    with _aws_lock:
+        _aws_clients.clear()
+
+
+def _get_aws_client(service_name: str, region_name: str):
+    """Return the shared boto3 client for a service and region."""
+    key = (service_name, region_name)
+    with _aws_lock:
+        client = _aws_clients.get(key)
+        if client is not None:
+            _llm_stats["aws_clients_reused"] += 1
+            return client
+
+        client = boto3.client(
+            service_name,
+            region_name=region_name,
+            config=Config(max_pool_connections=_BEDROCK_MAX_POOL_CONNECTIONS),
+        )
+        _aws_clients[key] = client
+        _llm_stats["aws_clients_created"] += 1
+        return client
+
+
 def _create_anthropic_llm(config: Dict[str, Any]):
     """Create Anthropic LLM instance."""
     return ChatAnthropic(
@@ -97,6 +209,9 @@ def _create_bedrock_llm(config: Dict[str, Any]):
     return ChatBedrock(
         model_id=config["model_id"],
         region_name=config["region_name"],
+        # Runtime and control-plane clients are shared within the region
+        client=_get_aws_client("bedrock-runtime", config["region_name"]),
+        bedrock_client=_get_aws_client("bedrock", config["region_name"]),
         model_kwargs={
             "temperature": config["temperature"],
             "max_tokens": config["max_tokens"],
@@ -7,6 +7,7 @@ from .conversation_manager import (
     ConversationMessage,
     create_conversation_memory_manager,
 )
+from .registry import clear_memory_clients, flush_memory_clients, get_memory_client
 from .strategies import (
     InfrastructureKnowledge,
     InvestigationSummary,
@@ -21,6 +22,9 @@ from .tools import (
 
 __all__ = [
     "SREMemoryClient",
+    "get_memory_client",
+    "flush_memory_clients",
+    "clear_memory_clients",
     "MemoryConfig",
     "UserPreference",
     "InfrastructureKnowledge",
@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from bedrock_agentcore.memory import MemoryClient
 
 from .config import _load_memory_config
+from .retrieval_cache import MemoryRetrievalCache
+from .write_queue import MemoryWriteQueue
 
 # Configure logging with basicConfig
 logging.basicConfig(
@@ -24,13 +28,54 @@ class SREMemoryClient:
         memory_name: str = "sre_agent_memory",
         region: str = "us-east-1",
         force_delete: bool = False,
+        lazy: bool = False,
     ):
+        """Create the client.
+
+        Args:
+            memory_name: Base name of the AgentCore memory resource
+            region: AWS region of the memory resource
+            force_delete: Delete and recreate an existing memory resource
+            lazy: Defer the control-plane setup (finding or creating the memory and
+                its strategies) until first use or ``ainitialize``
+        """
         self.client = MemoryClient(region_name=region)
         self.memory_name = memory_name
         self.config = _load_memory_config()
         self.memory_ids = {}
         self.force_delete = force_delete
-        self._initialize_memories()
+        self._memory_id: Optional[str] = None
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        # Events are written behind the caller's back by a background worker
+        self.write_queue = MemoryWriteQueue(self._create_event)
+        # Shared by everything using this client: supervisor, agents and tools
+        self.retrieval_cache = MemoryRetrievalCache(
+            max_entries=self.config.retrieval_cache_max_entries,
+            ttl_seconds=self.config.retrieval_cache_ttl_seconds,
+        )
+        if not lazy:
+            self._ensure_initialized()
+
+    @property
+    def memory_id(self) -> Optional[str]:
+        """ID of the memory resource, initializing the memory system on first access."""
+        self._ensure_initialized()
+        return self._memory_id
+
+    def _ensure_initialized(self) -> None:
+        """Run the control-plane setup exactly once."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                self._initialize_memories()
+                self._initialized = True
+
+    async def ainitialize(self) -> None:
+        """Run the control-plane setup in a worker thread, off the event loop."""
+        if not self._initialized:
+            await asyncio.to_thread(self._ensure_initialized)
 
     def _initialize_memories(self):
         """Initialize different memory strategies."""
@@ -42,9 +87,9 @@ class SREMemoryClient:
 
             if existing_memory and not self.force_delete:
                 # Use existing memory
-                self.memory_id = existing_memory["id"]
+                self._memory_id = existing_memory["id"]
                 logger.info(
-                    f"Using existing memory: {self.memory_id} (name: {existing_memory['name']})"
+                    f"Using existing memory: {self._memory_id} (name: {existing_memory['name']})"
                 )
                 logger.info(
                     f"Memory status: {existing_memory.get('status', 'unknown')}"
@@ -104,8 +149,8 @@ class SREMemoryClient:
                     description="SRE Agent long-term memory system",
                     event_expiry_days=max_retention,
                 )
-                self.memory_id = base_memory["id"]
-                logger.info(f"Created new memory: {self.memory_id}")
+                self._memory_id = base_memory["id"]
+                logger.info(f"Created new memory: {self._memory_id}")
 
                 # Write memory ID to file for helper scripts
                 self._write_memory_id_to_file()
@@ -121,7 +166,7 @@ class SREMemoryClient:
             if "user_preferences" not in existing_names:
                 logger.info("Adding user preferences strategy...")
                 self.client.add_user_preference_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=self._memory_id,
                     name="user_preferences",
                     description="User preferences for escalation, notification, and workflows",
                     namespaces=["/sre/users/{actorId}/preferences"],
@@ -134,7 +179,7 @@ class SREMemoryClient:
             if "infrastructure_knowledge" not in existing_names:
                 logger.info("Adding infrastructure knowledge strategy...")
                 self.client.add_semantic_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=self._memory_id,
                     name="infrastructure_knowledge",
                     description="Infrastructure knowledge including dependencies and patterns",
                     namespaces=["/sre/infrastructure/{actorId}/{sessionId}"],
@@ -149,7 +194,7 @@ class SREMemoryClient:
             if "investigation_summaries" not in existing_names:
                 logger.info("Adding investigation summaries strategy...")
                 self.client.add_summary_strategy_and_wait(
-                    memory_id=self.memory_id,
+                    memory_id=self._memory_id,
                     name="investigation_summaries",
                     description="Investigation summaries with timeline and findings",
                     namespaces=["/sre/investigations/{actorId}/{sessionId}"],
@@ -163,7 +208,7 @@ class SREMemoryClient:
             logger.error(f"Failed to initialize memories: {e}", exc_info=True)
             # For development, we'll continue without failing completely
             # In production, you might want to raise the exception
-            self.memory_id = None
+            self._memory_id = None
             logger.warning("Memory system will operate in offline mode")
 
     def save_event(
@@ -177,8 +222,11 @@ class SREMemoryClient:
 
         actor_id is always required. session_id is required for infrastructure
         and investigations memory types, but optional for preferences.
+
+        The event is queued and written in the background, so True means it was
+        accepted; use ``flush_writes`` to wait for it to be persisted.
         """
-        if not self.memory_id:
+        if self._initialized and not self._memory_id:
             logger.warning("Memory system not initialized, skipping save")
             return False
 
@@ -190,44 +238,26 @@ class SREMemoryClient:
             raise ValueError(f"session_id is required for {memory_type} memory type")
 
         try:
-            # Add detailed traces for debugging
-            logger.info("=== SAVE_EVENT TRACE START ===")
-            logger.info("Input parameters:")
-            logger.info(f"  memory_type: {memory_type}")
-            logger.info(f"  actor_id: {actor_id}")
-            logger.info(f"  session_id: {session_id}")
-            logger.info(f"  memory_id: {self.memory_id}")
-            logger.info(f"  event_data: {event_data}")
+            logger.debug(
+                f"save_event: memory_type={memory_type}, actor_id={actor_id}, session_id={session_id}, event_data={event_data}"
+            )
 
             # Convert event data to message format
-            messages = [
-                (str(event_data), "ASSISTANT")  # Store as assistant message
-            ]
-
-            logger.info("Calling create_event with:")
-            logger.info(f"  memory_id: {self.memory_id}")
-            logger.info(f"  actor_id: {actor_id}")
-            logger.info(f"  session_id: {session_id}")
-            logger.info(f"  messages: {messages}")
+            messages = [(str(event_data), "ASSISTANT")]  # Store as assistant message
 
             # For preferences, use a default session_id since the API requires it
             # but the namespace doesn't use it
             actual_session_id = session_id if session_id else "preferences-default"
 
-            result = self.client.create_event(
-                memory_id=self.memory_id,
-                actor_id=actor_id,
-                session_id=actual_session_id,
-                messages=messages,
+            # Written in the background; see MemoryWriteQueue
+            self.enqueue_event(actor_id, actual_session_id, messages)
+            self.retrieval_cache.invalidate_namespace(
+                self._get_namespace(memory_type, actor_id, session_id)
             )
 
-            event_id = result.get("eventId", "unknown")
-            logger.info(f"create_event result: {result}")
-            logger.info("=== SAVE_EVENT TRACE END ===")
             logger.info(
-                f"Saved {memory_type} event for {actor_id} (event_id: {event_id})"
+                f"Queued {memory_type} event for {actor_id} ({len(str(event_data))} characters)"
             )
-            logger.info(f"Event data size: {len(str(event_data))} characters")
             return True
 
         except Exception as e:
@@ -236,6 +266,41 @@ class SREMemoryClient:
             )
             return False
 
+    def enqueue_event(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> None:
+        """Queue (content, role) messages for create_event without waiting on it."""
+        self.write_queue.submit(actor_id, session_id, messages)
+
+    async def flush_writes(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued events have been written.
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        return await self.write_queue.flush(timeout)
+
+    def _create_event(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> None:
+        """Write one event; called by the write queue in a worker thread."""
+        memory_id = self.memory_id
+        if not memory_id:
+            logger.warning(
+                f"Memory system not initialized, dropping {len(messages)} messages"
+            )
+            return
+
+        result = self.client.create_event(
+            memory_id=memory_id,
+            actor_id=actor_id,
+            session_id=session_id,
+            messages=messages,
+        )
+        logger.info(
+            f"Saved {len(messages)} messages for actor_id={actor_id}, session_id={session_id} (event_id: {result.get('eventId', 'unknown')})"
+        )
+
     def retrieve_memories(
         self,
         memory_type: str,
@@ -244,7 +309,11 @@ class SREMemoryClient:
         max_results: int = 10,
         session_id: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
-        """Retrieve memories using the retrieve_memories API."""
+        """Retrieve memories using the retrieve_memories API.
+
+        Results are served from the retrieval cache when the same query was
+        made recently; see MemoryRetrievalCache.
+        """
         if not self.memory_id:
             logger.warning("Memory system not initialized, returning empty results")
             return []
@@ -253,6 +322,16 @@ class SREMemoryClient:
             # Get appropriate namespace (session_id only needed for infrastructure/investigations)
             namespace = self._get_namespace(memory_type, actor_id, session_id)
 
+            cache_key = self.retrieval_cache.make_key(
+                memory_type, actor_id, namespace, query, max_results
+            )
+            cached = self.retrieval_cache.get(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"Using {len(cached)} cached {memory_type} memories for {actor_id}"
+                )
+                return cached
+
             logger.info(
                 f"Retrieving {memory_type} memories: actor_id={actor_id}, namespace={namespace}, query='{query}'"
             )
@@ -282,6 +361,7 @@ class SREMemoryClient:
                     else:
                         logger.debug(f"Memory {i + 1} has no 'content' field")
 
+            self.retrieval_cache.put(cache_key, result)
             return result
 
         except Exception as e:
@@ -291,6 +371,24 @@ class SREMemoryClient:
             )
             return []
 
+    async def aretrieve_memories(
+        self,
+        memory_type: str,
+        actor_id: str,
+        query: str,
+        max_results: int = 10,
+        session_id: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve memories in a worker thread, without blocking the event loop."""
+        return await asyncio.to_thread(
+            self.retrieve_memories,
+            memory_type=memory_type,
+            actor_id=actor_id,
+            query=query,
+            max_results=max_results,
+            session_id=session_id,
+        )
+
     def _get_namespace(
         self, memory_type: str, actor_id: str, session_id: Optional[str] = None
     ) -> str:
@@ -372,8 +470,8 @@ class SREMemoryClient:
             project_root = Path(__file__).parent.parent.parent
             memory_id_file = project_root / ".memory_id"
 
-            memory_id_file.write_text(self.memory_id)
-            logger.info(f"Wrote memory ID {self.memory_id} to {memory_id_file}")
+            memory_id_file.write_text(self._memory_id)
+            logger.info(f"Wrote memory ID {self._memory_id} to {memory_id_file}")
 
         except Exception as e:
             logger.warning(f"Failed to write memory ID to file: {e}")
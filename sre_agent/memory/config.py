@@ -44,6 +44,18 @@ class MemoryConfig(BaseModel):
     auto_generate_summaries: bool = Field(
         default=True, description="Automatically generate investigation summaries"
     )
+    verify_preference_capture: bool = Field(
+        default=False,
+        description="Re-count stored preferences around each capture to verify it (adds two retrievals per agent response)",
+    )
+
+    # Retrieval cache settings
+    retrieval_cache_ttl_seconds: int = Field(
+        default=300, description="Seconds to cache memory retrievals, 0 to disable"
+    )
+    retrieval_cache_max_entries: int = Field(
+        default=256, description="Maximum number of cached memory retrievals"
+    )
 
 
 def _load_memory_config() -> MemoryConfig:
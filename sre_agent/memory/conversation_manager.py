@@ -51,6 +51,9 @@ class ConversationMemoryManager:
         """
         Store a conversation message in memory using create_event.
 
+        The message is written in the background by the memory client's write
+        queue, so this returns as soon as it is queued.
+
         Args:
             content: The message content
             role: USER, ASSISTANT, or TOOL
@@ -81,18 +84,14 @@ class ConversationMemoryManager:
             # Format message as tuple for AgentCore memory
             message_tuple = (content, role)
 
-            # Use AgentCore's create_event with user_id as actor_id
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Queue for AgentCore's create_event with user_id as actor_id
+            self.memory_client.enqueue_event(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=[message_tuple],  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
-            logger.info(
-                f"Successfully stored conversation message (event_id: {event_id})"
-            )
+            logger.info("Queued conversation message for storage")
             return True
 
         except Exception as e:
@@ -109,6 +108,9 @@ class ConversationMemoryManager:
         """
         Store multiple conversation messages in a single create_event call.
 
+        The batch is written in the background by the memory client's write
+        queue, so this returns as soon as it is queued.
+
         Args:
             messages: List of (content, role) tuples
             user_id: User ID to use as actor_id
@@ -153,17 +155,16 @@ class ConversationMemoryManager:
                 else:
                     truncated_messages.append((content, role))
 
-            # Use AgentCore's create_event with batch of messages
-            result = self.memory_client.client.create_event(
-                memory_id=self.memory_client.memory_id,
+            # Queue for AgentCore's create_event; the write queue coalesces
+            # batches of the same user and session into as few events as possible
+            self.memory_client.enqueue_event(
                 actor_id=user_id,  # Use user_id as actor_id as specified
                 session_id=session_id,  # Use provided session_id
                 messages=truncated_messages,  # AgentCore expects list of tuples
             )
 
-            event_id = result.get("eventId", "unknown")
             logger.info(
-                f"Successfully stored conversation batch of {len(messages)} messages (event_id: {event_id})"
+                f"Queued conversation batch of {len(messages)} messages for storage"
             )
             return True
 
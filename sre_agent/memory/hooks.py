@@ -1,11 +1,14 @@
+import asyncio
 import json
 import logging
 import re
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ..constants import SREConstants
 from .client import SREMemoryClient
+from .config import _load_memory_config
 from .strategies import (
     InfrastructureKnowledge,
     InvestigationSummary,
@@ -25,11 +28,43 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Escalation contacts mentioned in agent responses
+_ESCALATION_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"escalate to ([^\s,\.]+@[^\s,\.]+)",
+        r"contact ([^\s,\.]+@[^\s,\.]+)",
+        r"notify ([^\s,\.]+@[^\s,\.]+)",
+        r"reach out to ([^\s,\.]+@[^\s,\.]+)",
+    )
+]
+
+# Notification channels mentioned in agent responses
+_CHANNEL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"send to (#[\w-]+)",
+        r"notify (#[\w-]+)",
+        r"alert (#[\w-]+)",
+        r"post to (#[\w-]+)",
+    )
+]
+
+
 class MemoryHookProvider:
     """Provides hooks for automatic memory capture during SRE operations."""
 
-    def __init__(self, memory_client: SREMemoryClient):
+    def __init__(
+        self,
+        memory_client: SREMemoryClient,
+        verify_preferences: Optional[bool] = None,
+    ):
         self.memory_client = memory_client
+        # Verification re-counts stored preferences and costs two retrievals
+        # per agent response, so it is opt-in
+        if verify_preferences is None:
+            verify_preferences = _load_memory_config().verify_preference_capture
+        self.verify_preferences = verify_preferences
 
     def on_investigation_start(
         self,
@@ -42,89 +77,74 @@ class MemoryHookProvider:
         """Hook called when investigation starts."""
         try:
             # Retrieve relevant memories to provide context
-            # Use comprehensive query to get all user preference types
-            preferences = self.memory_client.retrieve_memories(
-                memory_type="preferences",
-                actor_id=user_id,
-                query=SREConstants.memory.user_preferences_query,
-                max_results=SREConstants.memory.max_preferences_results,
-            )
+            retrievals = self._investigation_retrievals(query, user_id)
+            results = {
+                name: self.memory_client.retrieve_memories(**kwargs)
+                for name, kwargs in retrievals.items()
+            }
+            return self._build_investigation_context(results, user_id)
 
-            # Get infrastructure knowledge for specific user only
-            logger.info(
-                f"Retrieving infrastructure knowledge for user '{user_id}' for query: '{query}'"
-            )
-            all_knowledge = self.memory_client.retrieve_memories(
-                memory_type="infrastructure",
-                actor_id=user_id,  # Only retrieve memories for the current user
-                query=query,
-                max_results=SREConstants.memory.max_infrastructure_results,
-                session_id=None,  # Cross-session search for planning purposes
+        except Exception as e:
+            logger.error(
+                f"Failed to retrieve memory context on investigation start: {e}"
             )
+            return {
+                "user_preferences": [],
+                "infrastructure_knowledge": [],
+                "past_investigations": [],
+            }
 
-            # Organize knowledge by agent for later distribution
-            knowledge_by_agent = self._organize_memories_by_agent(all_knowledge)
-            # Log summary with breakdown
-            if knowledge_by_agent:
-                agent_summary = ", ".join(
-                    [
-                        f"{agent}: {len(memories)} memories"
-                        for agent, memories in knowledge_by_agent.items()
-                    ]
-                )
-                logger.info(
-                    f"Retrieved infrastructure knowledge for user '{user_id}' from {len(knowledge_by_agent)} different sources: {agent_summary}"
+    async def aon_investigation_start(
+        self,
+        query: str,
+        user_id: str,
+        actor_id: str,
+        session_id: str,
+        incident_id: Optional[str] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of on_investigation_start.
+
+        The preference, infrastructure and investigation retrievals run
+        concurrently in worker threads, so gathering context takes as long as
+        the slowest one rather than all three. Each retrieval has its own
+        deadline; one that fails or misses it contributes no results and is
+        listed under ``unavailable`` instead of failing the whole context.
+        """
+        timeout = timeout_seconds or SREConstants.memory.retrieval_timeout_seconds
+        retrievals = self._investigation_retrievals(query, user_id)
+        unavailable: List[str] = []
+
+        async def _retrieve(name: str, kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+            try:
+                return await asyncio.wait_for(
+                    self.memory_client.aretrieve_memories(**kwargs), timeout=timeout
                 )
-            else:
-                logger.info(f"No infrastructure knowledge found for user '{user_id}'")
-
-            # Get past investigation summaries for similar issues (cross-session search for planning)
-            logger.info(
-                f"Retrieving investigation summaries for user '{user_id}' for query: '{query}'"
-            )
-            investigations = self.memory_client.retrieve_memories(
-                memory_type="investigations",
-                actor_id=user_id,  # Use user_id to retrieve only user-specific investigations
-                query=query,
-                max_results=SREConstants.memory.max_investigation_results,
-                session_id=None,  # Cross-session search for planning purposes
-            )
-
-            if investigations:
-                logger.info(
-                    f"Retrieved {len(investigations)} past investigation summaries for user '{user_id}'"
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Memory retrieval '{name}' for user '{user_id}' timed out after {timeout}s, continuing without it"
                 )
-            else:
-                logger.info(
-                    f"No past investigation summaries found for user '{user_id}'"
+            except Exception as e:
+                logger.warning(
+                    f"Memory retrieval '{name}' for user '{user_id}' failed, continuing without it: {e}"
                 )
+            unavailable.append(name)
+            return []
 
-            # Extract content from memory records - need to get the 'text' field from within 'content'
-            preference_contents = []
-            for record in preferences:
-                content = record.get("content", {})
-                if content and "text" in content:
-                    preference_contents.append(content["text"])
-
-            # Log the extracted user preferences for debugging
-            logger.debug("Extracted user preferences content:")
-            for i, pref in enumerate(preference_contents):
-                logger.debug(f"Preference {i + 1}: {pref}")
-            logger.debug(f"Total extracted preferences: {len(preference_contents)}")
-
-            memory_context = {
-                "user_preferences": preference_contents,
-                "infrastructure_by_agent": knowledge_by_agent,
-                "past_investigations": investigations,
-            }
-
-            total_knowledge = sum(
-                len(memories) for memories in knowledge_by_agent.values()
+        try:
+            started = time.perf_counter()
+            retrieved = await asyncio.gather(
+                *(_retrieve(name, kwargs) for name, kwargs in retrievals.items())
             )
             logger.info(
-                f"Retrieved memory context for investigation: {len(preference_contents)} preference contents (from {len(preferences)} records), {total_knowledge} knowledge items from {len(knowledge_by_agent)} agents, {len(investigations)} past investigations"
+                f"Retrieved investigation memory context concurrently in {time.perf_counter() - started:.2f}s"
             )
 
+            memory_context = self._build_investigation_context(
+                dict(zip(retrievals, retrieved)), user_id
+            )
+            if unavailable:
+                memory_context["unavailable"] = unavailable
             return memory_context
 
         except Exception as e:
@@ -137,6 +157,93 @@ class MemoryHookProvider:
                 "past_investigations": [],
             }
 
+    def _investigation_retrievals(
+        self, query: str, user_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """retrieve_memories arguments for the context gathered at investigation start."""
+        return {
+            # Use comprehensive query to get all user preference types
+            "preferences": {
+                "memory_type": "preferences",
+                "actor_id": user_id,
+                "query": SREConstants.memory.user_preferences_query,
+                "max_results": SREConstants.memory.max_preferences_results,
+            },
+            # Get infrastructure knowledge for specific user only
+            "infrastructure": {
+                "memory_type": "infrastructure",
+                "actor_id": user_id,  # Only retrieve memories for the current user
+                "query": query,
+                "max_results": SREConstants.memory.max_infrastructure_results,
+                "session_id": None,  # Cross-session search for planning purposes
+            },
+            # Get past investigation summaries for similar issues
+            "investigations": {
+                "memory_type": "investigations",
+                "actor_id": user_id,  # Use user_id to retrieve only user-specific investigations
+                "query": query,
+                "max_results": SREConstants.memory.max_investigation_results,
+                "session_id": None,  # Cross-session search for planning purposes
+            },
+        }
+
+    def _build_investigation_context(
+        self, results: Dict[str, List[Dict[str, Any]]], user_id: str
+    ) -> Dict[str, Any]:
+        """Organize retrieved preferences, knowledge and investigations into a memory context."""
+        preferences = results.get("preferences", [])
+        all_knowledge = results.get("infrastructure", [])
+        investigations = results.get("investigations", [])
+
+        # Organize knowledge by agent for later distribution
+        knowledge_by_agent = self._organize_memories_by_agent(all_knowledge)
+        # Log summary with breakdown
+        if knowledge_by_agent:
+            agent_summary = ", ".join(
+                [
+                    f"{agent}: {len(memories)} memories"
+                    for agent, memories in knowledge_by_agent.items()
+                ]
+            )
+            logger.info(
+                f"Retrieved infrastructure knowledge for user '{user_id}' from {len(knowledge_by_agent)} different sources: {agent_summary}"
+            )
+        else:
+            logger.info(f"No infrastructure knowledge found for user '{user_id}'")
+
+        if investigations:
+            logger.info(
+                f"Retrieved {len(investigations)} past investigation summaries for user '{user_id}'"
+            )
+        else:
+            logger.info(f"No past investigation summaries found for user '{user_id}'")
+
+        # Extract content from memory records - need to get the 'text' field from within 'content'
+        preference_contents = []
+        for record in preferences:
+            content = record.get("content", {})
+            if content and "text" in content:
+                preference_contents.append(content["text"])
+
+        # Log the extracted user preferences for debugging
+        logger.debug("Extracted user preferences content:")
+        for i, pref in enumerate(preference_contents):
+            logger.debug(f"Preference {i + 1}: {pref}")
+        logger.debug(f"Total extracted preferences: {len(preference_contents)}")
+
+        memory_context = {
+            "user_preferences": preference_contents,
+            "infrastructure_by_agent": knowledge_by_agent,
+            "past_investigations": investigations,
+        }
+
+        total_knowledge = sum(len(memories) for memories in knowledge_by_agent.values())
+        logger.info(
+            f"Retrieved memory context for investigation: {len(preference_contents)} preference contents (from {len(preferences)} records), {total_knowledge} knowledge items from {len(knowledge_by_agent)} agents, {len(investigations)} past investigations"
+        )
+
+        return memory_context
+
     def on_agent_response(
         self, agent_name: str, response: Dict[str, Any], state: Dict[str, Any]
     ):
@@ -151,22 +258,16 @@ class MemoryHookProvider:
             )
 
             # Extract and save user preferences
-            pref_count_before = len(
-                self.memory_client.retrieve_memories(
-                    "preferences", user_id, "recent", max_results=100
-                )
-            )
-            self._extract_user_preferences(response_text, user_id, agent_name)
-            pref_count_after = len(
-                self.memory_client.retrieve_memories(
-                    "preferences", user_id, "recent", max_results=100
-                )
-            )
-
-            if pref_count_after > pref_count_before:
-                logger.info(
-                    f"Extracted {pref_count_after - pref_count_before} new user preferences from {agent_name} response"
+            if self.verify_preferences:
+                self._verify_preference_capture(response_text, user_id, agent_name)
+            else:
+                captured = self._extract_user_preferences(
+                    response_text, user_id, agent_name
                 )
+                if captured:
+                    logger.info(
+                        f"Extracted {captured} new user preferences from {agent_name} response"
+                    )
 
             # Extract infrastructure knowledge
             # Check if this agent should extract infrastructure knowledge
@@ -247,23 +348,51 @@ class MemoryHookProvider:
         except Exception as e:
             logger.error(f"Failed to save investigation summary: {e}")
 
-    def _extract_user_preferences(self, response_text: str, user_id: str, context: str):
-        """Extract user preferences from response text."""
+    def _verify_preference_capture(
+        self, response_text: str, user_id: str, agent_name: str
+    ) -> None:
+        """Extract preferences and compare the reported count with the stored one.
+
+        Events are written in the background and processed by the memory
+        strategies asynchronously, so the stored count can lag the captures.
+        """
+        pref_count_before = len(
+            self.memory_client.retrieve_memories(
+                "preferences", user_id, "recent", max_results=100
+            )
+        )
+        captured = self._extract_user_preferences(response_text, user_id, agent_name)
+        pref_count_after = len(
+            self.memory_client.retrieve_memories(
+                "preferences", user_id, "recent", max_results=100
+            )
+        )
+        logger.info(
+            f"Preference capture verification for {agent_name}: {captured} captured, stored preferences {pref_count_before} -> {pref_count_after}"
+        )
+
+    def _extract_user_preferences(
+        self, response_text: str, user_id: str, context: str
+    ) -> int:
+        """Extract user preferences from response text.
+
+        Returns:
+            Number of preferences captured
+        """
+        # Every pattern needs an email address or a #channel; skip the regexes
+        # entirely for the common response that has neither
+        if "@" not in response_text and "#" not in response_text:
+            logger.debug(f"No preference candidates in {context} response")
+            return 0
+
         logger.info(
             f"Extracting user preferences from {context} response for user {user_id}"
         )
 
         # Extract escalation preferences
-        escalation_patterns = [
-            r"escalate to ([^\s,\.]+@[^\s,\.]+)",
-            r"contact ([^\s,\.]+@[^\s,\.]+)",
-            r"notify ([^\s,\.]+@[^\s,\.]+)",
-            r"reach out to ([^\s,\.]+@[^\s,\.]+)",
-        ]
-
         escalation_found = 0
-        for pattern in escalation_patterns:
-            matches = re.finditer(pattern, response_text, re.IGNORECASE)
+        for pattern in _ESCALATION_PATTERNS:
+            matches = pattern.finditer(response_text)
             for match in matches:
                 contact = match.group(1)
                 logger.info(
@@ -289,16 +418,9 @@ class MemoryHookProvider:
             logger.info(f"No escalation patterns found in {context} response")
 
         # Extract notification channel preferences
-        channel_patterns = [
-            r"send to (#[\w-]+)",
-            r"notify (#[\w-]+)",
-            r"alert (#[\w-]+)",
-            r"post to (#[\w-]+)",
-        ]
-
         channels_found = 0
-        for pattern in channel_patterns:
-            matches = re.finditer(pattern, response_text, re.IGNORECASE)
+        for pattern in _CHANNEL_PATTERNS:
+            matches = pattern.finditer(response_text)
             for match in matches:
                 channel = match.group(1)
                 logger.info(
@@ -323,6 +445,8 @@ class MemoryHookProvider:
         if channels_found == 0:
             logger.info(f"No notification channel patterns found in {context} response")
 
+        return escalation_found + channels_found
+
         logger.info(
             f"Preference extraction complete: {escalation_found} escalations, {channels_found} channels"
         )
@@ -446,9 +570,11 @@ class MemoryHookProvider:
                     "timestamp": datetime.utcnow().isoformat(),
                     "agent": agent,
                     "action": f"Executed {agent} agent",
-                    "result_summary": str(result)[:200] + "..."
-                    if len(str(result)) > 200
-                    else str(result),
+                    "result_summary": (
+                        str(result)[:200] + "..."
+                        if len(str(result)) > 200
+                        else str(result)
+                    ),
                 }
             )
 
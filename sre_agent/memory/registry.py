@@ -0,0 +1,89 @@
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+from .client import SREMemoryClient
+from .config import _load_memory_config
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Process-wide memory clients keyed by (memory_name, region)
+_clients: Dict[Tuple[str, str], SREMemoryClient] = {}
+_lock = threading.Lock()
+
+
+def get_memory_client(
+    memory_name: Optional[str] = None,
+    region: Optional[str] = None,
+    force_delete: bool = False,
+) -> SREMemoryClient:
+    """Return the shared SREMemoryClient for a memory resource, creating it once.
+
+    Clients are created lazily: the control-plane setup (list_memories,
+    get_memory, strategy creation) runs on first use or when
+    ``ainitialize`` is awaited, and only once per process. Every agent node,
+    the supervisor and the memory tools share the same instance.
+
+    Args:
+        memory_name: Base name of the memory resource (defaults to the memory config)
+        region: AWS region of the memory resource (defaults to the memory config)
+        force_delete: Recreate the memory resource; only applies when the client
+            is first created
+
+    Returns:
+        The shared SREMemoryClient
+    """
+    config = _load_memory_config()
+    key = (memory_name or config.memory_name, region or config.region)
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            logger.info(
+                f"Creating shared memory client for memory={key[0]}, region={key[1]}"
+            )
+            client = SREMemoryClient(
+                memory_name=key[0],
+                region=key[1],
+                force_delete=force_delete,
+                lazy=True,
+            )
+            _clients[key] = client
+        elif force_delete:
+            logger.warning(
+                f"Memory client for {key[0]} already exists, ignoring force_delete"
+            )
+    return client
+
+
+async def flush_memory_clients(timeout: Optional[float] = None) -> bool:
+    """Wait for the queued writes of every shared memory client to be persisted.
+
+    Call this before the event loop exits, e.g. on CLI exit or server shutdown.
+    The background writers are stopped and restart on the next write.
+
+    Returns:
+        True if every queue was drained, False if any timed out
+    """
+    with _lock:
+        clients = list(_clients.values())
+    results = [await client.write_queue.close(timeout) for client in clients]
+    for client in clients:
+        logger.info(
+            f"Memory client {client.memory_name}: writes {client.write_queue.stats()}, retrieval cache {client.retrieval_cache.stats()}"
+        )
+    return all(results)
+
+
+def clear_memory_clients() -> None:
+    """Drop all shared memory clients (used by tests)."""
+    with _lock:
+        _clients.clear()
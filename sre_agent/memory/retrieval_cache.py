@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+# (memory_type, actor_id, namespace, normalized query, max_results)
+CacheKey = Tuple[str, str, str, str, int]
+
+
+def _normalize_query(query: str) -> str:
+    """Normalize a query so trivially different spellings share an entry."""
+    return " ".join(query.lower().split())
+
+
+class MemoryRetrievalCache:
+    """Thread-safe LRU cache of memory retrieval results with a TTL.
+
+    Entries are keyed by memory type, actor, namespace, normalized query and
+    result limit. Writes to a namespace invalidate the entries of that
+    namespace and of any cross-session namespace above it, so a session reads
+    its own writes once the memory strategies have processed them.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 300.0):
+        """Create the cache.
+
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Seconds an entry stays valid; 0 disables the cache
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, List[Dict[str, Any]]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(
+        memory_type: str, actor_id: str, namespace: str, query: str, max_results: int
+    ) -> CacheKey:
+        return (memory_type, actor_id, namespace, _normalize_query(query), max_results)
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """Return cached results for the key, or None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return list(entry[1])
+
+    def put(self, key: CacheKey, results: List[Dict[str, Any]]) -> None:
+        """Cache retrieval results, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        """Drop entries a write to ``namespace`` can affect.
+
+        That is entries for the namespace itself and for cross-session
+        namespaces containing it, e.g. ``/sre/infrastructure/{actorId}`` for a
+        write to ``/sre/infrastructure/{actorId}/{sessionId}``.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if namespace == key[2] or namespace.startswith(key[2] + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats["invalidations"] += len(stale)
+        if stale:
+            logger.debug(
+                f"Invalidated {len(stale)} cached memory retrievals for {namespace}"
+            )
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss, eviction and invalidation counters."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "hit_rate": self._stats["hits"] / lookups if lookups else 0.0,
+            }
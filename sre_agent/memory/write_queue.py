@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Configure logging with basicConfig
+logging.basicConfig(
+    level=logging.INFO,  # Set the log level to INFO
+    # Define log message format
+    format="%(asctime)s,p%(process)s,{%(filename)s:%(lineno)d},%(levelname)s,%(message)s",
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Writes (actor_id, session_id, messages) as one memory event
+EventWriter = Callable[[str, str, List[Tuple[str, str]]], Any]
+
+
+@dataclass
+class _PendingEvent:
+    """Messages waiting to be written for one actor and session."""
+
+    actor_id: str
+    session_id: str
+    messages: List[Tuple[str, str]]
+
+
+class MemoryWriteQueue:
+    """Write-behind queue for memory events.
+
+    ``submit`` returns immediately; a background asyncio task drains the queue,
+    coalesces the pending messages of each ``(actor_id, session_id)`` into as few
+    events as possible and writes them in a worker thread, retrying failures
+    with exponential backoff. Callers on other threads (such as synchronous
+    tools run in an executor) are handed over to the queue's event loop.
+
+    When no event loop is running at all, events are written synchronously,
+    which keeps scripts and one-off calls working unchanged.
+
+    Call ``flush`` to wait for everything submitted so far to be written, and
+    ``close`` before the event loop exits.
+    """
+
+    def __init__(
+        self,
+        writer: EventWriter,
+        max_messages_per_event: int = 100,
+        linger_seconds: float = 0.05,
+        max_attempts: int = 3,
+        backoff_seconds: float = 0.5,
+    ):
+        """Create the queue.
+
+        Args:
+            writer: Callable writing one event, run in a worker thread
+            max_messages_per_event: Upper bound on messages coalesced into one event
+            linger_seconds: How long the worker waits for more events before writing
+            max_attempts: Attempts per event before its messages are dropped
+            backoff_seconds: Base delay of the exponential backoff between attempts
+        """
+        self._writer = writer
+        self.max_messages_per_event = max_messages_per_event
+        self.linger_seconds = linger_seconds
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "events_written": 0,
+            "messages_written": 0,
+            "retries": 0,
+            "failed_messages": 0,
+        }
+
+    def submit(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> None:
+        """Queue messages to be written as a memory event, without waiting."""
+        if not messages:
+            return
+        event = _PendingEvent(actor_id, session_id, list(messages))
+        with self._lock:
+            self._stats["submitted"] += len(event.messages)
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+
+        if running_loop is not None:
+            self._start(running_loop)
+            if running_loop is self._loop:
+                self._enqueue(event)
+                return
+
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            # Called from another thread; hand the event to the queue's loop
+            loop.call_soon_threadsafe(self._enqueue, event)
+            return
+
+        # No event loop to write behind on
+        self._write_sync(event)
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the queue to the running loop and start the worker if needed."""
+        if (
+            self._worker is not None
+            and not self._worker.done()
+            and self._loop.is_running()
+        ):
+            # Keep using the loop the worker already runs on
+            return
+        if self._pending:
+            logger.warning(
+                f"Discarding {self._pending} memory writes left on a stopped event loop"
+            )
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._pending = 0
+        self._worker = loop.create_task(self._run())
+
+    def _enqueue(self, event: _PendingEvent) -> None:
+        """Put an event on the queue; must run on the queue's loop."""
+        self._pending += 1
+        self._queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        """Drain the queue, writing coalesced batches."""
+        while True:
+            batch = [await self._queue.get()]
+            if self.linger_seconds:
+                await asyncio.sleep(self.linger_seconds)
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                logger.error(f"Memory write batch failed: {e}", exc_info=True)
+            finally:
+                self._pending -= len(batch)
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _coalesce(
+        self, batch: List[_PendingEvent]
+    ) -> List[Tuple[str, str, List[Tuple[str, str]]]]:
+        """Merge pending events per (actor_id, session_id), keeping message order."""
+        grouped: "OrderedDict[Tuple[str, str], List[Tuple[str, str]]]" = OrderedDict()
+        for event in batch:
+            grouped.setdefault((event.actor_id, event.session_id), []).extend(
+                event.messages
+            )
+
+        events = []
+        for (actor_id, session_id), messages in grouped.items():
+            for start in range(0, len(messages), self.max_messages_per_event):
+                events.append(
+                    (
+                        actor_id,
+                        session_id,
+                        messages[start : start + self.max_messages_per_event],
+                    )
+                )
+        return events
+
+    async def _write_batch(self, batch: List[_PendingEvent]) -> None:
+        events = self._coalesce(batch)
+        logger.debug(
+            f"Writing {len(batch)} queued memory writes as {len(events)} events"
+        )
+        await asyncio.gather(*(self._write_with_retry(*event) for event in events))
+
+    async def _write_with_retry(
+        self, actor_id: str, session_id: str, messages: List[Tuple[str, str]]
+    ) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await asyncio.to_thread(self._writer, actor_id, session_id, messages)
+                self._record_written(messages)
+                return
+            except Exception as e:
+                if not self._should_retry(attempt, actor_id, session_id, messages, e):
+                    return
+                await asyncio.sleep(self._backoff(attempt))
+
+    def _write_sync(self, event: _PendingEvent) -> None:
+        for actor_id, session_id, messages in self._coalesce([event]):
+            for attempt in range(1, self.max_attempts + 1):
+                try:
+                    self._writer(actor_id, session_id, messages)
+                    self._record_written(messages)
+                    break
+                except Exception as e:
+                    if not self._should_retry(
+                        attempt, actor_id, session_id, messages, e
+                    ):
+                        break
+                    time.sleep(self._backoff(attempt))
+
+    def _should_retry(
+        self,
+        attempt: int,
+        actor_id: str,
+        session_id: str,
+        messages: List[Tuple[str, str]],
+        error: Exception,
+    ) -> bool:
+        """Record a failed attempt and decide whether to try again."""
+        if attempt >= self.max_attempts:
+            with self._lock:
+                self._stats["failed_messages"] += len(messages)
+            logger.error(
+                f"Dropping {len(messages)} memory messages for actor_id={actor_id}, session_id={session_id} after {attempt} attempts: {error}"
+            )
+            return False
+        with self._lock:
+            self._stats["retries"] += 1
+        logger.warning(
+            f"Memory write for actor_id={actor_id}, session_id={session_id} failed (attempt {attempt}/{self.max_attempts}): {error}"
+        )
+        return True
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter."""
+        return self.backoff_seconds * 2 ** (attempt - 1) + random.uniform(
+            0, self.backoff_seconds
+        )
+
+    def _record_written(self, messages: List[Tuple[str, str]]) -> None:
+        with self._lock:
+            self._stats["events_written"] += 1
+            self._stats["messages_written"] += len(messages)
+
+    @property
+    def pending(self) -> int:
+        """Number of queued writes not yet completed, including those in flight."""
+        return self._pending
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every write submitted so far has completed.
+
+        Args:
+            timeout: Maximum seconds to wait, None to wait indefinitely
+
+        Returns:
+            True if the queue was drained, False on timeout
+        """
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return True
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Timed out flushing memory writes, {self.pending} still pending"
+            )
+            return False
+
+    async def close(self, timeout: Optional[float] = None) -> bool:
+        """Flush pending writes and stop the background worker."""
+        drained = await self.flush(timeout)
+        if self._worker is not None and self._loop is asyncio.get_running_loop():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        return drained
+
+    def stats(self) -> Dict[str, int]:
+        """Return submission, write, retry and failure counters."""
+        with self._lock:
+            return {**self._stats, "pending": self.pending}
@@ -26,6 +26,11 @@ from .agent_state import AgentState
 from .constants import SREConstants
 from .graph_builder import build_multi_agent_graph
 from .logging_config import configure_logging, should_show_debug_traces
+from .tool_cache import (
+    cache_tool_results,
+    investigation_stats,
+    start_investigation_tracking,
+)
 
 # Configure logging if not already configured (e.g., when imported by agent_runtime)
 if not logging.getLogger().handlers:
@@ -325,7 +330,9 @@ def _read_gateway_config() -> tuple[str, str]:
 
         # Handle case where 'gateway' key might be None
         gateway_config = config.get("gateway") or {}
-        gateway_uri = gateway_config.get("uri") if isinstance(gateway_config, dict) else None
+        gateway_uri = (
+            gateway_config.get("uri") if isinstance(gateway_config, dict) else None
+        )
         if not gateway_uri:
             raise ValueError(
                 "Gateway URI not found in agent_config.yaml under 'gateway.uri'"
@@ -374,6 +381,7 @@ async def create_multi_agent_system(
     export_graph: bool = False,
     graph_output_path: str = "./docs/sre_agent_architecture.md",
     region_name: str = None,
+    parallel_execution: bool = False,
     **llm_kwargs,
 ):
     """Create multi-agent system with MCP tools."""
@@ -388,6 +396,29 @@ async def create_multi_agent_system(
         llm_kwargs["region_name"] = region_name
         logger.info(f"Using AWS region for Bedrock: {region_name}")
 
+    # Shared memory client for the supervisor, all agents and the memory tools.
+    # Its control-plane setup runs in a worker thread while the MCP tools load
+    memory_client = None
+    memory_init = None
+    try:
+        from .memory.config import _load_memory_config
+        from .memory.registry import get_memory_client
+
+        memory_config = _load_memory_config()
+        if memory_config.enabled:
+            # Use the region from parameter if provided, otherwise use config default
+            memory_region = region_name if region_name else memory_config.region
+            memory_client = get_memory_client(
+                memory_name=memory_config.memory_name,
+                region=memory_region,
+                force_delete=force_delete_memory,
+            )
+            logger.info(f"Using AWS region for memory: {memory_region}")
+            memory_init = asyncio.create_task(memory_client.ainitialize())
+    except Exception as e:
+        logger.warning(f"Failed to create memory client: {e}")
+        memory_client = None
+
     # Create MCP client and get tools with retry logic
     mcp_tools = []
     max_retries = 3
@@ -454,27 +485,19 @@ async def create_multi_agent_system(
                 mcp_tools = []
                 break
 
+    # Identical MCP tool calls from different agents and turns share results
+    mcp_tools = cache_tool_results(mcp_tools)
+
     # Combine local tools with MCP tools
     local_tools = [get_current_time]
 
     # Add memory tools if memory system is enabled
     memory_tools = []
     try:
-        from .memory.client import SREMemoryClient
-        from .memory.config import _load_memory_config
         from .memory.tools import create_memory_tools
 
-        memory_config = _load_memory_config()
-        if memory_config.enabled:
+        if memory_client:
             logger.debug("Adding memory tools to agent tool list")
-            # Use the region from parameter if provided, otherwise use config default
-            memory_region = region_name if region_name else memory_config.region
-            memory_client = SREMemoryClient(
-                memory_name=memory_config.memory_name,
-                region=memory_region,
-                force_delete=force_delete_memory,
-            )
-            logger.info(f"Using AWS region for memory: {memory_region}")
             memory_tools = create_memory_tools(memory_client)
             logger.info(f"Added {len(memory_tools)} memory tools to agent tool list")
         else:
@@ -577,9 +600,14 @@ async def create_multi_agent_system(
         force_delete_memory=force_delete_memory,
         export_graph=export_graph,
         graph_output_path=graph_output_path,
+        parallel_execution=parallel_execution,
+        memory_client=memory_client,
         **llm_kwargs,
     )
 
+    if memory_init:
+        await memory_init
+
     return graph, all_tools
 
 
@@ -653,6 +681,7 @@ async def _run_interactive_session(
     save_markdown: bool = True,
     force_delete_memory: bool = False,
     region_name: str = "us-east-1",
+    parallel_execution: bool = False,
 ):
     """Run an interactive multi-turn conversation session."""
     # Buffer to store last query and response for /savereport command
@@ -690,6 +719,7 @@ async def _run_interactive_session(
         force_delete_memory=force_delete_memory,
         export_graph=False,  # Don't export in interactive mode each time
         region_name=region_name,
+        parallel_execution=parallel_execution,
     )
 
     # Initialize conversation state
@@ -877,6 +907,7 @@ async def _run_interactive_session(
                 # Stream with timeout protection
                 timeout_seconds = SREConstants.timeouts.graph_execution_timeout_seconds
                 start_time = asyncio.get_event_loop().time()
+                tool_cache_counters = start_investigation_tracking()
 
                 async for event in graph.astream(initial_state):
                     # Check for timeout
@@ -914,6 +945,10 @@ async def _run_interactive_session(
                                 metadata["plan_shown"] = True
 
                             if next_agent != "FINISH":
+                                # Parallel mode routes to several agents at once
+                                next_agent = ", ".join(
+                                    node_output.get("next_agents") or [next_agent]
+                                )
                                 print(f"🧭 Supervisor: Routing to {next_agent}")
                                 logger.info(f"🧭 Supervisor: Routing to {next_agent}")
                                 if reasoning:
@@ -936,14 +971,11 @@ async def _run_interactive_session(
                             print(f"\n🔧 {agent_name} Agent:")
                             logger.info(f"🔧 {agent_name} Agent:")
 
-                            # Extract and display tool traces from metadata
-                            metadata = node_output.get("metadata", {})
-                            # Look for traces using various possible key formats
+                            # Extract and display tool traces of this agent
                             agent_messages = []
-                            for key, value in metadata.items():
-                                if "_trace" in key and isinstance(value, list):
-                                    agent_messages = value
-                                    break
+                            for value in (node_output.get("traces") or {}).values():
+                                agent_messages = value
+                                break
 
                             # Show debug info about trace messages found (only in debug mode)
                             if should_show_debug_traces():
@@ -974,8 +1006,8 @@ async def _run_interactive_session(
                                             f"         Tool response for: {getattr(msg, 'tool_call_id', 'unknown')}"
                                         )
                             elif should_show_debug_traces():
-                                print("   ⚠️  No trace messages found in metadata")
-                                logger.info("   ⚠️  No trace messages found in metadata")
+                                print("   ⚠️  No trace messages found")
+                                logger.info("   ⚠️  No trace messages found")
 
                             # Display tool calls and results like in langgraph_agent.py (only in debug mode)
                             if should_show_debug_traces():
@@ -1062,6 +1094,10 @@ async def _run_interactive_session(
                                         "\n💡 Use /savereport to save this investigation report."
                                     )
 
+                logger.info(
+                    f"Tool result cache for this investigation: {investigation_stats(tool_cache_counters)}"
+                )
+
             except asyncio.TimeoutError:
                 if spinner:
                     spinner.stop()
@@ -1152,6 +1188,16 @@ async def main():
         action="store_true",
         help="Export the agent architecture as a Mermaid diagram",
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run independent investigation plan steps concurrently instead of one agent at a time",
+    )
+    parser.add_argument(
+        "--planning-mode",
+        choices=["structured", "react"],
+        help="Create the investigation plan in one structured LLM call (default) or with a planning agent that can call memory tools",
+    )
     parser.add_argument(
         "--graph-output",
         default="./docs/sre_agent_architecture.md",
@@ -1180,7 +1226,9 @@ async def main():
             # Fallback to AWS_REGION environment variable
             aws_region = os.environ.get("AWS_REGION")
             if aws_region:
-                logger.info(f"Using AWS region from AWS_REGION environment variable: {aws_region}")
+                logger.info(
+                    f"Using AWS region from AWS_REGION environment variable: {aws_region}"
+                )
             else:
                 # Final fallback to us-east-1
                 aws_region = "us-east-1"
@@ -1194,6 +1242,8 @@ async def main():
 
     # Set environment variable so other modules can check debug status
     os.environ["DEBUG"] = "true" if debug_enabled else "false"
+    if args.planning_mode:
+        os.environ["PLANNING_MODE"] = args.planning_mode
 
     logger.info(f"Starting multi-agent system with provider: {args.provider}")
     if debug_enabled:
@@ -1213,6 +1263,7 @@ async def main():
                     export_graph=True,
                     graph_output_path=args.graph_output,
                     region_name=aws_region,
+                    parallel_execution=args.parallel,
                 )
 
             await _run_interactive_session(
@@ -1222,6 +1273,7 @@ async def main():
                 save_markdown=not args.no_markdown,
                 force_delete_memory=args.force_delete_memory,
                 region_name=aws_region,
+                parallel_execution=args.parallel,
             )
         # Single prompt mode
         else:
@@ -1232,6 +1284,7 @@ async def main():
                     export_graph=args.export_graph,
                     graph_output_path=args.graph_output,
                     region_name=aws_region,
+                    parallel_execution=args.parallel,
                 )
                 logger.info("Multi-agent system created successfully")
             except Exception as e:
@@ -1293,6 +1346,7 @@ async def main():
                 # Stream with timeout protection
                 timeout_seconds = SREConstants.timeouts.graph_execution_timeout_seconds
                 start_time = asyncio.get_event_loop().time()
+                tool_cache_counters = start_investigation_tracking()
 
                 async for event in graph.astream(initial_state):
                     # Check for timeout
@@ -1329,6 +1383,10 @@ async def main():
                                 metadata["plan_shown"] = True
 
                             if next_agent != "FINISH":
+                                # Parallel mode routes to several agents at once
+                                next_agent = ", ".join(
+                                    node_output.get("next_agents") or [next_agent]
+                                )
                                 print(f"🧭 Supervisor: Routing to {next_agent}")
                                 logger.info(f"🧭 Supervisor: Routing to {next_agent}")
                                 if reasoning:
@@ -1351,14 +1409,11 @@ async def main():
                             print(f"\n🔧 {agent_name} Agent:")
                             logger.info(f"🔧 {agent_name} Agent:")
 
-                            # Extract and display tool traces from metadata
-                            metadata = node_output.get("metadata", {})
-                            # Look for traces using various possible key formats
+                            # Extract and display tool traces of this agent
                             agent_messages = []
-                            for key, value in metadata.items():
-                                if "_trace" in key and isinstance(value, list):
-                                    agent_messages = value
-                                    break
+                            for value in (node_output.get("traces") or {}).values():
+                                agent_messages = value
+                                break
 
                             # Show debug info about trace messages found (only in debug mode)
                             if should_show_debug_traces():
@@ -1389,8 +1444,8 @@ async def main():
                                             f"         Tool response for: {getattr(msg, 'tool_call_id', 'unknown')}"
                                         )
                             elif should_show_debug_traces():
-                                print("   ⚠️  No trace messages found in metadata")
-                                logger.info("   ⚠️  No trace messages found in metadata")
+                                print("   ⚠️  No trace messages found")
+                                logger.info("   ⚠️  No trace messages found")
 
                             # Display tool calls and results like in langgraph_agent.py (only in debug mode)
                             if should_show_debug_traces():
@@ -1476,6 +1531,10 @@ async def main():
                                         user_id=user_id,
                                         output_dir=args.output_dir,
                                     )
+
+                logger.info(
+                    f"Tool result cache for this investigation: {investigation_stats(tool_cache_counters)}"
+                )
             except asyncio.TimeoutError:
                 if spinner:
                     spinner.stop()
@@ -1494,6 +1553,11 @@ async def main():
     except Exception as e:
         logger.error(f"Error in multi-agent system: {e}")
         raise
+    finally:
+        # Persist memory writes still queued in the background before exiting
+        from .memory.registry import flush_memory_clients
+
+        await flush_memory_clients(timeout=30)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 
+import asyncio
 import logging
 import os
 from typing import Any, Dict, List, Optional
 
 from .constants import SREConstants
-from .llm_utils import create_llm_with_error_handling
+from .llm_utils import get_llm
 from .prompt_loader import prompt_loader
 
 # Configure logging with basicConfig
@@ -38,8 +39,8 @@ class SREOutputFormatter:
             f"Creating LLM for output formatter - Provider: {self.llm_provider}, Max tokens: {formatter_config['max_tokens']}"
         )
 
-        # Use the centralized error handling with formatter-specific config
-        return create_llm_with_error_handling(
+        # Shared across aggregations; created on first use with formatter-specific config
+        return get_llm(
             self.llm_provider, max_tokens=formatter_config["max_tokens"], **kwargs
         )
 
@@ -70,6 +71,49 @@ class SREOutputFormatter:
         user_preferences: Optional[List[Dict[str, Any]]] = None,
     ) -> str:
         """Format a complete investigation response in clean markdown."""
+        executive_summary = self._generate_executive_summary(
+            query, agent_results, metadata, user_preferences
+        )
+        return self._render_investigation_response(
+            query, agent_results, metadata, plan, executive_summary
+        )
+
+    async def aformat_investigation_response(
+        self,
+        query: str,
+        agent_results: Dict[str, Any],
+        metadata: Dict[str, Any],
+        plan: Optional[Dict[str, Any]] = None,
+        user_preferences: Optional[List[Dict[str, Any]]] = None,
+        timeout_seconds: Optional[float] = None,
+    ) -> str:
+        """Async variant of format_investigation_response.
+
+        The executive summary is generated with ``ainvoke`` so the event loop
+        keeps serving other work meanwhile. When called from a graph node, its
+        tokens reach callers streaming the graph with ``stream_mode="messages"``
+        as they are generated. If the summary is not ready within
+        ``timeout_seconds`` the fallback summary is used instead.
+        """
+        executive_summary = await self._agenerate_executive_summary(
+            query,
+            agent_results,
+            user_preferences,
+            timeout_seconds or SREConstants.timeouts.executive_summary_timeout_seconds,
+        )
+        return self._render_investigation_response(
+            query, agent_results, metadata, plan, executive_summary
+        )
+
+    def _render_investigation_response(
+        self,
+        query: str,
+        agent_results: Dict[str, Any],
+        metadata: Dict[str, Any],
+        plan: Optional[Dict[str, Any]],
+        executive_summary: str,
+    ) -> str:
+        """Assemble the investigation report around a generated executive summary."""
 
         # Extract key information
         plan_info = plan or metadata.get("investigation_plan", {})
@@ -85,9 +129,6 @@ class SREOutputFormatter:
         output.append("")
 
         # Executive Summary Section
-        executive_summary = self._generate_executive_summary(
-            query, agent_results, metadata, user_preferences
-        )
         if executive_summary:
             output.append(executive_summary)
             output.append("")
@@ -162,63 +203,100 @@ class SREOutputFormatter:
             return ""
 
         try:
-            from langchain_core.messages import HumanMessage, SystemMessage
-
             # Create LLM instance using configured provider
             llm = self._create_llm()
 
-            # Prepare agent results for analysis
-            formatted_results = []
-            for agent_name, result in agent_results.items():
-                if result and result != "No response provided":
-                    formatted_results.append(f"**{agent_name}:**\n{result}\n")
-
-            results_text = "\n".join(formatted_results)
+            response = llm.invoke(
+                self._executive_summary_messages(query, agent_results, user_preferences)
+            )
+            return str(response.content).strip()
 
-            # Add user preferences to the context if available
-            if user_preferences:
-                import json
+        except Exception as e:
+            logger.error(f"Error generating executive summary with LLM: {e}")
+            # Fallback to simple summary if LLM fails
+            return self._generate_fallback_summary(query, agent_results)
 
-                prefs_text = json.dumps(user_preferences, indent=2, default=str)
-                results_text += f"\n\n**User Preferences:**\n{prefs_text}\n"
+    async def _agenerate_executive_summary(
+        self,
+        query: str,
+        agent_results: Dict[str, Any],
+        user_preferences: Optional[List[Dict[str, Any]]],
+        timeout_seconds: float,
+    ) -> str:
+        """Generate the executive summary without blocking the event loop."""
+        if not agent_results:
+            return ""
 
-            # Get prompts from prompt loader
-            system_prompt, user_prompt = prompt_loader.get_executive_summary_prompts(
-                query=query, results_text=results_text
+        try:
+            llm = self._create_llm()
+            messages = self._executive_summary_messages(
+                query, agent_results, user_preferences
             )
 
-            # Log the prompts being sent to LLM for debugging
-            logger.info("=== EXECUTIVE SUMMARY PROMPT LOGGING ===")
-            logger.info(f"System Prompt Length: {len(system_prompt)} characters")
-            logger.info(f"User Prompt Length: {len(user_prompt)} characters")
-            if user_preferences:
-                logger.info(
-                    f"User preferences included in context: {len(user_preferences)} preference items"
-                )
-                logger.info(
-                    f"User preferences preview: {str(user_preferences)[:200]}..."
-                )
-            else:
-                logger.info(
-                    "No user preferences provided to executive summary generation"
-                )
-            logger.info(f"User Prompt Content:\n{user_prompt}")
-            logger.info("=== END EXECUTIVE SUMMARY PROMPT LOGGING ===")
-
-            # Generate executive summary
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt),
-            ]
-
-            response = llm.invoke(messages)
+            response = await asyncio.wait_for(
+                llm.ainvoke(messages), timeout=timeout_seconds
+            )
             return str(response.content).strip()
 
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Executive summary generation timed out after {timeout_seconds}s, using fallback summary"
+            )
+            return self._generate_fallback_summary(query, agent_results)
+
         except Exception as e:
             logger.error(f"Error generating executive summary with LLM: {e}")
             # Fallback to simple summary if LLM fails
             return self._generate_fallback_summary(query, agent_results)
 
+    def _executive_summary_messages(
+        self,
+        query: str,
+        agent_results: Dict[str, Any],
+        user_preferences: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Any]:
+        """Build the system and user messages asking for an executive summary."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        # Prepare agent results for analysis
+        formatted_results = []
+        for agent_name, result in agent_results.items():
+            if result and result != "No response provided":
+                formatted_results.append(f"**{agent_name}:**\n{result}\n")
+
+        results_text = "\n".join(formatted_results)
+
+        # Add user preferences to the context if available
+        if user_preferences:
+            import json
+
+            prefs_text = json.dumps(user_preferences, indent=2, default=str)
+            results_text += f"\n\n**User Preferences:**\n{prefs_text}\n"
+
+        # Get prompts from prompt loader
+        system_prompt, user_prompt = prompt_loader.get_executive_summary_prompts(
+            query=query, results_text=results_text
+        )
+
+        # Log the prompts being sent to LLM for debugging
+        logger.info("=== EXECUTIVE SUMMARY PROMPT LOGGING ===")
+        logger.info(f"System Prompt Length: {len(system_prompt)} characters")
+        logger.info(f"User Prompt Length: {len(user_prompt)} characters")
+        if user_preferences:
+            logger.info(
+                f"User preferences included in context: {len(user_preferences)} preference items"
+            )
+            logger.info(f"User preferences preview: {str(user_preferences)[:200]}...")
+        else:
+            logger.info("No user preferences provided to executive summary generation")
+        logger.info(f"User Prompt Content:\n{user_prompt}")
+        logger.info("=== END EXECUTIVE SUMMARY PROMPT LOGGING ===")
+
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt),
+        ]
+
     def _generate_fallback_summary(
         self, query: str, agent_results: Dict[str, Any]
     ) -> str:
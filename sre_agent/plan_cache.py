@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .constants import SREConstants
+
+if TYPE_CHECKING:
+    from .supervisor import InvestigationPlan
+
+# Logging will be configured by the main entry point
+logger = logging.getLogger(__name__)
+
+
+# (preference hash, query fingerprint)
+PlanCacheKey = Tuple[str, str]
+
+_NON_ALPHANUMERIC = re.compile(r"[^a-z0-9]+")
+
+# MinHash parameters: 64 permutations of 3-character shingles
+_NUM_PERMUTATIONS = 64
+_SHINGLE_SIZE = 3
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_NUM_PERMUTATIONS)
+]
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase the query and reduce punctuation and whitespace to single spaces."""
+    return _NON_ALPHANUMERIC.sub(" ", query.lower()).strip()
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def _minhash(text: str) -> Tuple[int, ...]:
+    """MinHash signature of the character shingles of a normalized query."""
+    shingles = {
+        text[i : i + _SHINGLE_SIZE]
+        for i in range(max(1, len(text) - _SHINGLE_SIZE + 1))
+    }
+    hashes = [
+        int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for shingle in shingles
+    ]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS
+    )
+
+
+def _similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return sum(1 for a, b in zip(left, right) if a == b) / _NUM_PERMUTATIONS
+
+
+class _Entry:
+    __slots__ = ("plan", "created", "planning_seconds", "signature")
+
+    def __init__(
+        self,
+        plan: "InvestigationPlan",
+        planning_seconds: float,
+        signature: Optional[Tuple[int, ...]],
+    ):
+        self.plan = plan
+        self.created = time.monotonic()
+        self.planning_seconds = planning_seconds
+        self.signature = signature
+
+
+class PlanCache:
+    """Thread-safe LRU cache of investigation plans with a TTL.
+
+    Plans are keyed by a fingerprint of the normalized query and a hash of
+    the user's preferences, so users with different preferences never share
+    a plan. With ``near_duplicates`` enabled, a query that misses the exact
+    key reuses the plan of the most similar cached query with the same
+    preferences when their MinHash similarity reaches
+    ``similarity_threshold``.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl_seconds: float = 900.0,
+        near_duplicates: bool = False,
+        similarity_threshold: float = 0.85,
+    ):
+        """Create the cache.
+
+        Args:
+            max_entries: Plans kept before the least recently used is evicted
+            ttl_seconds: Seconds a plan stays valid; 0 disables the cache
+            near_duplicates: Match near-duplicate queries as well as exact ones
+            similarity_threshold: Minimum similarity for a near-duplicate hit
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.near_duplicates = near_duplicates
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[PlanCacheKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "near_duplicate_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "planning_seconds_saved": 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl_seconds > 0
+
+    @staticmethod
+    def make_key(query: str, user_preferences: List[Any]) -> PlanCacheKey:
+        """Key a query by its normalized fingerprint and the user's preferences."""
+        preferences = json.dumps(user_preferences or [], sort_keys=True, default=str)
+        return (_digest(preferences), _digest(normalize_query(query)))
+
+    def get(
+        self, key: PlanCacheKey, query: str
+    ) -> Optional[Tuple["InvestigationPlan", str]]:
+        """Return a copy of the cached plan and how it matched, or None on a miss.
+
+        The match is ``"exact"`` or ``"near_duplicate"``.
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._drop_expired()
+            entry = self._entries.get(key)
+            match = "exact"
+            if entry is None and self.near_duplicates:
+                entry, key = self._nearest(key[0], _minhash(normalize_query(query)))
+                match = "near_duplicate"
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._stats["hits" if match == "exact" else "near_duplicate_hits"] += 1
+            self._stats["planning_seconds_saved"] += entry.planning_seconds
+            return entry.plan.model_copy(deep=True), match
+
+    def put(
+        self,
+        key: PlanCacheKey,
+        query: str,
+        plan: "InvestigationPlan",
+        planning_seconds: float,
+    ) -> None:
+        """Cache a plan along with the time it took to create."""
+        if not self.enabled:
+            return
+        signature = _minhash(normalize_query(query)) if self.near_duplicates else None
+        with self._lock:
+            self._entries[key] = _Entry(
+                plan.model_copy(deep=True), planning_seconds, signature
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _drop_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.created > self.ttl_seconds
+        ]
+        for key in expired:
+            del self._entries[key]
+
+    def _nearest(
+        self, preference_hash: str, signature: Tuple[int, ...]
+    ) -> Tuple[Optional[_Entry], Optional[PlanCacheKey]]:
+        """Most similar entry with the same preferences above the threshold."""
+        best: Tuple[Optional[_Entry], Optional[PlanCacheKey]] = (None, None)
+        best_similarity = self.similarity_threshold
+        for key, entry in self._entries.items():
+            if key[0] != preference_hash or entry.signature is None:
+                continue
+            similarity = _similarity(signature, entry.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = (entry, key), similarity
+        return best
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit, miss and eviction counters and the planning time saved."""
+        with self._lock:
+            hits = self._stats["hits"] + self._stats["near_duplicate_hits"]
+            lookups = hits + self._stats["misses"]
+            return {
+                **self._stats,
+                "planning_seconds_saved": round(
+                    self._stats["planning_seconds_saved"], 3
+                ),
+                "size": len(self._entries),
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+
+_plan_cache: Optional[PlanCache] = None
+_lock = threading.Lock()
+
+
+def get_plan_cache() -> PlanCache:
+    """Return the process-wide plan cache, created from the planning config."""
+    global _plan_cache
+    with _lock:
+        if _plan_cache is None:
+            config = SREConstants.planning
+            _plan_cache = PlanCache(
+                max_entries=config.plan_cache_max_entries,
+                ttl_seconds=config.plan_cache_ttl_seconds,
+                near_duplicates=config.plan_cache_near_duplicates,
+                similarity_threshold=config.plan_cache_similarity_threshold,
+            )
+        return _plan_cache
+
+
+def plan_cache_stats() -> Dict[str, Any]:
+    """Statistics of the process-wide plan cache."""
+    return get_plan_cache().stats()
@@ -3,9 +3,11 @@
 import json
 import logging
 import os
+import re
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.prebuilt import create_react_agent
@@ -13,13 +15,15 @@ from pydantic import BaseModel, Field, field_validator
 
 from .agent_state import AgentState
 from .constants import SREConstants
-from .llm_utils import create_llm_with_error_handling
+from .llm_utils import get_llm
 from .memory import create_conversation_memory_manager
 from .memory.client import SREMemoryClient
 from .memory.config import _load_memory_config
 from .memory.hooks import MemoryHookProvider
+from .memory.registry import get_memory_client
 from .memory.tools import create_memory_tools
 from .output_formatter import create_formatter
+from .plan_cache import PlanCache, get_plan_cache
 from .prompt_loader import prompt_loader
 
 
@@ -128,6 +132,38 @@ class InvestigationPlan(BaseModel):
     reasoning: str = Field(
         description="Brief explanation of the investigation approach"
     )
+    dependencies: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Optional map of an agent in agents_sequence to the agents whose results it needs first. Agents without dependencies can run in parallel",
+    )
+
+
+# "structured": one structured-output call; "react": planning agent with memory tools
+PLANNING_MODES = ("structured", "react")
+
+# Memory tool instructions of the supervisor prompt, dropped when planning without tools
+_MEMORY_TOOL_SECTION = re.compile(
+    r"<memory_retrieval_tool>.*?</memory_retrieval_tool>\s*", re.DOTALL
+)
+
+
+def _fallback_plan(reason: str) -> InvestigationPlan:
+    """Basic plan used when the planning agent's response cannot be parsed."""
+    return InvestigationPlan(
+        steps=[
+            "Investigate the reported issue",
+            "Analyze findings and provide recommendations",
+        ],
+        agents_sequence=["metrics_agent", "logs_agent"],
+        complexity="simple",
+        auto_execute=True,
+        reasoning=f"Default investigation plan due to {reason}",
+    )
+
+
+def _agent_node_name(agent: str) -> str:
+    """Normalize short agent names like "logs" to graph node names like "logs_agent"."""
+    return agent if agent.endswith("_agent") else f"{agent}_agent"
 
 
 class RouteDecision(BaseModel):
@@ -174,15 +210,10 @@ def _read_supervisor_prompt() -> str:
     )
 
 
-def _read_planning_prompt() -> str:
+def _read_planning_prompt(filename: str = "supervisor_planning_prompt.txt") -> str:
     """Read planning prompt from file."""
     try:
-        prompt_path = (
-            Path(__file__).parent
-            / "config"
-            / "prompts"
-            / "supervisor_planning_prompt.txt"
-        )
+        prompt_path = Path(__file__).parent / "config" / "prompts" / filename
         if prompt_path.exists():
             return prompt_path.read_text().strip()
     except Exception as e:
@@ -195,7 +226,8 @@ Create the plan in JSON format with these fields:
 - agents_sequence: List of agents to invoke (kubernetes_agent, logs_agent, metrics_agent, runbooks_agent)
 - complexity: "simple" or "complex"
 - auto_execute: true or false
-- reasoning: Brief explanation of the investigation approach"""
+- reasoning: Brief explanation of the investigation approach
+- dependencies: Optional map of an agent to the agents whose results it needs first (e.g. {"runbooks_agent": ["logs_agent"]}); agents without dependencies run in parallel"""
 
 
 class SupervisorAgent:
@@ -205,10 +237,28 @@ class SupervisorAgent:
         self,
         llm_provider: str = "bedrock",
         force_delete_memory: bool = False,
+        parallel_execution: bool = False,
+        memory_client: Optional[SREMemoryClient] = None,
+        plan_cache: Optional[PlanCache] = None,
+        planning_mode: Optional[str] = None,
         **llm_kwargs,
     ):
         self.llm_provider = llm_provider
+        self.parallel_execution = parallel_execution
+        # "structured" plans in a single LLM call over the pre-fetched memory
+        # context, "react" lets a planning agent call the memory tools itself
+        self.planning_mode = planning_mode or os.getenv(
+            "PLANNING_MODE", SREConstants.planning.planning_mode
+        )
+        if self.planning_mode not in PLANNING_MODES:
+            logger.warning(
+                f"Invalid planning mode '{self.planning_mode}', defaulting to 'structured'"
+            )
+            self.planning_mode = "structured"
+        # Plans are shared across supervisors and requests in the process
+        self.plan_cache = plan_cache or get_plan_cache()
         self.llm = self._create_llm(**llm_kwargs)
+        self.structured_planner = self.llm.with_structured_output(InvestigationPlan)
         self.system_prompt = _read_supervisor_prompt()
         self.formatter = create_formatter(llm_provider=llm_provider)
 
@@ -217,7 +267,8 @@ class SupervisorAgent:
         if self.memory_config.enabled:
             # Use region from llm_kwargs if provided for bedrock
             memory_region = llm_kwargs.get("region_name", self.memory_config.region) if llm_provider == "bedrock" else self.memory_config.region
-            self.memory_client = SREMemoryClient(
+            # Share the process-wide client instead of repeating its control-plane setup
+            self.memory_client = memory_client or get_memory_client(
                 memory_name=self.memory_config.memory_name,
                 region=memory_region,
                 force_delete=force_delete_memory,
@@ -231,9 +282,12 @@ class SupervisorAgent:
             self.memory_tools = create_memory_tools(self.memory_client)
 
             # Create react agent with memory tools for supervised planning
-            self.planning_agent = create_react_agent(self.llm, self.memory_tools)
+            if self.planning_mode == "react":
+                self.planning_agent = create_react_agent(self.llm, self.memory_tools)
+            else:
+                self.planning_agent = None
             logger.info(
-                f"Memory system initialized for supervisor agent with {len(self.memory_tools)} memory tools"
+                f"Memory system initialized for supervisor agent with {len(self.memory_tools)} memory tools, planning mode: {self.planning_mode}"
             )
         else:
             self.memory_client = None
@@ -244,8 +298,8 @@ class SupervisorAgent:
             logger.info("Memory system disabled")
 
     def _create_llm(self, **kwargs):
-        """Create LLM instance with improved error handling."""
-        return create_llm_with_error_handling(self.llm_provider, **kwargs)
+        """Return the shared LLM instance for this configuration."""
+        return get_llm(self.llm_provider, **kwargs)
 
     async def retrieve_memory(
         self,
@@ -305,6 +359,7 @@ class SupervisorAgent:
 
         # Retrieve memory context if memory system is enabled
         memory_context_text = ""
+        user_preferences: List[Any] = []
         if self.memory_client:
             try:
                 logger.info(
@@ -317,7 +372,9 @@ class SupervisorAgent:
                         "session_id is required for memory retrieval but not found in state"
                     )
 
-                memory_context = self.memory_hooks.on_investigation_start(
+                # Preferences, infrastructure and past investigations are
+                # retrieved concurrently, each with its own deadline
+                memory_context = await self.memory_hooks.aon_investigation_start(
                     query=current_query,
                     user_id=user_id,
                     actor_id=actor_id,
@@ -329,12 +386,12 @@ class SupervisorAgent:
                 state["memory_context"] = memory_context
 
                 # Log user preferences for debugging (they're stored in memory_context)
-                user_prefs = memory_context.get("user_preferences", [])
+                user_preferences = memory_context.get("user_preferences", [])
                 logger.debug(
-                    f"Stored {len(user_prefs)} user preferences in memory_context during planning"
+                    f"Stored {len(user_preferences)} user preferences in memory_context during planning"
                 )
                 logger.debug(
-                    f"User preferences being stored in memory_context: {user_prefs}"
+                    f"User preferences being stored in memory_context: {user_preferences}"
                 )
 
                 # Format memory context for prompt
@@ -376,8 +433,96 @@ class SupervisorAgent:
                 logger.error(f"Failed to retrieve memory context: {e}", exc_info=True)
                 memory_context_text = ""
 
-        # Enhanced planning prompt that instructs the agent to use memory tools
-        planning_instructions = _read_planning_prompt()
+        # Reuse the plan of a recent identical (or near-duplicate) query from a
+        # user with the same preferences instead of planning again
+        cache_key = self.plan_cache.make_key(current_query, user_preferences)
+        cached = self.plan_cache.get(cache_key, current_query)
+        if cached:
+            plan, match = cached
+            logger.info(
+                f"Plan cache hit ({match}) for query '{current_query}', skipped planning LLM call - {self.plan_cache.stats()}"
+            )
+        else:
+            planning_started = time.perf_counter()
+            plan, is_fallback = await self._plan_with_llm(
+                current_query, user_id, session_id, memory_context_text
+            )
+            planning_seconds = time.perf_counter() - planning_started
+            # Fallback plans stand in for a failed LLM call, never reuse them
+            if not is_fallback:
+                self.plan_cache.put(cache_key, current_query, plan, planning_seconds)
+            logger.info(
+                f"Planning took {planning_seconds:.2f}s (plan cache miss) - {self.plan_cache.stats()}"
+            )
+
+        logger.info(
+            f"Created investigation plan: {len(plan.steps)} steps, complexity: {plan.complexity}"
+        )
+
+        # Store conversation in memory
+        if self.conversation_manager and user_id and session_id:
+            try:
+                # Get supervisor display name with fallback
+                supervisor_name = getattr(SREConstants.agents, "supervisor", None)
+                if supervisor_name:
+                    supervisor_display_name = supervisor_name.display_name
+                else:
+                    supervisor_display_name = "Supervisor Agent"
+
+                messages_to_store = [
+                    (current_query, "USER"),
+                    (
+                        f"[Agent: {supervisor_display_name}]\nInvestigation Plan:\n{self._format_plan_markdown(plan)}",
+                        "ASSISTANT",
+                    ),
+                ]
+
+                success = self.conversation_manager.store_conversation_batch(
+                    messages=messages_to_store,
+                    user_id=user_id,
+                    session_id=session_id,
+                    agent_name=supervisor_display_name,
+                )
+
+                if success:
+                    logger.info("Supervisor: Successfully stored planning conversation")
+                else:
+                    logger.warning("Supervisor: Failed to store planning conversation")
+
+            except Exception as e:
+                logger.error(
+                    f"Supervisor: Error storing planning conversation: {e}",
+                    exc_info=True,
+                )
+
+        return plan
+
+    async def _plan_with_llm(
+        self,
+        current_query: str,
+        user_id: str,
+        session_id: Optional[str],
+        memory_context_text: str,
+    ) -> Tuple[InvestigationPlan, bool]:
+        """Ask the LLM for an investigation plan.
+
+        In structured mode the plan comes from a single structured-output call
+        over the memory context retrieved up front. In react mode a planning
+        agent with memory tools may retrieve more context before answering
+        with the plan as JSON.
+
+        Returns:
+            The plan, and whether it is the fallback plan used when the LLM
+            gave no usable answer
+        """
+        use_react = bool(self.planning_agent and self.memory_tools)
+        if use_react:
+            # Enhanced planning prompt that instructs the agent to use memory tools
+            planning_instructions = _read_planning_prompt()
+        else:
+            planning_instructions = _read_planning_prompt(
+                "supervisor_structured_planning_prompt.txt"
+            )
         # Replace placeholders manually to avoid issues with JSON braces in the prompt
         formatted_planning_instructions = planning_instructions.replace(
             "{user_id}", user_id
@@ -387,14 +532,19 @@ class SupervisorAgent:
                 "{session_id}", session_id
             )
 
-        planning_prompt = f"""{self.system_prompt}
+        system_prompt = (
+            self.system_prompt
+            if use_react
+            else _MEMORY_TOOL_SECTION.sub("", self.system_prompt)
+        )
+        planning_prompt = f"""{system_prompt}
 
 User's query: {current_query}
 {memory_context_text}
 
 {formatted_planning_instructions}"""
 
-        if self.planning_agent and self.memory_tools:
+        if use_react:
             # Use planning agent with memory tools
             try:
                 # Create messages for the planning agent
@@ -429,9 +579,17 @@ User's query: {current_query}
                     ]
 
                     json_content = None
+                    # Cleared once the plan is parsed from the response
+                    is_fallback = True
                     for pattern in json_patterns:
                         json_match = re.search(pattern, plan_text, re.DOTALL)
                         if json_match:
+                            # Narrower patterns can cut a nested object such as
+                            # "dependencies" short, so only accept valid JSON
+                            try:
+                                json.loads(json_match.group())
+                            except json.JSONDecodeError:
+                                continue
                             json_content = json_match.group()
                             logger.info(
                                 f"Extracted JSON content using pattern: {json_content}"
@@ -445,6 +603,7 @@ User's query: {current_query}
                             plan_json = json.loads(json_content)
                             logger.info(f"Successfully parsed JSON: {plan_json}")
                             plan = InvestigationPlan(**plan_json)
+                            is_fallback = False
                             logger.info(
                                 "Successfully created InvestigationPlan from JSON"
                             )
@@ -454,48 +613,21 @@ User's query: {current_query}
                             logger.warning(
                                 "Could not parse JSON from planning agent response, using fallback"
                             )
-                            plan = InvestigationPlan(
-                                steps=[
-                                    "Investigate the reported issue",
-                                    "Analyze findings and provide recommendations",
-                                ],
-                                agents_sequence=["metrics_agent", "logs_agent"],
-                                complexity="simple",
-                                auto_execute=True,
-                                reasoning="Default investigation plan due to JSON parsing error",
-                            )
+                            plan = _fallback_plan("JSON parsing error")
                         except Exception as e:
                             logger.error(f"Error creating InvestigationPlan: {e}")
                             logger.error(f"Plan JSON was: {plan_json}")
                             logger.warning(
                                 "Could not create InvestigationPlan from parsed JSON, using fallback"
                             )
-                            plan = InvestigationPlan(
-                                steps=[
-                                    "Investigate the reported issue",
-                                    "Analyze findings and provide recommendations",
-                                ],
-                                agents_sequence=["metrics_agent", "logs_agent"],
-                                complexity="simple",
-                                auto_execute=True,
-                                reasoning="Default investigation plan due to validation error",
-                            )
+                            plan = _fallback_plan("validation error")
                     else:
                         # Fallback to basic plan if JSON parsing fails
                         logger.warning(
                             "Could not find JSON pattern in planning agent response, using fallback"
                         )
                         logger.warning(f"Response content was: {plan_text}")
-                        plan = InvestigationPlan(
-                            steps=[
-                                "Investigate the reported issue",
-                                "Analyze findings and provide recommendations",
-                            ],
-                            agents_sequence=["metrics_agent", "logs_agent"],
-                            complexity="simple",
-                            auto_execute=True,
-                            reasoning="Default investigation plan due to no JSON found",
-                        )
+                        plan = _fallback_plan("no JSON found")
                 else:
                     raise ValueError("No response from planning agent")
 
@@ -504,64 +636,41 @@ User's query: {current_query}
                     f"Error using planning agent with memory tools: {e}", exc_info=True
                 )
                 # Fallback to structured output without tools
-                structured_llm = self.llm.with_structured_output(InvestigationPlan)
-                plan = await structured_llm.ainvoke(
-                    [
-                        SystemMessage(content=planning_prompt),
-                        HumanMessage(content=current_query),
-                    ]
+                plan, is_fallback = await self._plan_structured(
+                    planning_prompt, current_query
                 )
         else:
-            # Fallback to structured output without memory tools
-            structured_llm = self.llm.with_structured_output(InvestigationPlan)
-            plan = await structured_llm.ainvoke(
-                [
-                    SystemMessage(content=planning_prompt),
-                    HumanMessage(content=current_query),
-                ]
+            plan, is_fallback = await self._plan_structured(
+                planning_prompt, current_query
             )
 
-        logger.info(
-            f"Created investigation plan: {len(plan.steps)} steps, complexity: {plan.complexity}"
-        )
+        return plan, is_fallback
 
-        # Store conversation in memory
-        if self.conversation_manager and user_id and session_id:
-            try:
-                # Get supervisor display name with fallback
-                supervisor_name = getattr(SREConstants.agents, "supervisor", None)
-                if supervisor_name:
-                    supervisor_display_name = supervisor_name.display_name
-                else:
-                    supervisor_display_name = "Supervisor Agent"
+    async def _plan_structured(
+        self, planning_prompt: str, current_query: str
+    ) -> Tuple[InvestigationPlan, bool]:
+        """Create the plan in a single structured-output LLM call.
 
-                messages_to_store = [
-                    (current_query, "USER"),
-                    (
-                        f"[Agent: {supervisor_display_name}]\nInvestigation Plan:\n{self._format_plan_markdown(plan)}",
-                        "ASSISTANT",
+        Returns:
+            The plan, and whether it is the fallback plan
+        """
+        try:
+            plan = await self.structured_planner.ainvoke(
+                [
+                    SystemMessage(content=planning_prompt),
+                    HumanMessage(
+                        content=f"Create an investigation plan for: {current_query}"
                     ),
                 ]
+            )
+        except Exception as e:
+            logger.error(f"Structured planning failed: {e}", exc_info=True)
+            plan = None
 
-                success = self.conversation_manager.store_conversation_batch(
-                    messages=messages_to_store,
-                    user_id=user_id,
-                    session_id=session_id,
-                    agent_name=supervisor_display_name,
-                )
-
-                if success:
-                    logger.info("Supervisor: Successfully stored planning conversation")
-                else:
-                    logger.warning("Supervisor: Failed to store planning conversation")
-
-            except Exception as e:
-                logger.error(
-                    f"Supervisor: Error storing planning conversation: {e}",
-                    exc_info=True,
-                )
-
-        return plan
+        if plan is None:
+            logger.warning("No plan from structured planning call, using fallback")
+            return _fallback_plan("structured output error"), True
+        return plan, False
 
     def _format_plan_markdown(self, plan: InvestigationPlan) -> str:
         """Format investigation plan as properly formatted markdown."""
@@ -584,8 +693,89 @@ User's query: {current_query}
             )
             plan_text += f"**👥 Agents involved:** {agents_list}\n"
 
+        if plan.dependencies:
+            dependencies_list = "; ".join(
+                f"{agent.replace('_', ' ').title()} after "
+                + ", ".join(dep.replace("_", " ").title() for dep in deps)
+                for agent, deps in plan.dependencies.items()
+                if deps
+            )
+            if dependencies_list:
+                plan_text += f"**🔗 Dependencies:** {dependencies_list}\n"
+
         return plan_text
 
+    def _ready_agents(
+        self, plan: InvestigationPlan, dispatched: List[str]
+    ) -> List[str]:
+        """Return the plan's remaining agents whose dependencies have all completed."""
+        sequence = list(
+            dict.fromkeys(_agent_node_name(agent) for agent in plan.agents_sequence)
+        )
+        remaining = [agent for agent in sequence if agent not in dispatched]
+
+        # Dependencies on agents outside the plan can never be met, so ignore them
+        dependencies = {
+            _agent_node_name(agent): {_agent_node_name(dep) for dep in deps}
+            & set(sequence)
+            for agent, deps in plan.dependencies.items()
+        }
+        ready = [
+            agent
+            for agent in remaining
+            if dependencies.get(agent, set()) <= set(dispatched)
+        ]
+
+        if remaining and not ready:
+            logger.warning(
+                f"Plan dependencies {plan.dependencies} cannot be satisfied, running {remaining} together"
+            )
+            return remaining
+        return ready
+
+    def _route_parallel(
+        self,
+        plan: InvestigationPlan,
+        state: AgentState,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send every plan step whose dependencies are met to its agent at once.
+
+        The graph runs the agents in ``next_agents`` concurrently and comes back
+        to the supervisor only after all of them have finished, so every agent
+        dispatched earlier has completed by the time this is called again.
+        """
+        # Only changed metadata keys are returned; the state reducer merges them
+        metadata = extra_metadata or {}
+        dispatched = state.get("metadata", {}).get("dispatched_agents", [])
+        ready = self._ready_agents(plan, dispatched)
+
+        if not ready:
+            return {
+                "next": "FINISH",
+                "next_agents": [],
+                "metadata": {
+                    **metadata,
+                    "routing_reasoning": "Investigation plan completed. Presenting results.",
+                    "plan_step": len(dispatched),
+                },
+                # Preserve memory context in state
+                "memory_context": state.get("memory_context", {}),
+            }
+
+        return {
+            "next": ready[0],
+            "next_agents": ready,
+            "metadata": {
+                **metadata,
+                "routing_reasoning": f"Executing {len(ready)} independent plan step(s) in parallel: {', '.join(ready)}",
+                "dispatched_agents": dispatched + ready,
+                "plan_step": len(dispatched),
+            },
+            # Preserve memory context in state
+            "memory_context": state.get("memory_context", {}),
+        }
+
     async def route(self, state: AgentState) -> Dict[str, Any]:
         """Determine which agent should handle the query next."""
         agents_invoked = state.get("agents_invoked", [])
@@ -606,7 +796,6 @@ User's query: {current_query}
                 return {
                     "next": "FINISH",
                     "metadata": {
-                        **state.get("metadata", {}),
                         "investigation_plan": plan.model_dump(),
                         "routing_reasoning": f"Created investigation plan. Complexity: {plan.complexity}",
                         "plan_pending_approval": True,
@@ -615,6 +804,17 @@ User's query: {current_query}
                     # Preserve memory context in state
                     "memory_context": state.get("memory_context", {}),
                 }
+            elif self.parallel_execution:
+                # Simple plan - start every independent step at once
+                return self._route_parallel(
+                    plan,
+                    state,
+                    extra_metadata={
+                        "investigation_plan": plan.model_dump(),
+                        "plan_text": self._format_plan_markdown(plan),
+                        "show_plan": True,
+                    },
+                )
             else:
                 # Simple plan - start execution
                 next_agent = (
@@ -624,7 +824,6 @@ User's query: {current_query}
                 return {
                     "next": next_agent,
                     "metadata": {
-                        **state.get("metadata", {}),
                         "investigation_plan": plan.model_dump(),
                         "routing_reasoning": f"Executing plan step 1: {plan.steps[0] if plan.steps else 'Start'}",
                         "plan_step": 0,
@@ -637,6 +836,9 @@ User's query: {current_query}
         else:
             # Continue executing existing plan
             plan = InvestigationPlan(**existing_plan)
+            if self.parallel_execution:
+                return self._route_parallel(plan, state)
+
             current_step = state.get("metadata", {}).get("plan_step", 0)
 
             # Check if plan is complete
@@ -650,7 +852,6 @@ User's query: {current_query}
                 return {
                     "next": "FINISH",
                     "metadata": {
-                        **state.get("metadata", {}),
                         "routing_reasoning": "Investigation plan completed. Presenting results.",
                         "plan_step": next_step,
                     },
@@ -669,7 +870,6 @@ User's query: {current_query}
                 return {
                     "next": next_agent,
                     "metadata": {
-                        **state.get("metadata", {}),
                         "routing_reasoning": f"Executing plan step {next_step + 1}: {step_description}",
                         "plan_step": next_step,
                     },
@@ -738,7 +938,7 @@ You can:
 
         try:
             # Try enhanced formatting first
-            final_response = self.formatter.format_investigation_response(
+            final_response = await self.formatter.aformat_investigation_response(
                 query=query,
                 agent_results=agent_results,
                 metadata=metadata,
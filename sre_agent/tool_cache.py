@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+# Logging will be configured by the main entry point
+logger = logging.getLogger(__name__)
+
+
+# (tool name, canonical JSON of the arguments)
+ToolCacheKey = Tuple[str, str]
+
+# Counters kept per process and per investigation
+_COUNTERS = ("calls", "hits", "coalesced", "misses", "uncached", "errors")
+
+# Counters of the investigation running in the current context, if tracked
+_investigation_counters: ContextVar[Optional[Dict[str, int]]] = ContextVar(
+    "tool_cache_investigation_counters", default=None
+)
+
+
+class _FetchCancelledError(Exception):
+    """The call other identical calls were waiting on was cancelled."""
+
+
+def _base_tool_name(tool_name: str) -> str:
+    """Strip the gateway target prefix, e.g. ``k8s___get_pod_status``."""
+    return tool_name.split("___")[-1] if "___" in tool_name else tool_name
+
+
+def _with_hit_rate(counters: Dict[str, Any]) -> Dict[str, Any]:
+    served = counters["hits"] + counters["coalesced"]
+    return {
+        **counters,
+        "hit_rate": served / counters["calls"] if counters["calls"] else 0.0,
+    }
+
+
+def start_investigation_tracking() -> Dict[str, int]:
+    """Count tool cache activity of the investigation run from the current context.
+
+    Call it before running the graph; tasks the graph starts inherit the
+    context, so the returned counters are updated by every tool call of the
+    investigation. Use ``investigation_stats`` to read them.
+    """
+    counters = {name: 0 for name in _COUNTERS}
+    _investigation_counters.set(counters)
+    return counters
+
+
+def investigation_stats(counters: Dict[str, int]) -> Dict[str, Any]:
+    """Counters returned by ``start_investigation_tracking`` with the hit rate."""
+    return _with_hit_rate(counters)
+
+
+class ToolResultCache:
+    """LRU cache of MCP tool results with per-tool TTLs and single-flight calls.
+
+    Results are keyed by tool name and canonicalized arguments. Identical
+    calls issued while one is running wait for its result instead of calling
+    the tool again, and later ones reuse it until the tool's TTL passes. Tools
+    with a TTL of 0 are always called. Failed calls are not cached.
+
+    All calls must be made from the event loop serving the investigations.
+    """
+
+    def __init__(
+        self,
+        default_ttl_seconds: float = 30.0,
+        tool_ttl_seconds: Optional[Dict[str, float]] = None,
+        max_entries: int = 512,
+    ):
+        """Create the cache.
+
+        Args:
+            default_ttl_seconds: TTL of tools without their own entry
+            tool_ttl_seconds: TTL per tool name, without the gateway target prefix
+            max_entries: Results kept before the least recently used is evicted;
+                0 disables the cache
+        """
+        self.default_ttl_seconds = default_ttl_seconds
+        self.tool_ttl_seconds = dict(tool_ttl_seconds or {})
+        self.max_entries = max_entries
+        # key -> (expiry, result)
+        self._entries: "OrderedDict[ToolCacheKey, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[ToolCacheKey, asyncio.Future] = {}
+        self._counters = {name: 0 for name in _COUNTERS}
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def ttl_for(self, tool_name: str) -> float:
+        return self.tool_ttl_seconds.get(
+            _base_tool_name(tool_name), self.default_ttl_seconds
+        )
+
+    @staticmethod
+    def make_key(tool_name: str, args: Dict[str, Any]) -> ToolCacheKey:
+        """Key a call by tool name and its arguments, ignoring order and null values."""
+        canonical = json.dumps(
+            {name: value for name, value in args.items() if value is not None},
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return (tool_name, canonical)
+
+    async def call(
+        self,
+        tool_name: str,
+        args: Dict[str, Any],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Return the cached result of the call, or run ``fetch`` to produce it."""
+        self._record("calls")
+        ttl = self.ttl_for(tool_name)
+        if not self.enabled or ttl <= 0:
+            self._record("uncached")
+            return await fetch()
+
+        key = self.make_key(tool_name, args)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if time.monotonic() < entry[0]:
+                self._entries.move_to_end(key)
+                self._record("hits")
+                return entry[1]
+            del self._entries[key]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self._record("coalesced")
+            try:
+                # Shielded so a waiter giving up does not cancel the shared call
+                return await asyncio.shield(in_flight)
+            except _FetchCancelledError:
+                return await fetch()
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        self._record("misses")
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.set_exception(_FetchCancelledError())
+            future.exception()  # Waiters may not exist; don't warn about it
+            raise
+        except Exception as e:
+            self._record("errors")
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        future.set_result(result)
+        return result
+
+    def _record(self, counter: str) -> None:
+        self._counters[counter] += 1
+        investigation = _investigation_counters.get()
+        if investigation is not None:
+            investigation[counter] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return call counters, the hit rate and the cache occupancy."""
+        return {
+            **_with_hit_rate(dict(self._counters)),
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "in_flight": len(self._in_flight),
+        }
+
+
+def cache_tool_results(
+    tools: List[BaseTool], cache: Optional["ToolResultCache"] = None
+) -> List[BaseTool]:
+    """Route calls of async tools, such as the MCP gateway tools, through the cache.
+
+    Args:
+        tools: Tools to wrap; tools without a coroutine are returned unchanged
+        cache: Cache to use (defaults to the process-wide cache)
+
+    Returns:
+        Tools with the same names, descriptions and schemas
+    """
+    cache = cache or get_tool_result_cache()
+    if not cache.enabled:
+        return tools
+
+    def _wrap(tool: BaseTool) -> BaseTool:
+        if not isinstance(tool, StructuredTool) or tool.coroutine is None:
+            return tool
+        coroutine = tool.coroutine
+
+        async def cached_coroutine(**kwargs: Any) -> Any:
+            return await cache.call(tool.name, kwargs, lambda: coroutine(**kwargs))
+
+        return tool.model_copy(update={"coroutine": cached_coroutine})
+
+    return [_wrap(tool) for tool in tools]
+
+
+_tool_result_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_result_cache() -> ToolResultCache:
+    """Return the process-wide tool result cache, configured in agent_config.yaml."""
+    global _tool_result_cache
+    if _tool_result_cache is None:
+        from .agent_nodes import _load_agent_config
+
+        config = _load_agent_config().get("tool_cache") or {}
+        enabled = config.get("enabled", True)
+        _tool_result_cache = ToolResultCache(
+            default_ttl_seconds=float(config.get("default_ttl_seconds", 30)),
+            tool_ttl_seconds={
+                name: float(ttl)
+                for name, ttl in (config.get("ttl_seconds") or {}).items()
+            },
+            max_entries=int(config.get("max_entries", 512)) if enabled else 0,
+        )
+    return _tool_result_cache
+
+
+def tool_cache_stats() -> Dict[str, Any]:
+    """Statistics of the process-wide tool result cache."""
+    return get_tool_result_cache().stats()
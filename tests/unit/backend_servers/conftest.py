@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The backend servers import their helpers as top-level modules
+sys.path.insert(0, str(Path(__file__).parents[3] / "backend" / "servers"))
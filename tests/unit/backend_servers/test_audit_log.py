@@ -0,0 +1,88 @@
+import json
+import logging
+
+import pytest
+from audit_log import AuditLogger
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestAuditLogger:
+    """Tests for the sampled, queued request audit log."""
+
+    @pytest.fixture
+    def handler(self):
+        """Attach a capturing handler to the root logger the listener writes to."""
+        handler = _ListHandler()
+        root = logging.getLogger()
+        root.addHandler(handler)
+        yield handler
+        root.removeHandler(handler)
+
+    def test_record_is_a_single_json_line_with_digest(self, handler):
+        """Test records drop empty params and keep a truncated payload digest."""
+        audit = AuditLogger("test-api", sample_rate=1.0, digest_chars=10)
+        payload = {"runbooks": ["a" * 50]}
+
+        audit.record("search", {"q": "disk", "type": None}, payload, results=1)
+        audit.stop()
+
+        (message,) = handler.messages
+        assert message.startswith("audit ")
+        event = json.loads(message[len("audit ") :])
+        assert event["endpoint"] == "search"
+        assert event["params"] == {"q": "disk"}
+        assert event["results"] == 1
+        serialized = json.dumps(payload, separators=(",", ":"))
+        assert event["payload"]["bytes"] == len(serialized)
+        assert event["payload"]["preview"] == serialized[:10]
+        assert event["payload"]["truncated"] is True
+
+    def test_serialized_payload_digest_matches_object_payload(self, handler):
+        """Test a cached JSON body is digested like the payload it came from."""
+        audit = AuditLogger("test-api", sample_rate=1.0)
+        payload = {"runbooks": ["disk-full"]}
+
+        audit.record("search", {}, payload)
+        audit.record(
+            "search",
+            {},
+            json.dumps(payload, separators=(",", ":")).encode(),
+            cache="hit",
+        )
+        audit.stop()
+
+        fresh, cached = (json.loads(m[len("audit ") :]) for m in handler.messages)
+        assert cached["payload"] == fresh["payload"]
+        assert cached["cache"] == "hit"
+        assert "cache" not in fresh
+
+    def test_unsampled_requests_are_not_recorded(self, handler):
+        """Test a zero sample rate records nothing and never serializes payloads."""
+        audit = AuditLogger("test-api", sample_rate=0.0)
+
+        class _Unserializable:
+            def __str__(self):
+                raise AssertionError("payload was formatted")
+
+        audit.record("search", {}, _Unserializable())
+        audit.stop()
+
+        assert handler.messages == []
+
+    def test_debug_records_every_request_with_full_payload(self, handler):
+        """Test debug mode ignores sampling and logs the pretty-printed payload."""
+        audit = AuditLogger("test-api", sample_rate=0.0, debug=True)
+
+        audit.record("get_runbook", {"id": "rb-1"}, {"id": "rb-1"})
+        audit.stop()
+
+        assert len(handler.messages) == 2
+        assert handler.messages[1].endswith('full payload: {\n  "id": "rb-1"\n}')
@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+from dataset_cache import DatasetCache
+from fastapi import HTTPException
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+
+
+class TestDatasetCache:
+    """Tests for the file-watched dataset cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache that stats files on every access."""
+        return DatasetCache(tmp_path, poll_interval=0)
+
+    def test_loads_once_until_file_changes(self, cache, tmp_path):
+        """Test unchanged files are served from memory."""
+        _write(tmp_path / "pods.json", {"pods": [1]})
+
+        first = cache.get("pods.json")
+        second = cache.get("pods.json")
+
+        assert first is second
+        stats = cache.stats()["pods.json"]
+        assert (stats["misses"], stats["hits"], stats["reloads"]) == (1, 1, 0)
+
+    def test_reloads_on_same_size_rewrite(self, cache, tmp_path):
+        """Test an in-place rewrite of the same size is detected by mtime."""
+        path = tmp_path / "pods.json"
+        _write(path, {"pods": [1]})
+        cache.get("pods.json")
+
+        _write(path, {"pods": [2]})
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cache.get("pods.json") == {"pods": [2]}
+        assert cache.stats()["pods.json"]["reloads"] == 1
+
+    def test_reloads_on_atomic_replace(self, cache, tmp_path):
+        """Test a file replaced by rename is detected even with the same mtime."""
+        path = tmp_path / "pods.json"
+        _write(path, {"pods": [1]})
+        cache.get("pods.json")
+        mtime_ns = os.stat(path).st_mtime_ns
+
+        replacement = tmp_path / "pods.json.tmp"
+        _write(replacement, {"pods": [3]})
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        os.replace(replacement, path)
+
+        assert cache.get("pods.json") == {"pods": [3]}
+
+    def test_poll_interval_skips_stat(self, tmp_path):
+        """Test changes are not checked for within the poll interval."""
+        cache = DatasetCache(tmp_path, poll_interval=3600)
+        path = tmp_path / "pods.json"
+        _write(path, {"pods": [1]})
+        cache.get("pods.json")
+
+        _write(path, {"pods": [1, 2, 3]})
+
+        assert cache.get("pods.json") == {"pods": [1]}
+
+    def test_directory_reloads_when_a_child_changes(self, cache, tmp_path):
+        """Test a registered directory is reloaded when a file inside it changes."""
+        (tmp_path / "runbooks").mkdir()
+        cache.register(
+            "runbooks", loader=lambda path: sorted(p.name for p in path.iterdir())
+        )
+        _write(tmp_path / "runbooks" / "a.json", {})
+        assert cache.get("runbooks") == ["a.json"]
+
+        _write(tmp_path / "runbooks" / "b.json", {})
+
+        assert cache.get("runbooks") == ["a.json", "b.json"]
+
+    def test_provide_dependency(self, cache, tmp_path):
+        """Test the FastAPI dependency for present, optional and missing files."""
+        _write(tmp_path / "pods.json", {"pods": []})
+
+        assert cache.provide("pods.json")() == {"pods": []}
+        assert cache.provide("missing.json", optional=True)() is None
+        with pytest.raises(HTTPException) as exc_info:
+            cache.provide("missing.json")()
+        assert exc_info.value.status_code == 500
@@ -0,0 +1,70 @@
+import pytest
+from log_reader import LogFile
+from metrics_index import to_epoch
+
+LINES = [
+    "2024-01-15T14:00:00Z [INFO] api-gateway Request served",
+    "2024-01-15T14:10:00Z [ERROR] payment-service Database timeout",
+    "not-a-timestamp [ERROR] payment-service Continuation of the timeout",
+    "2024-01-15T14:20:00Z [WARN] payment-service Retrying database call",
+    "2024-01-15T14:30:00Z [ERROR] order-service Database connection refused",
+    "2024-01-15T14:40:00Z [INFO] api-gateway Request served",
+]
+
+
+class TestLogFileSearch:
+    """Tests for searching the memory-mapped application log."""
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        """Write the sample log and index it every line."""
+        path = tmp_path / "application.log"
+        path.write_text("\n".join(LINES) + "\n")
+        return LogFile(path, stride=1)
+
+    def test_pattern_is_case_insensitive(self, log_file):
+        """Test pattern searches match regardless of case, oldest first."""
+        results = log_file.search(pattern="DATABASE")
+
+        assert [r["service"] for r in results] == [
+            "payment-service",
+            "payment-service",
+            "order-service",
+        ]
+
+    def test_level_and_limit(self, log_file):
+        """Test the level filter and that the scan stops at the limit."""
+        results = log_file.search(pattern="database", log_level="ERROR", limit=1)
+
+        assert len(results) == 1
+        assert results[0]["message"] == "Database timeout"
+
+    def test_time_range_is_inclusive(self, log_file):
+        """Test lines on the bounds are returned and lines outside are not."""
+        results = log_file.search(
+            start=to_epoch("2024-01-15T14:10:00Z"),
+            end=to_epoch("2024-01-15T14:30:00Z"),
+        )
+
+        assert [r["timestamp"] for r in results] == [
+            "2024-01-15T14:10:00Z",
+            "2024-01-15T14:20:00Z",
+            "2024-01-15T14:30:00Z",
+        ]
+
+    def test_unparseable_timestamps_only_skipped_with_time_filter(self, log_file):
+        """Test lines without a valid timestamp are kept unless a bound is given."""
+        assert len(log_file.search(pattern="continuation")) == 1
+        assert log_file.search(pattern="continuation", start=0.0) == []
+
+    def test_index_extends_as_file_grows(self, log_file):
+        """Test lines appended after the first search are found by later ones."""
+        start = to_epoch("2024-01-15T14:45:00Z")
+        assert log_file.search(start=start) == []
+
+        with open(log_file.path, "a") as f:
+            f.write("2024-01-15T14:50:00Z [ERROR] api-gateway Upstream reset\n")
+
+        assert [r["message"] for r in log_file.search(start=start)] == [
+            "Upstream reset"
+        ]
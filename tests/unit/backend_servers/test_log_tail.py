@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+from log_reader import LogFile
+
+
+def _line(i, service="api-gateway"):
+    return f"2024-01-15T14:{i:02d}:00Z [INFO] {service} Request {i} served"
+
+
+class TestLogFileTail:
+    """Tests for reading the application log backwards from EOF."""
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        """Write 20 lines alternating between two services."""
+        path = tmp_path / "application.log"
+        services = ["api-gateway", "payment-service"]
+        path.write_text("\n".join(_line(i, services[i % 2]) for i in range(20)) + "\n")
+        return LogFile(path)
+
+    @pytest.mark.parametrize("block_size", [7, 16, 61, 4096])
+    def test_lines_split_across_blocks_are_reassembled(self, log_file, block_size):
+        """Test block sizes smaller than, near and larger than a line."""
+        results = log_file.tail(limit=20, block_size=block_size)
+
+        assert [r["message"] for r in results] == [
+            f"Request {i} served" for i in reversed(range(20))
+        ]
+
+    def test_limit_and_service_filter(self, log_file):
+        """Test the most recent matching entries are returned first."""
+        results = log_file.tail(limit=3, service="payment", block_size=16)
+
+        assert [r["message"] for r in results] == [
+            "Request 19 served",
+            "Request 17 served",
+            "Request 15 served",
+        ]
+
+    def test_missing_trailing_newline_and_empty_file(self, tmp_path):
+        """Test the last line is read without a newline and empty files are empty."""
+        path = tmp_path / "application.log"
+        path.write_text(f"{_line(0)}\n{_line(1)}")
+
+        assert [r["timestamp"] for r in LogFile(path).tail(block_size=5)] == [
+            "2024-01-15T14:01:00Z",
+            "2024-01-15T14:00:00Z",
+        ]
+        path.write_text("")
+        assert LogFile(path).tail() == []
+
+    @pytest.mark.asyncio
+    async def test_follow_yields_appended_lines(self, log_file):
+        """Test follow skips existing lines and waits for a line to be complete."""
+        entries = log_file.follow(poll_interval=0.01)
+        next_entry = asyncio.ensure_future(entries.__anext__())
+        await asyncio.sleep(0.05)
+
+        with open(log_file.path, "a") as f:
+            f.write(_line(30)[:20])
+            f.flush()
+            await asyncio.sleep(0.05)
+            assert not next_entry.done()
+            f.write(_line(30)[20:] + "\n")
+
+        entry = await asyncio.wait_for(next_entry, timeout=1)
+        assert entry["message"] == "Request 30 served"
+        await entries.aclose()
@@ -0,0 +1,85 @@
+import os
+import time
+
+import pytest
+from metrics_index import MetricsIndex, query_bound, to_epoch
+
+RECORDS = [
+    {"timestamp": "2024-01-15T10:02:00Z", "service": "api", "value": 3},
+    {"timestamp": "2024-01-15T10:00:00Z", "service": "web", "value": 1},
+    {"timestamp": "not a timestamp", "service": "api", "value": 9},
+    {"timestamp": "2024-01-15T10:01:00Z", "service": "api", "value": 2},
+    {"timestamp": "2024-01-15T10:03:00Z", "service": "web", "value": 4},
+]
+
+
+@pytest.fixture
+def non_utc_timezone():
+    """Run the test with the host clock in a non-UTC timezone."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+class TestMetricsIndex:
+    """Tests for the time-sorted metrics index."""
+
+    def test_range_bounds_are_inclusive_and_keep_file_order(self):
+        """Test both bounds are inclusive and results come back in file order."""
+        index = MetricsIndex(RECORDS)
+
+        results = index.query(
+            start=to_epoch("2024-01-15T10:01:00Z"),
+            end=to_epoch("2024-01-15T10:02:00Z"),
+        )
+
+        assert [r["value"] for r in results] == [3, 2]
+
+    def test_open_ended_ranges_and_service_filter(self):
+        """Test one-sided ranges combined with the per-service index."""
+        index = MetricsIndex(RECORDS)
+
+        after = index.query(start=to_epoch("2024-01-15T10:02:00Z"), service="web")
+        before = index.query(end=to_epoch("2024-01-15T10:00:59Z"))
+
+        assert [r["value"] for r in after] == [4]
+        assert [r["value"] for r in before] == [1]
+        assert index.query(service="db") == []
+        assert index.query() is RECORDS
+
+    def test_unparseable_timestamps_count_as_now(self):
+        """Test bad timestamps only match ranges that include the current time."""
+        index = MetricsIndex(RECORDS + [{"service": "api", "value": 5}])
+        now = time.time()
+
+        past = index.query(end=to_epoch("2024-01-15T10:03:00Z"))
+        current = index.query(start=now - 60, end=now + 60, service="api")
+        future = index.query(start=now + 3600)
+
+        assert 9 not in [r["value"] for r in past]
+        assert [r["value"] for r in current] == [9]
+        assert future == []
+
+    def test_naive_bounds_are_utc(self, non_utc_timezone):
+        """Test naive query bounds match naive records regardless of the host timezone."""
+        index = MetricsIndex(
+            [
+                {"timestamp": "2024-01-15T10:00:00", "service": "api"},
+                {"timestamp": "2024-01-15T11:00:00", "service": "api"},
+            ]
+        )
+
+        results = index.query(
+            start=query_bound("2024-01-15T10:30:00"),
+            end=query_bound("2024-01-15T11:30:00"),
+        )
+
+        assert [r["timestamp"] for r in results] == ["2024-01-15T11:00:00"]
+        assert query_bound("2024-01-15T10:30:00") == to_epoch("2024-01-15T10:30:00Z")
+        assert query_bound(None) is None
@@ -0,0 +1,82 @@
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Query
+from pagination import Page, paginate
+
+PODS = [
+    {"name": f"pod-{i}", "status": "Running", "usage": {"cpu": i, "memory": i * 10}}
+    for i in range(5)
+]
+
+
+class TestPagination:
+    """Tests for cursor pagination and field projection."""
+
+    @pytest.fixture
+    def client(self):
+        """Client of an app listing pods in pages of two by default."""
+        app = FastAPI()
+
+        @app.get("/pods")
+        async def pods(
+            namespace: str = Query("default"),
+            page: Page = Depends(paginate(default_limit=2)),
+        ):
+            items, next_cursor = page.slice(PODS)
+            return page.respond("pods", items, next_cursor, namespace=namespace)
+
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cursor_walks_every_page(self, client):
+        """Test following next_cursor returns every item exactly once."""
+        names, cursor = [], None
+        while True:
+            params = {"namespace": "prod", **({"cursor": cursor} if cursor else {})}
+            body = (await client.get("/pods", params=params)).json()
+            names += [pod["name"] for pod in body["pods"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert names == [pod["name"] for pod in PODS]
+
+    @pytest.mark.asyncio
+    async def test_cursor_rejected_when_filters_change(self, client):
+        """Test a cursor only works with the filters it was issued for."""
+        body = (await client.get("/pods?namespace=prod")).json()
+        cursor = body["next_cursor"]
+
+        same = await client.get(
+            "/pods", params={"cursor": cursor, "namespace": "prod", "limit": 3}
+        )
+        changed = await client.get(
+            "/pods", params={"cursor": cursor, "namespace": "staging"}
+        )
+
+        assert same.status_code == 200
+        assert [pod["name"] for pod in same.json()["pods"]] == [
+            "pod-2",
+            "pod-3",
+            "pod-4",
+        ]
+        assert changed.status_code == 400
+        assert changed.json()["detail"] == "Cursor does not match the query parameters"
+
+    @pytest.mark.asyncio
+    async def test_malformed_cursor_is_rejected(self, client):
+        """Test cursors that do not decode are a client error."""
+        response = await client.get("/pods", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+
+    @pytest.mark.asyncio
+    async def test_fields_projects_dotted_paths(self, client):
+        """Test only the requested, possibly nested, fields are returned."""
+        body = (await client.get("/pods?fields=name,usage.cpu,missing")).json()
+
+        assert body["pods"][0] == {"name": "pod-0", "usage": {"cpu": 0}}
+        assert body["namespace"] == "default"
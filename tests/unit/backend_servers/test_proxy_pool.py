@@ -0,0 +1,105 @@
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from backend.proxy_pool import MAX_CONNECTIONS, ProxyPool
+
+
+class _ChunkedBody(httpx.AsyncByteStream):
+    """Response body delivered in small chunks, like a real socket"""
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def __aiter__(self):
+        for i in range(0, len(self.content), 8):
+            yield self.content[i : i + 8]
+
+
+def _backend(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/down":
+        raise httpx.ConnectError("connection refused", request=request)
+    body = {"path": request.url.path, "forwarded": dict(request.headers)}
+    return httpx.Response(
+        200,
+        headers={
+            "Content-Type": "application/json",
+            "X-Backend": "logs",
+            "Connection": "close",
+        },
+        stream=_ChunkedBody(json.dumps(body).encode()),
+    )
+
+
+class TestProxyPool:
+    """Tests for the pooled clients shared by the reverse proxies."""
+
+    @pytest.fixture
+    def pool(self):
+        """Pool whose client talks to an in-memory backend."""
+        pool = ProxyPool({"/logs": "http://logs"})
+        pool.clients["/logs"] = httpx.AsyncClient(
+            base_url="http://logs", transport=httpx.MockTransport(_backend)
+        )
+        return pool
+
+    @pytest.fixture
+    def client(self, pool):
+        """Client of an app that forwards every request to the pool."""
+        app = FastAPI()
+
+        @app.get("/{path:path}")
+        async def proxy(path: str, request: Request):
+            try:
+                return await pool.forward("/logs", request, f"/{path}")
+            except httpx.RequestError:
+                return {"error": "unavailable"}
+
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://proxy"
+        )
+
+    @pytest.mark.asyncio
+    async def test_streams_response_without_hop_by_hop_headers(self, pool, client):
+        """Test bodies and end-to-end headers are relayed in both directions."""
+        response = await client.get(
+            "/search", headers={"X-API-Key": "key", "Keep-Alive": "timeout=5"}
+        )
+
+        body = response.json()
+        assert body["path"] == "/search"
+        assert body["forwarded"]["x-api-key"] == "key"
+        assert "keep-alive" not in body["forwarded"]
+        assert response.headers["x-backend"] == "logs"
+        assert "connection" not in response.headers
+
+        stats = pool.stats()["routes"]["/logs"]
+        assert stats["requests"] == 1
+        assert stats["in_flight"] == 0
+        assert stats["p50_ms"] is not None
+        assert stats["max_connections"] == MAX_CONNECTIONS
+
+    @pytest.mark.asyncio
+    async def test_counts_upstream_errors(self, pool, client):
+        """Test failed upstream requests are counted and re-raised."""
+        response = await client.get("/down")
+
+        assert response.json() == {"error": "unavailable"}
+        stats = pool.stats()["routes"]["/logs"]
+        assert (stats["requests"], stats["errors"]) == (1, 1)
+        assert stats["p50_ms"] is None
+
+    @pytest.mark.asyncio
+    async def test_lifespan_opens_and_closes_clients(self):
+        """Test clients only exist, and stats only list routes, while running."""
+        pool = ProxyPool({"/k8s": "http://k8s", "/logs": "http://logs"})
+
+        async with pool.lifespan(FastAPI()):
+            assert set(pool.stats()["routes"]) == {"/k8s", "/logs"}
+            clients = list(pool.clients.values())
+
+        assert pool.clients == {}
+        assert pool.stats() == {"routes": {}}
+        assert all(client.is_closed for client in clients)
@@ -0,0 +1,145 @@
+import json
+import os
+
+import httpx
+import pytest
+from dataset_cache import DatasetCache
+from fastapi import Depends, FastAPI, Header
+from fastapi.responses import JSONResponse
+from response_cache import ResponseCache, ResponseCacheMiddleware
+
+
+class TestResponseCacheMiddleware:
+    """Tests for ETag and conditional GET handling of cached routes."""
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        """App with one cached route backed by pods.json, counting handler calls."""
+        (tmp_path / "pods.json").write_text(json.dumps({"pods": ["api"]}))
+        datasets = DatasetCache(tmp_path, poll_interval=0)
+        cache = ResponseCache(datasets, {"/pods": ("pods.json",)})
+
+        app = FastAPI()
+        app.add_middleware(ResponseCacheMiddleware, cache=cache)
+        app.state.calls = 0
+        app.state.cache = cache
+
+        @app.get("/pods")
+        async def pods(
+            namespace: str = "default",
+            x_api_key: str = Header(None),
+            data: dict = Depends(datasets.provide("pods.json")),
+        ):
+            app.state.calls += 1
+            if x_api_key != "key":
+                return JSONResponse(status_code=401, content={"error": "no key"})
+            return {"namespace": namespace, **data}
+
+        return app
+
+    @pytest.fixture
+    def client(self, app):
+        """Client sending the valid API key by default."""
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://test",
+            headers={"X-API-Key": "key"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_is_served_from_cache(self, app, client):
+        """Test the second request skips the handler and reuses the ETag."""
+        first = await client.get("/pods", params={"namespace": "a", "x": "1"})
+        second = await client.get("/pods?x=1&namespace=a")
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == {"namespace": "a", "pods": ["api"]}
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["vary"] == "X-API-Key"
+        assert app.state.calls == 1
+        assert app.state.cache.stats()["routes"]["/pods"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_matching_if_none_match_returns_304(self, app, client):
+        """Test strong, weak and listed ETags all revalidate without a body."""
+        etag = (await client.get("/pods")).headers["etag"]
+
+        for if_none_match in (etag, f"W/{etag}", f'"other", {etag}'):
+            response = await client.get(
+                "/pods", headers={"If-None-Match": if_none_match}
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["etag"] == etag
+
+        stale = await client.get("/pods", headers={"If-None-Match": '"other"'})
+        assert stale.status_code == 200
+        assert app.state.calls == 1
+        assert app.state.cache.stats()["routes"]["/pods"]["not_modified"] == 3
+
+    @pytest.mark.asyncio
+    async def test_data_file_change_invalidates_entry(self, app, client, tmp_path):
+        """Test an edited data file produces a new body and ETag."""
+        etag = (await client.get("/pods")).headers["etag"]
+
+        path = tmp_path / "pods.json"
+        path.write_text(json.dumps({"pods": ["api", "worker"]}))
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        response = await client.get("/pods", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["pods"] == ["api", "worker"]
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_errors_and_other_api_keys_are_not_shared(self, app, client):
+        """Test non-200 responses are not cached and entries are per API key."""
+        await client.get("/pods")
+
+        for _ in range(2):
+            response = await client.get("/pods", headers={"X-API-Key": "wrong"})
+            assert response.status_code == 401
+
+        assert app.state.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_audited_under_the_route_name(self, tmp_path):
+        """Test hits and 304s, which skip the handler, reach the audit log."""
+        (tmp_path / "pods.json").write_text(json.dumps({"pods": ["api"]}))
+        datasets = DatasetCache(tmp_path, poll_interval=0)
+        records = []
+
+        class _Audit:
+            def record(self, endpoint, params, payload, results=None, cache=None):
+                records.append((endpoint, params, payload, cache))
+
+        app = FastAPI()
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            cache=ResponseCache(datasets, {"/pods/": ("pods.json",)}),
+            audit=_Audit(),
+        )
+
+        @app.get("/pods/{name}")
+        async def get_pod(
+            name: str, data: dict = Depends(datasets.provide("pods.json"))
+        ):
+            return {"name": name, **data}
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            first = await client.get("/pods/api", params={"verbose": "1"})
+            await client.get("/pods/api", params={"verbose": "1"})
+            await client.get(
+                "/pods/api",
+                params={"verbose": "1"},
+                headers={"If-None-Match": first.headers["etag"]},
+            )
+
+        params = {"name": "api", "verbose": "1"}
+        assert records == [
+            ("get_pod", params, first.content, "hit"),
+            ("get_pod", params, first.content, "not_modified"),
+        ]
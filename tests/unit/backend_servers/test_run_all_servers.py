@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import socket
+import types
+
+import httpx
+import pytest
+import run_all_servers
+from fastapi import FastAPI
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _fake_server_module(name):
+    app = FastAPI()
+
+    @app.get("/")
+    async def root():
+        return {"server": name}
+
+    return types.SimpleNamespace(app=app)
+
+
+class TestCombinedMode:
+    """Tests for serving every backend app from one process."""
+
+    @pytest.fixture
+    def servers(self, monkeypatch):
+        """Replace the backend servers with two small apps on free ports."""
+        servers = [
+            ("K8s Server", "fake_k8s_server.py", _free_port()),
+            ("Logs Server", "fake_logs_server.py", _free_port()),
+        ]
+        for _, script, _ in servers:
+            monkeypatch.setitem(
+                run_all_servers.sys.modules,
+                script[:-3],
+                _fake_server_module(script[:-3]),
+            )
+        monkeypatch.setattr(run_all_servers, "_get_servers", lambda: servers)
+        return servers
+
+    @pytest.mark.asyncio
+    async def test_serves_every_app_until_stopped(self, servers, monkeypatch):
+        """Test each app answers on its own port and SIGTERM stops them all."""
+        handlers = {}
+        loop = asyncio.get_running_loop()
+        monkeypatch.setattr(
+            loop, "add_signal_handler", lambda sig, fn: handlers.setdefault(sig, fn)
+        )
+        args = argparse.Namespace(
+            host="127.0.0.1", ssl_keyfile=None, ssl_certfile=None, startup_timeout=10
+        )
+
+        serving = asyncio.create_task(run_all_servers._serve_combined(args, 0.0))
+        for _, _, port in servers:
+            ready = await asyncio.to_thread(
+                run_all_servers._wait_until_ready, "127.0.0.1", port, 10
+            )
+            assert ready
+
+        async with httpx.AsyncClient() as client:
+            responses = [
+                await client.get(f"http://127.0.0.1:{port}/") for _, _, port in servers
+            ]
+        assert [r.json()["server"] for r in responses] == [
+            "fake_k8s_server",
+            "fake_logs_server",
+        ]
+
+        handlers[run_all_servers.signal.SIGTERM]()
+        await asyncio.wait_for(serving, timeout=10)
+
+    def test_wait_until_ready_stops_when_process_exits(self):
+        """Test readiness polling gives up as soon as the server process dies."""
+        process = types.SimpleNamespace(poll=lambda: 1)
+
+        assert not run_all_servers._wait_until_ready(
+            "127.0.0.1", _free_port(), 10, process
+        )
+
+
+class TestSubprocessMode:
+    """Tests for running one subprocess per backend server."""
+
+    def test_failed_startup_stops_servers_and_raises(self, monkeypatch, caplog):
+        """Test a server that never gets ready is reported and all are stopped."""
+        servers = [("K8s Server", "k8s.py", 1), ("Logs Server", "logs.py", 2)]
+        started = []
+
+        class _Process:
+            def __init__(self, *args, **kwargs):
+                self.terminated = False
+                started.append(self)
+
+            def terminate(self):
+                self.terminated = True
+
+            def wait(self, timeout=None):
+                return 0
+
+        monkeypatch.setattr(run_all_servers, "_get_servers", lambda: servers)
+        monkeypatch.setattr(run_all_servers.subprocess, "Popen", _Process)
+        monkeypatch.setattr(run_all_servers, "_stream_output", lambda *args: None)
+        monkeypatch.setattr(
+            run_all_servers,
+            "_wait_until_ready",
+            lambda host, port, timeout, process: port == 1,
+        )
+        args = argparse.Namespace(
+            host="127.0.0.1", ssl_keyfile=None, ssl_certfile=None, startup_timeout=1
+        )
+
+        with caplog.at_level("INFO"):
+            with pytest.raises(RuntimeError, match="Logs Server"):
+                run_all_servers._run_servers(args)
+
+        assert all(process.terminated for process in started)
+        assert "All servers running" not in caplog.text
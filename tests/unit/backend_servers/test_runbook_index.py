@@ -0,0 +1,92 @@
+from runbook_index import BM25Index, RunbookCollection, tokenize
+
+RUNBOOKS = [
+    {
+        "id": "rb-1",
+        "title": "Database connection pool exhaustion",
+        "steps": ["Check active connections", "Restart the connection pooler"],
+        "severity": "high",
+    },
+    {
+        "id": "rb-2",
+        "title": "Pod OutOfMemoryError",
+        "steps": ["Inspect memory limits", "Increase the container memory"],
+        "severity": "critical",
+    },
+    {
+        "id": "rb-3",
+        "title": "Slow API responses",
+        "steps": ["Check database query latency"],
+        "severity": "medium",
+    },
+]
+
+
+class TestTokenize:
+    """Tests for runbook tokenization."""
+
+    def test_splits_camel_case_and_drops_stopwords(self):
+        """Test CamelCase words are split and stopwords removed."""
+        assert tokenize("Pod OutOfMemoryError in the cluster") == [
+            "pod",
+            "out",
+            "memory",
+            "error",
+            "cluster",
+        ]
+
+
+class TestBM25Index:
+    """Tests for the BM25 inverted index."""
+
+    def test_prefix_expansion_of_unknown_terms(self):
+        """Test unknown terms match vocabulary terms starting with them."""
+        index = BM25Index(
+            [["connection", "pool"], ["connectivity", "loss"], ["memory"]]
+        )
+
+        assert sorted(index._expand("connect")) == ["connection", "connectivity"]
+        assert [p for p, _ in index.search("connect")] == [0, 1]
+
+    def test_known_and_short_terms_are_not_expanded(self):
+        """Test exact terms match only themselves and short terms never expand."""
+        index = BM25Index([["pod"], ["pods"], ["postgres"]])
+
+        assert index._expand("pod") == ["pod"]
+        assert index._expand("po") == []
+        assert index.search("po") == []
+
+    def test_rarer_terms_and_higher_frequency_rank_first(self):
+        """Test scores follow idf and term frequency, ties in document order."""
+        index = BM25Index([["error", "disk"], ["error", "error"], ["error", "cpu"]])
+
+        results = index.search("error")
+        assert [p for p, _ in results] == [1, 0, 2]
+        assert results[1][1] == results[2][1]
+        assert [p for p, _ in index.search("disk error")][0] == 0
+        assert index.search("error", limit=1)[0][0] == 1
+
+
+class TestRunbookCollection:
+    """Tests for ranked runbook search."""
+
+    def test_boosted_title_outranks_body_match(self):
+        """Test a title match ranks above the same term in the steps."""
+        collection = RunbookCollection(RUNBOOKS, ("title", "steps"), ("title",))
+
+        results = collection.search("database")
+
+        assert [r["id"] for r in results] == ["rb-1", "rb-3"]
+
+    def test_predicate_and_queryless_search(self):
+        """Test predicates restrict candidates and no query keeps file order."""
+        collection = RunbookCollection(RUNBOOKS, ("title", "steps"))
+
+        def critical(runbook):
+            return runbook["severity"] == "critical"
+
+        assert [r["id"] for r in collection.search("memory", predicate=critical)] == [
+            "rb-2"
+        ]
+        assert collection.search("database", predicate=critical) == []
+        assert [r["id"] for r in collection.search(limit=2)] == ["rb-1", "rb-2"]
@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+from sre_agent.memory.client import SREMemoryClient
+from sre_agent.memory.hooks import MemoryHookProvider
+
+
+class TestInvestigationStartRetrieval:
+    """Tests for concurrent memory retrieval at investigation start."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock memory client returning one record per memory type."""
+        mock = Mock(spec=SREMemoryClient)
+
+        async def aretrieve_memories(memory_type, **kwargs):
+            await asyncio.sleep(0.1)
+            return [{"content": {"text": f"{memory_type} memory"}}]
+
+        mock.aretrieve_memories.side_effect = aretrieve_memories
+        return mock
+
+    def test_retrievals_run_concurrently(self, mock_client):
+        """Test the three retrievals overlap instead of running back to back."""
+        hooks = MemoryHookProvider(mock_client)
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            context = await hooks.aon_investigation_start(
+                query="pods crashlooping",
+                user_id="user123",
+                actor_id="user123",
+                session_id="session1",
+            )
+            return context, loop.time() - started
+
+        context, elapsed = asyncio.run(run())
+
+        assert mock_client.aretrieve_memories.call_count == 3
+        assert elapsed < 0.25
+        assert context["user_preferences"] == ["preferences memory"]
+        assert len(context["past_investigations"]) == 1
+        assert "unavailable" not in context
+
+    def test_slow_retrieval_is_skipped(self, mock_client):
+        """Test a retrieval missing its deadline yields a partial context."""
+
+        async def aretrieve_memories(memory_type, **kwargs):
+            if memory_type == "investigations":
+                await asyncio.sleep(5)
+            return [{"content": {"text": f"{memory_type} memory"}}]
+
+        mock_client.aretrieve_memories.side_effect = aretrieve_memories
+        hooks = MemoryHookProvider(mock_client)
+
+        context = asyncio.run(
+            hooks.aon_investigation_start(
+                query="pods crashlooping",
+                user_id="user123",
+                actor_id="user123",
+                session_id="session1",
+                timeout_seconds=0.1,
+            )
+        )
+
+        assert context["user_preferences"] == ["preferences memory"]
+        assert context["past_investigations"] == []
+        assert context["unavailable"] == ["investigations"]
+
+    def test_failed_retrieval_is_skipped(self, mock_client):
+        """Test a failing retrieval does not discard the others."""
+
+        async def aretrieve_memories(memory_type, **kwargs):
+            if memory_type == "preferences":
+                raise RuntimeError("throttled")
+            return [{"content": {"text": f"{memory_type} memory"}}]
+
+        mock_client.aretrieve_memories.side_effect = aretrieve_memories
+        hooks = MemoryHookProvider(mock_client)
+
+        context = asyncio.run(
+            hooks.aon_investigation_start(
+                query="pods crashlooping",
+                user_id="user123",
+                actor_id="user123",
+                session_id="session1",
+            )
+        )
+
+        assert context["user_preferences"] == []
+        assert context["unavailable"] == ["preferences"]
+        assert len(context["past_investigations"]) == 1
+
+
+class TestPreferenceCapture:
+    """Tests for preference extraction from agent responses."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a mock memory client."""
+        return Mock(spec=SREMemoryClient)
+
+    @patch("sre_agent.memory.hooks._save_user_preference")
+    def test_reports_captured_count_without_retrievals(self, mock_save, mock_client):
+        """Test captures are counted from extraction, not re-read from memory."""
+        hooks = MemoryHookProvider(mock_client, verify_preferences=False)
+
+        captured = hooks._extract_user_preferences(
+            "Escalate to oncall@example.com and post to #sre-alerts",
+            "user123",
+            "kubernetes_agent",
+        )
+
+        assert captured == 2
+        assert mock_save.call_count == 2
+        mock_client.retrieve_memories.assert_not_called()
+
+    @patch("sre_agent.memory.hooks._save_user_preference")
+    def test_skips_patterns_without_candidates(self, mock_save, mock_client):
+        """Test responses without emails or channels skip extraction."""
+        hooks = MemoryHookProvider(mock_client, verify_preferences=False)
+
+        hooks.on_agent_response(
+            "Supervisor",
+            {"content": "All pods are healthy"},
+            {"user_id": "user123"},
+        )
+
+        mock_save.assert_not_called()
+        mock_client.retrieve_memories.assert_not_called()
+
+    @patch("sre_agent.memory.hooks._save_user_preference")
+    def test_verification_counts_stored_preferences(self, mock_save, mock_client):
+        """Test the opt-in verification mode re-reads stored preferences."""
+        mock_client.retrieve_memories.return_value = []
+        hooks = MemoryHookProvider(mock_client, verify_preferences=True)
+
+        hooks._verify_preference_capture(
+            "notify #sre-alerts", "user123", "kubernetes_agent"
+        )
+
+        assert mock_client.retrieve_memories.call_count == 2
+        mock_save.assert_called_once()
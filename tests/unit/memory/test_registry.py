@@ -0,0 +1,53 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.memory.client import SREMemoryClient
+from sre_agent.memory.registry import clear_memory_clients, get_memory_client
+
+
+class TestMemoryClientRegistry:
+    """Tests for the shared memory client registry."""
+
+    @pytest.fixture(autouse=True)
+    def mock_memory_client_class(self):
+        """Replace the AgentCore client and start from an empty registry."""
+        clear_memory_clients()
+        with patch("sre_agent.memory.client.MemoryClient") as mock_class:
+            yield mock_class
+        clear_memory_clients()
+
+    def test_returns_same_client_for_same_memory(self):
+        """Test the registry reuses one client per memory name and region."""
+        first = get_memory_client(memory_name="test-memory", region="us-east-1")
+        second = get_memory_client(memory_name="test-memory", region="us-east-1")
+
+        assert first is second
+
+    def test_separate_clients_per_region(self):
+        """Test different regions get different clients."""
+        east = get_memory_client(memory_name="test-memory", region="us-east-1")
+        west = get_memory_client(memory_name="test-memory", region="us-west-2")
+
+        assert east is not west
+
+    def test_client_is_created_lazily(self):
+        """Test no control-plane calls happen until the client is used."""
+        with patch.object(SREMemoryClient, "_initialize_memories") as mock_init:
+            client = get_memory_client(memory_name="test-memory")
+
+            mock_init.assert_not_called()
+            assert client.memory_id is None
+            mock_init.assert_called_once()
+
+    def test_initializes_once(self):
+        """Test repeated use runs the control-plane setup only once."""
+        with patch.object(SREMemoryClient, "_initialize_memories") as mock_init:
+            client = get_memory_client(memory_name="test-memory")
+
+            asyncio.run(client.ainitialize())
+            client.retrieve_memories("preferences", "user123", "query")
+            client.save_event("preferences", "user123", {"key": "value"})
+
+            mock_init.assert_called_once()
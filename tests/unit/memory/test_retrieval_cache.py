@@ -0,0 +1,96 @@
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.memory.client import SREMemoryClient
+from sre_agent.memory.retrieval_cache import MemoryRetrievalCache
+
+
+class TestMemoryRetrievalCache:
+    """Tests for the memory retrieval cache."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a small cache."""
+        return MemoryRetrievalCache(max_entries=2, ttl_seconds=60)
+
+    def _key(self, namespace, query="query"):
+        return MemoryRetrievalCache.make_key(
+            "infrastructure", "user123", namespace, query, 10
+        )
+
+    def test_normalizes_query(self, cache):
+        """Test queries differing only in case and whitespace share an entry."""
+        cache.put(self._key("/sre/infrastructure/user123", "Pod  Crashes"), [{"a": 1}])
+
+        assert cache.get(self._key("/sre/infrastructure/user123", " pod crashes")) == [
+            {"a": 1}
+        ]
+        assert cache.stats()["hits"] == 1
+
+    def test_expires_entries(self, cache):
+        """Test entries older than the TTL are misses."""
+        key = self._key("/sre/infrastructure/user123")
+        with patch("sre_agent.memory.retrieval_cache.time.monotonic") as mock_time:
+            mock_time.return_value = 100.0
+            cache.put(key, [])
+            mock_time.return_value = 161.0
+
+            assert cache.get(key) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test the oldest unused entry is evicted when full."""
+        first, second, third = (self._key(f"/ns/{i}") for i in range(3))
+        cache.put(first, [])
+        cache.put(second, [])
+        cache.get(first)
+        cache.put(third, [])
+
+        assert cache.get(second) is None
+        assert cache.get(first) == []
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidates_session_and_cross_session_namespaces(self, cache):
+        """Test a session write drops its namespace and the cross-session one."""
+        cross_session = self._key("/sre/infrastructure/user123")
+        other_user = self._key("/sre/infrastructure/user1234")
+        cache.put(cross_session, [])
+        cache.put(other_user, [])
+
+        dropped = cache.invalidate_namespace("/sre/infrastructure/user123/session1")
+
+        assert dropped == 1
+        assert cache.get(cross_session) is None
+        assert cache.get(other_user) == []
+
+
+class TestClientRetrievalCaching:
+    """Tests for retrieval caching in SREMemoryClient."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a memory client with a mocked AgentCore client."""
+        with patch("sre_agent.memory.client.MemoryClient") as mock_class:
+            mock_class.return_value.retrieve_memories.return_value = [{"content": {}}]
+            client = SREMemoryClient(memory_name="test-memory", lazy=True)
+            client._memory_id = "memory-123"
+            client._initialized = True
+            yield client
+
+    def test_repeated_retrieval_is_cached(self, client):
+        """Test the same retrieval hits AgentCore only once."""
+        client.retrieve_memories("preferences", "user123", "preferences")
+        client.retrieve_memories("preferences", "user123", "preferences")
+
+        assert client.client.retrieve_memories.call_count == 1
+        assert client.retrieval_cache.stats()["hits"] == 1
+
+    def test_save_event_invalidates_namespace(self, client):
+        """Test saving a preference forces the next retrieval to refetch."""
+        client.retrieve_memories("preferences", "user123", "preferences")
+        with patch.object(client, "enqueue_event"):
+            client.save_event("preferences", "user123", {"key": "value"})
+        client.retrieve_memories("preferences", "user123", "preferences")
+
+        assert client.client.retrieve_memories.call_count == 2
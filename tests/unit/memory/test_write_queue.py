@@ -0,0 +1,116 @@
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from sre_agent.memory.write_queue import MemoryWriteQueue
+
+
+class TestMemoryWriteQueue:
+    """Tests for the write-behind memory event queue."""
+
+    @pytest.fixture
+    def writer(self):
+        """Create a mock event writer."""
+        return Mock()
+
+    @pytest.fixture
+    def queue(self, writer):
+        """Create a queue that retries quickly."""
+        return MemoryWriteQueue(writer, linger_seconds=0.01, backoff_seconds=0.001)
+
+    def test_submit_returns_before_write(self, queue, writer):
+        """Test submit does not wait on the writer inside an event loop."""
+
+        async def run():
+            queue.submit("user123", "session1", [("hello", "USER")])
+            assert writer.call_count == 0
+            assert queue.pending == 1
+            assert await queue.flush(timeout=5)
+
+        asyncio.run(run())
+
+        writer.assert_called_once_with("user123", "session1", [("hello", "USER")])
+        assert queue.pending == 0
+
+    def test_coalesces_per_actor_and_session(self, queue, writer):
+        """Test queued messages of one actor and session become one event."""
+
+        async def run():
+            queue.submit("user123", "session1", [("q1", "USER")])
+            queue.submit("user456", "session1", [("q2", "USER")])
+            queue.submit("user123", "session1", [("a1", "ASSISTANT")])
+            await queue.close(timeout=5)
+
+        asyncio.run(run())
+
+        assert writer.call_count == 2
+        writer.assert_any_call(
+            "user123", "session1", [("q1", "USER"), ("a1", "ASSISTANT")]
+        )
+        writer.assert_any_call("user456", "session1", [("q2", "USER")])
+        assert queue.stats()["events_written"] == 2
+        assert queue.stats()["messages_written"] == 3
+
+    def test_splits_large_batches(self, writer):
+        """Test coalesced events respect the per-event message limit."""
+        queue = MemoryWriteQueue(writer, max_messages_per_event=2, linger_seconds=0)
+
+        async def run():
+            queue.submit("user123", "session1", [("m", "TOOL")] * 5)
+            await queue.flush(timeout=5)
+
+        asyncio.run(run())
+
+        assert [len(c.args[2]) for c in writer.call_args_list] == [2, 2, 1]
+
+    def test_retries_failed_writes(self, queue, writer):
+        """Test a failing write is retried with backoff."""
+        writer.side_effect = [Exception("throttled"), None]
+
+        async def run():
+            queue.submit("user123", "session1", [("hello", "USER")])
+            await queue.flush(timeout=5)
+
+        asyncio.run(run())
+
+        assert writer.call_count == 2
+        assert queue.stats()["retries"] == 1
+        assert queue.stats()["failed_messages"] == 0
+
+    def test_drops_after_max_attempts(self, queue, writer):
+        """Test messages are dropped once every attempt failed."""
+        writer.side_effect = Exception("unavailable")
+
+        async def run():
+            queue.submit("user123", "session1", [("hello", "USER")])
+            await queue.flush(timeout=5)
+
+        asyncio.run(run())
+
+        assert writer.call_count == queue.max_attempts
+        assert queue.stats()["failed_messages"] == 1
+
+    def test_submit_from_other_thread(self, queue, writer):
+        """Test submissions from worker threads are written on the loop."""
+
+        async def run():
+            queue.submit("user123", "session1", [("first", "USER")])
+            thread = threading.Thread(
+                target=queue.submit, args=("user123", "session1", [("tool", "TOOL")])
+            )
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.05)
+            await queue.flush(timeout=5)
+
+        asyncio.run(run())
+
+        assert queue.stats()["messages_written"] == 2
+
+    def test_writes_synchronously_without_event_loop(self, queue, writer):
+        """Test submit writes immediately when no event loop is running."""
+        queue.submit("user123", "session1", [("hello", "USER")])
+
+        writer.assert_called_once_with("user123", "session1", [("hello", "USER")])
@@ -0,0 +1,122 @@
+import asyncio
+
+import pytest
+
+from sre_agent.admission import AdmissionController, AdmissionRejectedError
+
+
+class TestAdmissionController:
+    """Tests for invocation admission control."""
+
+    def test_admits_up_to_max_in_flight(self):
+        """Test requests beyond the limit wait until a slot is released."""
+        controller = AdmissionController(max_in_flight=2, max_queue=4)
+
+        async def run():
+            first = await controller.acquire("user1")
+            await controller.acquire("user2")
+            waiting = asyncio.ensure_future(controller.acquire("user3"))
+            await asyncio.sleep(0)
+            assert not waiting.done()
+            assert controller.stats()["queue_depth"] == 1
+
+            first.release()
+            await asyncio.wait_for(waiting, timeout=1)
+
+        asyncio.run(run())
+
+        stats = controller.stats()
+        assert stats["in_flight"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["admitted"] == 3
+
+    def test_rejects_when_queue_full(self):
+        """Test overflow is rejected with a retry delay."""
+        controller = AdmissionController(max_in_flight=1, max_queue=1)
+
+        async def run():
+            await controller.acquire("user1")
+            asyncio.ensure_future(controller.acquire("user2"))
+            await asyncio.sleep(0)
+            with pytest.raises(AdmissionRejectedError) as exc_info:
+                await controller.acquire("user3")
+            assert exc_info.value.retry_after >= 1
+
+        asyncio.run(run())
+
+        assert controller.stats()["rejected_queue_full"] == 1
+
+    def test_rejects_after_queue_timeout(self):
+        """Test a request waiting past its deadline is rejected and dequeued."""
+        controller = AdmissionController(
+            max_in_flight=1, max_queue=2, queue_timeout_seconds=0.05
+        )
+
+        async def run():
+            await controller.acquire("user1")
+            with pytest.raises(AdmissionRejectedError):
+                await controller.acquire("user2")
+
+        asyncio.run(run())
+
+        assert controller.stats()["queue_depth"] == 0
+        assert controller.stats()["rejected_timeout"] == 1
+
+    def test_slot_granted_at_deadline_is_kept(self, monkeypatch):
+        """Test a slot handed over as the wait times out is used, not leaked."""
+        controller = AdmissionController(max_in_flight=1, max_queue=2)
+        real_wait_for = asyncio.wait_for
+
+        async def run():
+            first = await controller.acquire("user1")
+
+            async def wait_for_racing_release(waiter, timeout):
+                # The release lands in the same iteration the deadline expires
+                first.release()
+                assert waiter.done()
+                raise asyncio.TimeoutError
+
+            monkeypatch.setattr(asyncio, "wait_for", wait_for_racing_release)
+            try:
+                second = await controller.acquire("user2")
+            finally:
+                monkeypatch.setattr(asyncio, "wait_for", real_wait_for)
+
+            assert controller.stats()["in_flight"] == 1
+            second.release()
+            assert controller.stats()["in_flight"] == 0
+            third = await controller.acquire("user3")
+            third.release()
+
+        asyncio.run(run())
+
+        stats = controller.stats()
+        assert stats["rejected_timeout"] == 0
+        assert stats["queue_depth"] == 0
+        assert stats["admitted"] == 3
+
+    def test_serves_users_round_robin(self):
+        """Test a burst from one user does not starve another user."""
+        controller = AdmissionController(
+            max_in_flight=1, max_queue=8, max_queued_per_user=8
+        )
+        order = []
+
+        async def request(user_id):
+            ticket = await controller.acquire(user_id)
+            order.append(user_id)
+            await asyncio.sleep(0)
+            ticket.release()
+
+        async def run():
+            ticket = await controller.acquire("busy")
+            tasks = [asyncio.ensure_future(request("busy")) for _ in range(3)]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.ensure_future(request("quiet")))
+            await asyncio.sleep(0)
+            ticket.release()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(run())
+
+        assert order.index("quiet") == 1
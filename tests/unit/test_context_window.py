@@ -0,0 +1,116 @@
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from sre_agent.context_window import ContextWindowManager, summarize_token_usage
+
+
+class TestContextWindowManager:
+    """Tests for building agent inputs within a token budget."""
+
+    def _history(self):
+        return [
+            HumanMessage(content="why are pods crashing"),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "get_pods", "args": {}, "id": "call1"}],
+            ),
+            ToolMessage(content="pod " * 5000, tool_call_id="call1", name="get_pods"),
+            AIMessage(content="payment-service pods are OOMKilled"),
+        ]
+
+    def test_excludes_other_agents_tool_traces(self):
+        """Test tool calls of earlier agents are not replayed."""
+        manager = ContextWindowManager(token_budget=4000)
+
+        messages, _ = manager.build(
+            agent_name="Application Logs Agent",
+            system_message=SystemMessage(content="system"),
+            task="Check the logs",
+            history=self._history(),
+            agent_results={
+                "Kubernetes Infrastructure Agent": "payment-service pods are OOMKilled"
+            },
+        )
+
+        assert not any(isinstance(m, ToolMessage) for m in messages)
+        assert not any(isinstance(m, AIMessage) and m.tool_calls for m in messages)
+        assert "payment-service pods are OOMKilled" in messages[-1].content
+        assert messages[-1].content.endswith("Check the logs")
+
+    def test_stays_within_budget(self):
+        """Test oversized prior results are truncated to the budget."""
+        manager = ContextWindowManager(token_budget=1000, max_result_tokens=5000)
+
+        messages, token_counts = manager.build(
+            agent_name="Application Logs Agent",
+            system_message=SystemMessage(content="system"),
+            task="Check the logs",
+            history=self._history(),
+            agent_results={"Kubernetes Infrastructure Agent": "finding " * 5000},
+        )
+
+        assert token_counts["total"] <= 1100
+        assert "[truncated]" in messages[-1].content
+
+    def test_includes_own_tool_results(self):
+        """Test the agent sees results of its own earlier tool calls."""
+        manager = ContextWindowManager(token_budget=4000)
+
+        messages, token_counts = manager.build(
+            agent_name="Application Logs Agent",
+            system_message=SystemMessage(content="system"),
+            task="Check the logs",
+            history=self._history(),
+            agent_results={},
+            own_trace=[
+                ToolMessage(
+                    content="ERROR OutOfMemory",
+                    tool_call_id="call2",
+                    name="search_logs",
+                )
+            ],
+        )
+
+        assert "ERROR OutOfMemory" in messages[-1].content
+        assert token_counts["own_tool_results"] > 0
+
+    def test_history_is_limited_to_whole_turns(self):
+        """Test max_history_turns counts user questions with their answers."""
+        manager = ContextWindowManager(token_budget=4000, max_history_turns=2)
+        history = []
+        for i in range(4):
+            history += [
+                HumanMessage(content=f"question {i}"),
+                AIMessage(content=f"kubernetes answer {i}"),
+                AIMessage(content=f"logs answer {i}"),
+            ]
+
+        messages, _ = manager.build(
+            agent_name="Application Logs Agent",
+            system_message=SystemMessage(content="system"),
+            task="Check the logs",
+            history=history,
+            agent_results={},
+        )
+
+        assert [m.content for m in messages[1:-1]] == [
+            "question 2",
+            "kubernetes answer 2",
+            "logs answer 2",
+            "question 3",
+            "kubernetes answer 3",
+            "logs answer 3",
+        ]
+
+
+class TestSummarizeTokenUsage:
+    """Tests for summing provider-reported token usage."""
+
+    def test_sums_llm_calls(self):
+        """Test usage is summed over messages reporting it."""
+        usage = {"input_tokens": 100, "output_tokens": 20, "total_tokens": 120}
+
+        summary = summarize_token_usage(
+            [AIMessage(content="a", usage_metadata=usage), AIMessage(content="b")]
+        )
+
+        assert summary == {"llm_calls": 1, "input_tokens": 100, "output_tokens": 20}
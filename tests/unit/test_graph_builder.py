@@ -0,0 +1,115 @@
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+
+from sre_agent.agent_state import AgentState, append_lists, merge_dicts
+from sre_agent.graph_builder import _prepare_initial_state, _route_supervisor
+
+
+class TestStateReducers:
+    """Tests for the reducers of the merged state channels."""
+
+    def test_merge_dicts(self):
+        """Test updates are merged, empty updates kept and None clears."""
+        assert merge_dicts({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
+        assert merge_dicts({"a": 1}, {"a": 3}) == {"a": 3}
+        assert merge_dicts({"a": 1}, {}) == {"a": 1}
+        assert merge_dicts({}, {"a": 1}) == {"a": 1}
+        assert merge_dicts({"a": 1}, None) == {}
+
+    def test_append_lists(self):
+        """Test updates are appended and None clears."""
+        assert append_lists(["logs_agent"], ["metrics_agent"]) == [
+            "logs_agent",
+            "metrics_agent",
+        ]
+        assert append_lists(None, ["logs_agent"]) == ["logs_agent"]
+        assert append_lists(["logs_agent"], None) == []
+
+
+class TestRouteSupervisor:
+    """Tests for routing from the supervisor to the agent nodes."""
+
+    def test_sequential_and_finish(self):
+        """Test a single next agent maps to its node and FINISH aggregates."""
+        assert _route_supervisor({"next": "logs"}) == "logs_agent"
+        assert _route_supervisor({"next": "unknown"}) == "aggregate"
+        assert _route_supervisor({"next": "FINISH"}) == "aggregate"
+        assert (
+            _route_supervisor({"next": "FINISH", "next_agents": ["logs"]})
+            == "aggregate"
+        )
+
+    def test_parallel_fan_out(self):
+        """Test next_agents fans out to every known node once, in order."""
+        state = {
+            "next": "metrics_agent",
+            "next_agents": ["metrics_agent", "logs", "logs_agent", "unknown"],
+        }
+
+        assert _route_supervisor(state) == ["metrics_agent", "logs_agent"]
+        assert _route_supervisor({**state, "next_agents": ["unknown"]}) == "aggregate"
+
+
+def _agent(name):
+    async def node(state):
+        return {
+            "agent_results": {name: f"{name} on {state['current_query']}"},
+            "agents_invoked": [name],
+            "metadata": {f"{name}_done": True},
+            "traces": {name: []},
+        }
+
+    return node
+
+
+class TestParallelTurns:
+    """Tests for fanned-out agents writing the merged channels over turns."""
+
+    @pytest.fixture
+    def graph(self):
+        """Graph preparing each turn and running two agents in parallel."""
+        workflow = StateGraph(AgentState)
+        workflow.add_node("prepare", _prepare_initial_state)
+        workflow.add_node("logs_agent", _agent("logs_agent"))
+        workflow.add_node("metrics_agent", _agent("metrics_agent"))
+        workflow.set_entry_point("prepare")
+        workflow.add_conditional_edges(
+            "prepare",
+            # Queries about errors need both agents, others only the logs
+            lambda state: _route_supervisor(
+                {
+                    "next": "logs",
+                    "next_agents": (
+                        ["logs", "metrics"]
+                        if "errors" in state["current_query"]
+                        else []
+                    ),
+                }
+            ),
+        )
+        workflow.add_edge("logs_agent", END)
+        workflow.add_edge("metrics_agent", END)
+        return workflow.compile(checkpointer=MemorySaver())
+
+    @pytest.mark.asyncio
+    async def test_parallel_results_merge_and_reset_between_turns(self, graph):
+        """Test both agents' writes are kept and a new turn starts empty."""
+        config = {"configurable": {"thread_id": "session-1"}}
+
+        first = await graph.ainvoke(
+            {"messages": [HumanMessage(content="errors in checkout")]}, config
+        )
+        assert set(first["agent_results"]) == {"logs_agent", "metrics_agent"}
+        assert sorted(first["agents_invoked"]) == ["logs_agent", "metrics_agent"]
+        assert set(first["traces"]) == {"logs_agent", "metrics_agent"}
+
+        second = await graph.ainvoke(
+            {"messages": [HumanMessage(content="slow payments")]}, config
+        )
+        assert second["agent_results"] == {"logs_agent": "logs_agent on slow payments"}
+        assert second["agents_invoked"] == ["logs_agent"]
+        assert second["metadata"] == {"logs_agent_done": True}
+        assert set(second["traces"]) == {"logs_agent"}
+        assert len(second["messages"]) == 2
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import pytest
+
+from sre_agent.llm_utils import clear_llm_clients, get_llm, llm_client_stats
+
+
+class TestLLMClientRegistry:
+    """Tests for the shared LLM client registry."""
+
+    @pytest.fixture(autouse=True)
+    def mock_clients(self):
+        """Replace the LLM and boto3 clients and start from an empty registry."""
+        clear_llm_clients()
+        with (
+            patch("sre_agent.llm_utils.ChatBedrock") as mock_bedrock,
+            patch("sre_agent.llm_utils.boto3.client") as mock_boto3,
+        ):
+            mock_bedrock.side_effect = lambda **kwargs: object()
+            mock_boto3.side_effect = lambda *args, **kwargs: object()
+            yield mock_bedrock, mock_boto3
+        clear_llm_clients()
+
+    def test_reuses_llm_for_same_configuration(self, mock_clients):
+        """Test identical configurations share one LLM instance."""
+        mock_bedrock, _ = mock_clients
+
+        first = get_llm("bedrock", region_name="us-east-1")
+        second = get_llm("bedrock", region_name="us-east-1")
+
+        assert first is second
+        assert mock_bedrock.call_count == 1
+        stats = llm_client_stats()
+        assert (stats["created"], stats["reused"]) == (1, 1)
+
+    def test_separate_llm_per_max_tokens(self, mock_clients):
+        """Test a different max_tokens gets its own LLM but shares AWS clients."""
+        mock_bedrock, mock_boto3 = mock_clients
+
+        agent_llm = get_llm("bedrock", region_name="us-east-1")
+        formatter_llm = get_llm("bedrock", region_name="us-east-1", max_tokens=1000)
+
+        assert agent_llm is not formatter_llm
+        # One bedrock-runtime and one bedrock control-plane client for the region
+        assert mock_boto3.call_count == 2
+        first_call, second_call = mock_bedrock.call_args_list
+        assert first_call.kwargs["client"] is second_call.kwargs["client"]
+
+    def test_rejects_unknown_provider(self):
+        """Test unsupported providers raise ValueError."""
+        with pytest.raises(ValueError):
+            get_llm("openai")
@@ -0,0 +1,81 @@
+import asyncio
+from typing import TypedDict
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, StateGraph
+
+from sre_agent.output_formatter import SREOutputFormatter
+
+
+class _ReportState(TypedDict):
+    report: str
+
+
+class TestAsyncInvestigationResponse:
+    """Tests for async executive summary generation."""
+
+    @pytest.fixture
+    def formatter(self):
+        """Create a formatter."""
+        return SREOutputFormatter(llm_provider="bedrock")
+
+    def test_summary_tokens_stream_from_graph_node(self, formatter):
+        """Test summary tokens reach stream_mode="messages" and the report."""
+        llm = GenericFakeChatModel(
+            messages=iter([AIMessage(content="Payment pods are OOMKilled")])
+        )
+
+        async def aggregate(state):
+            report = await formatter.aformat_investigation_response(
+                query="why is payment failing",
+                agent_results={"kubernetes_agent": "pods restarting"},
+                metadata={},
+            )
+            return {"report": report}
+
+        workflow = StateGraph(_ReportState)
+        workflow.add_node("aggregate", aggregate)
+        workflow.add_edge(START, "aggregate")
+        workflow.add_edge("aggregate", END)
+        graph = workflow.compile()
+
+        async def run():
+            tokens, report = [], None
+            async for mode, chunk in graph.astream(
+                {"report": ""}, stream_mode=["messages", "values"]
+            ):
+                if mode == "messages":
+                    tokens.append(chunk[0].content)
+                else:
+                    report = chunk["report"]
+            return tokens, report
+
+        with patch.object(formatter, "_create_llm", return_value=llm):
+            tokens, report = asyncio.run(run())
+
+        assert len(tokens) > 1
+        assert "".join(tokens) == "Payment pods are OOMKilled"
+        assert "Payment pods are OOMKilled" in report
+
+    def test_falls_back_on_timeout(self, formatter):
+        """Test a slow summary is replaced by the fallback summary."""
+
+        class SlowLLM:
+            async def ainvoke(self, messages):
+                await asyncio.sleep(5)
+
+        with patch.object(formatter, "_create_llm", return_value=SlowLLM()):
+            report = asyncio.run(
+                formatter.aformat_investigation_response(
+                    query="why is payment failing",
+                    agent_results={"kubernetes_agent": "pods restarting"},
+                    metadata={},
+                    timeout_seconds=0.05,
+                )
+            )
+
+        assert "Investigation findings require analysis" in report
+        assert "pods restarting" in report
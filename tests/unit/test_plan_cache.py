@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from sre_agent.plan_cache import PlanCache
+from sre_agent.supervisor import InvestigationPlan
+
+
+def _plan(reasoning: str = "Check pods then logs") -> InvestigationPlan:
+    return InvestigationPlan(
+        steps=["Check pod status", "Review error logs"],
+        agents_sequence=["kubernetes_agent", "logs_agent"],
+        complexity="simple",
+        auto_execute=True,
+        reasoning=reasoning,
+    )
+
+
+class TestPlanCache:
+    """Tests for the investigation plan cache."""
+
+    def test_exact_hit_ignores_case_and_punctuation(self):
+        """Test queries differing only in case and punctuation share a plan."""
+        cache = PlanCache()
+        query = "Pods crashlooping in production!"
+        cache.put(cache.make_key(query, []), query, _plan(), planning_seconds=4.0)
+
+        other = "pods  crashlooping in production"
+        plan, match = cache.get(cache.make_key(other, []), other)
+
+        assert match == "exact"
+        assert plan.agents_sequence == ["kubernetes_agent", "logs_agent"]
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["planning_seconds_saved"] == 4.0
+
+    def test_preferences_are_part_of_the_key(self):
+        """Test users with different preferences do not share plans."""
+        cache = PlanCache()
+        query = "API response times degraded"
+        prefs = [{"content": "escalate to #sre-oncall"}]
+        cache.put(cache.make_key(query, prefs), query, _plan(), planning_seconds=1.0)
+
+        assert cache.get(cache.make_key(query, []), query) is None
+        assert cache.get(cache.make_key(query, prefs), query) is not None
+
+    def test_returns_copies(self):
+        """Test callers cannot modify the cached plan."""
+        cache = PlanCache()
+        key = cache.make_key("disk full", [])
+        cache.put(key, "disk full", _plan(), planning_seconds=1.0)
+
+        plan, _ = cache.get(key, "disk full")
+        plan.steps.append("Something else")
+
+        assert len(cache.get(key, "disk full")[0].steps) == 2
+
+    def test_near_duplicate_hit(self):
+        """Test near-duplicate matching only when enabled and similar enough."""
+        query = "API response times degraded in production"
+        similar = "API response time degraded in production"
+        different = "database connections exhausted"
+
+        exact_only = PlanCache()
+        exact_only.put(exact_only.make_key(query, []), query, _plan(), 2.0)
+        assert exact_only.get(exact_only.make_key(similar, []), similar) is None
+
+        cache = PlanCache(near_duplicates=True, similarity_threshold=0.8)
+        cache.put(cache.make_key(query, []), query, _plan(), 2.0)
+
+        _, match = cache.get(cache.make_key(similar, []), similar)
+        assert match == "near_duplicate"
+        assert cache.get(cache.make_key(different, []), different) is None
+        assert cache.stats()["near_duplicate_hits"] == 1
+
+    def test_entries_expire(self):
+        """Test plans older than the TTL are not reused."""
+        cache = PlanCache(ttl_seconds=60)
+        key = cache.make_key("disk full", [])
+        with patch("sre_agent.plan_cache.time.monotonic", return_value=100.0):
+            cache.put(key, "disk full", _plan(), planning_seconds=1.0)
+        with patch("sre_agent.plan_cache.time.monotonic", return_value=161.0):
+            assert cache.get(key, "disk full") is None
+        assert cache.stats()["size"] == 0
@@ -0,0 +1,144 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from sre_agent.plan_cache import PlanCache
+from sre_agent.supervisor import InvestigationPlan, SupervisorAgent
+
+PLAN = InvestigationPlan(
+    steps=["Check pod status", "Review error logs"],
+    agents_sequence=["kubernetes_agent", "logs_agent"],
+    complexity="simple",
+    auto_execute=True,
+    reasoning="Pods first, then logs",
+)
+
+STATE = {
+    "current_query": "pods crashlooping in production",
+    "user_id": "alice",
+    "session_id": "session-123",
+}
+
+
+class TestSupervisorPlanning:
+    """Tests for the supervisor's planning modes."""
+
+    @pytest.fixture
+    def mocks(self):
+        """Patch the LLM and memory system of the supervisor."""
+        llm = MagicMock()
+        structured = llm.with_structured_output.return_value
+        structured.ainvoke = AsyncMock(return_value=PLAN)
+        with (
+            patch("sre_agent.supervisor.get_llm", return_value=llm),
+            patch("sre_agent.supervisor._load_memory_config") as memory_config,
+            patch("sre_agent.supervisor.create_formatter"),
+            patch("sre_agent.supervisor.get_memory_client"),
+            patch("sre_agent.supervisor.MemoryHookProvider") as hooks,
+            patch("sre_agent.supervisor.create_conversation_memory_manager"),
+            patch(
+                "sre_agent.supervisor.create_memory_tools", return_value=[MagicMock()]
+            ),
+            patch("sre_agent.memory.tools.update_memory_tools_user_id"),
+            patch("sre_agent.supervisor.create_react_agent") as create_react_agent,
+        ):
+            memory_config.return_value.enabled = True
+            hooks.return_value.aon_investigation_start = AsyncMock(
+                return_value={"user_preferences": [{"content": "use #sre-alerts"}]}
+            )
+            yield structured, create_react_agent
+
+    @pytest.mark.asyncio
+    async def test_structured_mode_plans_in_one_call(self, mocks):
+        """Test structured mode skips the planning agent and its memory tool prompt."""
+        structured, create_react_agent = mocks
+        supervisor = SupervisorAgent(planning_mode="structured", plan_cache=PlanCache())
+
+        plan = await supervisor.create_investigation_plan(dict(STATE))
+
+        assert plan == PLAN
+        create_react_agent.assert_not_called()
+        structured.ainvoke.assert_awaited_once()
+        prompt = structured.ainvoke.await_args.args[0][0].content
+        assert "use #sre-alerts" in prompt
+        assert "<memory_retrieval_tool>" not in prompt
+        assert "<memory_retrieval>" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_react_mode_uses_planning_agent(self, mocks):
+        """Test react mode parses the planning agent's JSON answer."""
+        structured, create_react_agent = mocks
+        create_react_agent.return_value.ainvoke = AsyncMock(
+            return_value={
+                "messages": [AIMessage(content=json.dumps(PLAN.model_dump()))]
+            }
+        )
+        supervisor = SupervisorAgent(planning_mode="react", plan_cache=PlanCache())
+
+        plan = await supervisor.create_investigation_plan(dict(STATE))
+
+        assert plan == PLAN
+        create_react_agent.return_value.ainvoke.assert_awaited_once()
+        structured.ainvoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fallback_plan_is_not_cached(self, mocks):
+        """Test a failed structured call falls back without poisoning the cache."""
+        structured, _ = mocks
+        structured.ainvoke.side_effect = [RuntimeError("throttled"), PLAN]
+        supervisor = SupervisorAgent(planning_mode="structured", plan_cache=PlanCache())
+
+        first = await supervisor.create_investigation_plan(dict(STATE))
+        second = await supervisor.create_investigation_plan(dict(STATE))
+
+        assert first.agents_sequence == ["metrics_agent", "logs_agent"]
+        assert second == PLAN
+        assert supervisor.plan_cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_plan_skips_llm(self, mocks):
+        """Test a repeated query is answered from the plan cache."""
+        structured, _ = mocks
+        supervisor = SupervisorAgent(planning_mode="structured", plan_cache=PlanCache())
+
+        await supervisor.create_investigation_plan(dict(STATE))
+        plan = await supervisor.create_investigation_plan(
+            {**STATE, "current_query": "Pods crashlooping in production."}
+        )
+
+        assert plan == PLAN
+        structured.ainvoke.assert_awaited_once()
+        assert supervisor.plan_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_react_fallback_is_not_cached(self, mocks):
+        """Test an unparseable planning agent answer is not reused."""
+        _, create_react_agent = mocks
+        create_react_agent.return_value.ainvoke = AsyncMock(
+            return_value={"messages": [AIMessage(content="I could not decide")]}
+        )
+        supervisor = SupervisorAgent(planning_mode="react", plan_cache=PlanCache())
+
+        plan = await supervisor.create_investigation_plan(dict(STATE))
+        await supervisor.create_investigation_plan(dict(STATE))
+
+        assert plan.agents_sequence == ["metrics_agent", "logs_agent"]
+        assert create_react_agent.return_value.ainvoke.await_count == 2
+        assert supervisor.plan_cache.stats()["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_plan_resembling_fallback_is_cached(self, mocks):
+        """Test caching depends on how the plan was made, not its reasoning text."""
+        structured, _ = mocks
+        structured.ainvoke.return_value = PLAN.model_copy(
+            update={"reasoning": "Default investigation plan due to vague query"}
+        )
+        supervisor = SupervisorAgent(planning_mode="structured", plan_cache=PlanCache())
+
+        await supervisor.create_investigation_plan(dict(STATE))
+        await supervisor.create_investigation_plan(dict(STATE))
+
+        structured.ainvoke.assert_awaited_once()
+        assert supervisor.plan_cache.stats()["hits"] == 1
@@ -0,0 +1,137 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from sre_agent.agent_state import merge_dicts
+from sre_agent.supervisor import InvestigationPlan, SupervisorAgent
+
+
+def _plan(agents_sequence, dependencies=None):
+    return InvestigationPlan(
+        steps=[f"Run {agent}" for agent in agents_sequence],
+        agents_sequence=agents_sequence,
+        complexity="simple",
+        auto_execute=True,
+        reasoning="Test plan",
+        dependencies=dependencies or {},
+    )
+
+
+def _state(dispatched=None, plan=None):
+    metadata = {}
+    if dispatched is not None:
+        metadata["dispatched_agents"] = dispatched
+    if plan is not None:
+        metadata["investigation_plan"] = plan.model_dump()
+    return {"metadata": metadata, "memory_context": {}, "agents_invoked": []}
+
+
+class TestParallelRouting:
+    """Tests for dispatching plan steps by their dependencies."""
+
+    @pytest.fixture
+    def supervisor(self):
+        """Create a parallel supervisor without an LLM or memory."""
+        with (
+            patch("sre_agent.supervisor.get_llm", return_value=MagicMock()),
+            patch("sre_agent.supervisor._load_memory_config") as memory_config,
+            patch("sre_agent.supervisor.create_formatter"),
+        ):
+            memory_config.return_value.enabled = False
+            yield SupervisorAgent(parallel_execution=True)
+
+    def test_independent_agents_are_ready_together(self, supervisor):
+        """Test agents without dependencies all start at once, deduplicated."""
+        plan = _plan(["logs_agent", "metrics", "metrics_agent", "kubernetes_agent"])
+
+        assert supervisor._ready_agents(plan, []) == [
+            "logs_agent",
+            "metrics_agent",
+            "kubernetes_agent",
+        ]
+
+    def test_dependents_wait_for_their_dependencies(self, supervisor):
+        """Test an agent is only ready once everything it needs was dispatched."""
+        plan = _plan(
+            ["logs_agent", "metrics_agent", "runbooks_agent"],
+            {"runbooks": ["logs", "metrics_agent"]},
+        )
+
+        assert supervisor._ready_agents(plan, []) == ["logs_agent", "metrics_agent"]
+        assert supervisor._ready_agents(plan, ["logs_agent"]) == ["metrics_agent"]
+        assert supervisor._ready_agents(plan, ["logs_agent", "metrics_agent"]) == [
+            "runbooks_agent"
+        ]
+        assert (
+            supervisor._ready_agents(
+                plan, ["logs_agent", "metrics_agent", "runbooks_agent"]
+            )
+            == []
+        )
+
+    def test_dependencies_outside_the_plan_are_ignored(self, supervisor):
+        """Test a dependency on an agent the plan never runs does not block."""
+        plan = _plan(["runbooks_agent"], {"runbooks_agent": ["kubernetes_agent"]})
+
+        assert supervisor._ready_agents(plan, []) == ["runbooks_agent"]
+
+    def test_cyclic_dependencies_run_remaining_agents_together(self, supervisor):
+        """Test a dependency cycle falls back to running the blocked agents."""
+        plan = _plan(
+            ["kubernetes_agent", "logs_agent", "metrics_agent"],
+            {"logs_agent": ["metrics_agent"], "metrics_agent": ["logs_agent"]},
+        )
+
+        assert supervisor._ready_agents(plan, []) == ["kubernetes_agent"]
+        assert supervisor._ready_agents(plan, ["kubernetes_agent"]) == [
+            "logs_agent",
+            "metrics_agent",
+        ]
+
+    def test_route_parallel_dispatches_and_finishes(self, supervisor):
+        """Test each call dispatches the ready batch and records it."""
+        plan = _plan(["logs_agent", "runbooks_agent"], {"runbooks_agent": ["logs"]})
+
+        first = supervisor._route_parallel(plan, _state(), {"show_plan": True})
+        assert first["next_agents"] == ["logs_agent"]
+        assert first["next"] == "logs_agent"
+        assert first["metadata"]["dispatched_agents"] == ["logs_agent"]
+        assert first["metadata"]["show_plan"] is True
+
+        second = supervisor._route_parallel(plan, _state(["logs_agent"]))
+        assert second["next_agents"] == ["runbooks_agent"]
+        assert second["metadata"]["dispatched_agents"] == [
+            "logs_agent",
+            "runbooks_agent",
+        ]
+        assert second["metadata"]["plan_step"] == 1
+
+        done = supervisor._route_parallel(
+            plan, _state(["logs_agent", "runbooks_agent"])
+        )
+        assert done["next"] == "FINISH"
+        assert done["next_agents"] == []
+        assert "dispatched_agents" not in done["metadata"]
+
+    @pytest.mark.asyncio
+    async def test_route_follows_plan_through_merged_metadata(self, supervisor):
+        """Test route keeps dispatching from state built by the metadata reducer."""
+        plan = _plan(
+            ["kubernetes_agent", "logs_agent", "runbooks_agent"],
+            {"runbooks_agent": ["kubernetes_agent", "logs_agent"]},
+        )
+        state = _state(plan=plan)
+        batches = []
+
+        for _ in range(3):
+            update = await supervisor.route(state)
+            if update["next"] == "FINISH":
+                break
+            batches.append(update["next_agents"])
+            state = {
+                **state,
+                "metadata": merge_dicts(state["metadata"], update["metadata"]),
+            }
+
+        assert batches == [["kubernetes_agent", "logs_agent"], ["runbooks_agent"]]
+        assert update["next"] == "FINISH"
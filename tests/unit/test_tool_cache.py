@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from sre_agent.tool_cache import (
+    ToolResultCache,
+    cache_tool_results,
+    investigation_stats,
+    start_investigation_tracking,
+)
+
+
+def _counting_fetch(calls, result="ok", delay=0.0):
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return result
+
+    return fetch
+
+
+class TestToolResultCache:
+    """Tests for the MCP tool result cache."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_result_regardless_of_argument_order(self):
+        """Test identical calls with reordered or null arguments hit the cache."""
+        cache = ToolResultCache()
+        calls = []
+
+        await cache.call(
+            "get_pod_status",
+            {"namespace": "prod", "pod": "api"},
+            _counting_fetch(calls),
+        )
+        result = await cache.call(
+            "get_pod_status",
+            {"pod": "api", "namespace": "prod", "label": None},
+            _counting_fetch(calls),
+        )
+
+        assert result == "ok"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_identical_calls(self):
+        """Test concurrent identical calls share a single request."""
+        cache = ToolResultCache()
+        calls = []
+
+        results = await asyncio.gather(
+            *(
+                cache.call("get_error_rates", {}, _counting_fetch(calls, delay=0.01))
+                for _ in range(3)
+            )
+        )
+
+        assert results == ["ok", "ok", "ok"]
+        assert len(calls) == 1
+        assert cache.stats()["coalesced"] == 2
+
+    @pytest.mark.asyncio
+    async def test_per_tool_ttl_and_errors(self):
+        """Test tools with a zero TTL and failed calls are not cached."""
+        cache = ToolResultCache(tool_ttl_seconds={"get_recent_logs": 0})
+        calls = []
+
+        for _ in range(2):
+            await cache.call("logs___get_recent_logs", {}, _counting_fetch(calls))
+        assert len(calls) == 2
+
+        async def failing():
+            raise RuntimeError("gateway unavailable")
+
+        with pytest.raises(RuntimeError):
+            await cache.call("search_logs", {"q": "x"}, failing)
+        assert await cache.call("search_logs", {"q": "x"}, _counting_fetch(calls))
+        assert cache.stats()["errors"] == 1
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_wrapped_tool_and_investigation_stats(self):
+        """Test wrapped tools go through the cache and count per investigation."""
+        calls = []
+
+        async def get_pod_status(namespace: str) -> str:
+            calls.append(namespace)
+            return f"pods in {namespace}"
+
+        tool = StructuredTool.from_function(
+            coroutine=get_pod_status, name="get_pod_status", description="Pods"
+        )
+        (cached,) = cache_tool_results([tool], ToolResultCache())
+        counters = start_investigation_tracking()
+
+        first = await cached.ainvoke({"namespace": "prod"})
+        second = await cached.ainvoke({"namespace": "prod"})
+
+        assert first == second == "pods in prod"
+        assert calls == ["prod"]
+        assert cached.name == tool.name
+        stats = investigation_stats(counters)
+        assert stats["calls"] == 2
+        assert stats["hit_rate"] == 0.5